@@ -9,18 +9,50 @@ d = { 'settings': { 'branch': 'main',
                                                                                                      'hierarchicalforecast/core.py'),
                                            'hierarchicalforecast.core.HierarchicalReconciliation.__init__': ( 'src/core.html#hierarchicalreconciliation.__init__',
                                                                                                               'hierarchicalforecast/core.py'),
+                                           'hierarchicalforecast.core.HierarchicalReconciliation._check_fitted': ( 'src/core.html#hierarchicalreconciliation._check_fitted',
+                                                                                                                   'hierarchicalforecast/core.py'),
                                            'hierarchicalforecast.core.HierarchicalReconciliation._prepare_Y': ( 'src/core.html#hierarchicalreconciliation._prepare_y',
                                                                                                                 'hierarchicalforecast/core.py'),
                                            'hierarchicalforecast.core.HierarchicalReconciliation._prepare_fit': ( 'src/core.html#hierarchicalreconciliation._prepare_fit',
                                                                                                                   'hierarchicalforecast/core.py'),
+                                           'hierarchicalforecast.core.HierarchicalReconciliation._prepare_fitted_Y': ( 'src/core.html#hierarchicalreconciliation._prepare_fitted_y',
+                                                                                                                       'hierarchicalforecast/core.py'),
+                                           'hierarchicalforecast.core.HierarchicalReconciliation._prepare_structure': ( 'src/core.html#hierarchicalreconciliation._prepare_structure',
+                                                                                                                        'hierarchicalforecast/core.py'),
+                                           'hierarchicalforecast.core.HierarchicalReconciliation._reconcile_models': ( 'src/core.html#hierarchicalreconciliation._reconcile_models',
+                                                                                                                       'hierarchicalforecast/core.py'),
+                                           'hierarchicalforecast.core.HierarchicalReconciliation._samples_to_long': ( 'src/core.html#hierarchicalreconciliation._samples_to_long',
+                                                                                                                      'hierarchicalforecast/core.py'),
                                            'hierarchicalforecast.core.HierarchicalReconciliation.bootstrap_reconcile': ( 'src/core.html#hierarchicalreconciliation.bootstrap_reconcile',
                                                                                                                          'hierarchicalforecast/core.py'),
+                                           'hierarchicalforecast.core.HierarchicalReconciliation.cache_clear': ( 'src/core.html#hierarchicalreconciliation.cache_clear',
+                                                                                                                 'hierarchicalforecast/core.py'),
+                                           'hierarchicalforecast.core.HierarchicalReconciliation.cache_info': ( 'src/core.html#hierarchicalreconciliation.cache_info',
+                                                                                                                'hierarchicalforecast/core.py'),
+                                           'hierarchicalforecast.core.HierarchicalReconciliation.fit': ( 'src/core.html#hierarchicalreconciliation.fit',
+                                                                                                         'hierarchicalforecast/core.py'),
+                                           'hierarchicalforecast.core.HierarchicalReconciliation.predict': ( 'src/core.html#hierarchicalreconciliation.predict',
+                                                                                                             'hierarchicalforecast/core.py'),
                                            'hierarchicalforecast.core.HierarchicalReconciliation.reconcile': ( 'src/core.html#hierarchicalreconciliation.reconcile',
                                                                                                                'hierarchicalforecast/core.py'),
+                                           'hierarchicalforecast.core.HierarchicalReconciliation.update': ( 'src/core.html#hierarchicalreconciliation.update',
+                                                                                                            'hierarchicalforecast/core.py'),
                                            'hierarchicalforecast.core._build_fn_name': ( 'src/core.html#_build_fn_name',
                                                                                          'hierarchicalforecast/core.py'),
+                                           'hierarchicalforecast.core._is_bottom_identity': ( 'src/core.html#_is_bottom_identity',
+                                                                                              'hierarchicalforecast/core.py'),
+                                           'hierarchicalforecast.core._is_csr_bottom_identity': ( 'src/core.html#_is_csr_bottom_identity',
+                                                                                                  'hierarchicalforecast/core.py'),
+                                           'hierarchicalforecast.core._is_sorted_like': ( 'src/core.html#_is_sorted_like',
+                                                                                          'hierarchicalforecast/core.py'),
+                                           'hierarchicalforecast.core._missing_ids': ( 'src/core.html#_missing_ids',
+                                                                                       'hierarchicalforecast/core.py'),
                                            'hierarchicalforecast.core._reverse_engineer_sigmah': ( 'src/core.html#_reverse_engineer_sigmah',
-                                                                                                   'hierarchicalforecast/core.py')},
+                                                                                                   'hierarchicalforecast/core.py'),
+                                           'hierarchicalforecast.core._sort_like_S': ( 'src/core.html#_sort_like_s',
+                                                                                       'hierarchicalforecast/core.py'),
+                                           'hierarchicalforecast.core._structure_ids_frame': ( 'src/core.html#_structure_ids_frame',
+                                                                                               'hierarchicalforecast/core.py')},
             'hierarchicalforecast.evaluation': { 'hierarchicalforecast.evaluation.HierarchicalEvaluation': ( 'src/evaluation.html#hierarchicalevaluation',
                                                                                                              'hierarchicalforecast/evaluation.py'),
                                                  'hierarchicalforecast.evaluation.HierarchicalEvaluation.__init__': ( 'src/evaluation.html#hierarchicalevaluation.__init__',
@@ -51,6 +83,10 @@ d = { 'settings': { 'branch': 'main',
                                                                                          'hierarchicalforecast/methods.py'),
                                               'hierarchicalforecast.methods.BottomUp._get_PW_matrices': ( 'src/methods.html#bottomup._get_pw_matrices',
                                                                                                           'hierarchicalforecast/methods.py'),
+                                              'hierarchicalforecast.methods.BottomUp._is_batchable': ( 'src/methods.html#bottomup._is_batchable',
+                                                                                                       'hierarchicalforecast/methods.py'),
+                                              'hierarchicalforecast.methods.BottomUp._structural_key': ( 'src/methods.html#bottomup._structural_key',
+                                                                                                         'hierarchicalforecast/methods.py'),
                                               'hierarchicalforecast.methods.BottomUp.fit': ( 'src/methods.html#bottomup.fit',
                                                                                              'hierarchicalforecast/methods.py'),
                                               'hierarchicalforecast.methods.BottomUp.fit_predict': ( 'src/methods.html#bottomup.fit_predict',
@@ -71,10 +107,18 @@ d = { 'settings': { 'branch': 'main',
                                                                                                 'hierarchicalforecast/methods.py'),
                                               'hierarchicalforecast.methods.HReconciler': ( 'src/methods.html#hreconciler',
                                                                                             'hierarchicalforecast/methods.py'),
+                                              'hierarchicalforecast.methods.HReconciler.__init_subclass__': ( 'src/methods.html#hreconciler.__init_subclass__',
+                                                                                                              'hierarchicalforecast/methods.py'),
+                                              'hierarchicalforecast.methods.HReconciler._get_cached_PW_matrices': ( 'src/methods.html#hreconciler._get_cached_pw_matrices',
+                                                                                                                    'hierarchicalforecast/methods.py'),
                                               'hierarchicalforecast.methods.HReconciler._get_sampler': ( 'src/methods.html#hreconciler._get_sampler',
                                                                                                          'hierarchicalforecast/methods.py'),
+                                              'hierarchicalforecast.methods.HReconciler._is_batchable': ( 'src/methods.html#hreconciler._is_batchable',
+                                                                                                          'hierarchicalforecast/methods.py'),
                                               'hierarchicalforecast.methods.HReconciler._reconcile': ( 'src/methods.html#hreconciler._reconcile',
                                                                                                        'hierarchicalforecast/methods.py'),
+                                              'hierarchicalforecast.methods.HReconciler._structural_key': ( 'src/methods.html#hreconciler._structural_key',
+                                                                                                            'hierarchicalforecast/methods.py'),
                                               'hierarchicalforecast.methods.HReconciler.fit': ( 'src/methods.html#hreconciler.fit',
                                                                                                 'hierarchicalforecast/methods.py'),
                                               'hierarchicalforecast.methods.HReconciler.fit_predict': ( 'src/methods.html#hreconciler.fit_predict',
@@ -105,6 +149,16 @@ d = { 'settings': { 'branch': 'main',
                                                                                                   'hierarchicalforecast/methods.py'),
                                               'hierarchicalforecast.methods.MinTrace._get_PW_matrices': ( 'src/methods.html#mintrace._get_pw_matrices',
                                                                                                           'hierarchicalforecast/methods.py'),
+                                              'hierarchicalforecast.methods.MinTrace._get_P_factored': ( 'src/methods.html#mintrace._get_p_factored',
+                                                                                                         'hierarchicalforecast/methods.py'),
+                                              'hierarchicalforecast.methods.MinTrace._get_qp_factors': ( 'src/methods.html#mintrace._get_qp_factors',
+                                                                                                         'hierarchicalforecast/methods.py'),
+                                              'hierarchicalforecast.methods.MinTrace._is_batchable': ( 'src/methods.html#mintrace._is_batchable',
+                                                                                                       'hierarchicalforecast/methods.py'),
+                                              'hierarchicalforecast.methods.MinTrace._solve_qp': ( 'src/methods.html#mintrace._solve_qp',
+                                                                                                   'hierarchicalforecast/methods.py'),
+                                              'hierarchicalforecast.methods.MinTrace._structural_key': ( 'src/methods.html#mintrace._structural_key',
+                                                                                                         'hierarchicalforecast/methods.py'),
                                               'hierarchicalforecast.methods.MinTrace.fit': ( 'src/methods.html#mintrace.fit',
                                                                                              'hierarchicalforecast/methods.py'),
                                               'hierarchicalforecast.methods.MinTrace.fit_predict': ( 'src/methods.html#mintrace.fit_predict',
@@ -115,12 +169,40 @@ d = { 'settings': { 'branch': 'main',
                                                                                                         'hierarchicalforecast/methods.py'),
                                               'hierarchicalforecast.methods.MinTraceSparse._get_PW_matrices': ( 'src/methods.html#mintracesparse._get_pw_matrices',
                                                                                                                 'hierarchicalforecast/methods.py'),
+                                              'hierarchicalforecast.methods.MinTraceSparse._get_PW_matrices_shrink': ( 'src/methods.html#mintracesparse._get_pw_matrices_shrink',
+                                                                                                                       'hierarchicalforecast/methods.py'),
+                                              'hierarchicalforecast.methods.MinTraceSparse._get_preconditioner': ( 'src/methods.html#mintracesparse._get_preconditioner',
+                                                                                                                   'hierarchicalforecast/methods.py'),
+                                              'hierarchicalforecast.methods.MinTraceSparse._solve_apg': ( 'src/methods.html#mintracesparse._solve_apg',
+                                                                                                          'hierarchicalforecast/methods.py'),
+                                              'hierarchicalforecast.methods.MinTraceSparse._solve_cg': ( 'src/methods.html#mintracesparse._solve_cg',
+                                                                                                         'hierarchicalforecast/methods.py'),
+                                              'hierarchicalforecast.methods.MinTraceSparse._structural_key': ( 'src/methods.html#mintracesparse._structural_key',
+                                                                                                               'hierarchicalforecast/methods.py'),
                                               'hierarchicalforecast.methods.MinTraceSparse.fit': ( 'src/methods.html#mintracesparse.fit',
                                                                                                    'hierarchicalforecast/methods.py'),
+                                              'hierarchicalforecast.methods.MinTraceSparse.solver_info': ( 'src/methods.html#mintracesparse.solver_info',
+                                                                                                           'hierarchicalforecast/methods.py'),
                                               'hierarchicalforecast.methods.OptimalCombination': ( 'src/methods.html#optimalcombination',
                                                                                                    'hierarchicalforecast/methods.py'),
                                               'hierarchicalforecast.methods.OptimalCombination.__init__': ( 'src/methods.html#optimalcombination.__init__',
                                                                                                             'hierarchicalforecast/methods.py'),
+                                              'hierarchicalforecast.methods.ReconciliationArtifact': ( 'src/methods.html#reconciliationartifact',
+                                                                                                       'hierarchicalforecast/methods.py'),
+                                              'hierarchicalforecast.methods.ReconciliationArtifact.__init__': ( 'src/methods.html#reconciliationartifact.__init__',
+                                                                                                                'hierarchicalforecast/methods.py'),
+                                              'hierarchicalforecast.methods.ReconciliationArtifact._get_bottom_buffer': ( 'src/methods.html#reconciliationartifact._get_bottom_buffer',
+                                                                                                                          'hierarchicalforecast/methods.py'),
+                                              'hierarchicalforecast.methods.ReconciliationArtifact.from_reconciler': ( 'src/methods.html#reconciliationartifact.from_reconciler',
+                                                                                                                       'hierarchicalforecast/methods.py'),
+                                              'hierarchicalforecast.methods.ReconciliationArtifact.intervals': ( 'src/methods.html#reconciliationartifact.intervals',
+                                                                                                                 'hierarchicalforecast/methods.py'),
+                                              'hierarchicalforecast.methods.ReconciliationArtifact.load': ( 'src/methods.html#reconciliationartifact.load',
+                                                                                                            'hierarchicalforecast/methods.py'),
+                                              'hierarchicalforecast.methods.ReconciliationArtifact.save': ( 'src/methods.html#reconciliationartifact.save',
+                                                                                                            'hierarchicalforecast/methods.py'),
+                                              'hierarchicalforecast.methods.ReconciliationArtifact.transform': ( 'src/methods.html#reconciliationartifact.transform',
+                                                                                                                 'hierarchicalforecast/methods.py'),
                                               'hierarchicalforecast.methods.TopDown': ( 'src/methods.html#topdown',
                                                                                         'hierarchicalforecast/methods.py'),
                                               'hierarchicalforecast.methods.TopDown.__init__': ( 'src/methods.html#topdown.__init__',
@@ -137,6 +219,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                'hierarchicalforecast/methods.py'),
                                               'hierarchicalforecast.methods.TopDownSparse.fit_predict': ( 'src/methods.html#topdownsparse.fit_predict',
                                                                                                           'hierarchicalforecast/methods.py'),
+                                              'hierarchicalforecast.methods._accepts_structure': ( 'src/methods.html#_accepts_structure',
+                                                                                                   'hierarchicalforecast/methods.py'),
                                               'hierarchicalforecast.methods._get_child_nodes': ( 'src/methods.html#_get_child_nodes',
                                                                                                  'hierarchicalforecast/methods.py'),
                                               'hierarchicalforecast.methods._reconcile_fcst_proportions': ( 'src/methods.html#_reconcile_fcst_proportions',
@@ -145,6 +229,10 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                       'hierarchicalforecast/probabilistic_methods.py'),
                                                             'hierarchicalforecast.probabilistic_methods.Bootstrap.__init__': ( 'src/probabilistic_methods.html#bootstrap.__init__',
                                                                                                                                'hierarchicalforecast/probabilistic_methods.py'),
+                                                            'hierarchicalforecast.probabilistic_methods.Bootstrap._get_sample_blocks': ( 'src/probabilistic_methods.html#bootstrap._get_sample_blocks',
+                                                                                                                                         'hierarchicalforecast/probabilistic_methods.py'),
+                                                            'hierarchicalforecast.probabilistic_methods.Bootstrap._get_samples_bottom': ( 'src/probabilistic_methods.html#bootstrap._get_samples_bottom',
+                                                                                                                                          'hierarchicalforecast/probabilistic_methods.py'),
                                                             'hierarchicalforecast.probabilistic_methods.Bootstrap.get_prediction_levels': ( 'src/probabilistic_methods.html#bootstrap.get_prediction_levels',
                                                                                                                                             'hierarchicalforecast/probabilistic_methods.py'),
                                                             'hierarchicalforecast.probabilistic_methods.Bootstrap.get_prediction_quantiles': ( 'src/probabilistic_methods.html#bootstrap.get_prediction_quantiles',
@@ -155,6 +243,14 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                       'hierarchicalforecast/probabilistic_methods.py'),
                                                             'hierarchicalforecast.probabilistic_methods.Normality.__init__': ( 'src/probabilistic_methods.html#normality.__init__',
                                                                                                                                'hierarchicalforecast/probabilistic_methods.py'),
+                                                            'hierarchicalforecast.probabilistic_methods.Normality._get_covariance_bottom': ( 'src/probabilistic_methods.html#normality._get_covariance_bottom',
+                                                                                                                                             'hierarchicalforecast/probabilistic_methods.py'),
+                                                            'hierarchicalforecast.probabilistic_methods.Normality._get_factors_bottom': ( 'src/probabilistic_methods.html#normality._get_factors_bottom',
+                                                                                                                                          'hierarchicalforecast/probabilistic_methods.py'),
+                                                            'hierarchicalforecast.probabilistic_methods.Normality._get_variance_rec': ( 'src/probabilistic_methods.html#normality._get_variance_rec',
+                                                                                                                                        'hierarchicalforecast/probabilistic_methods.py'),
+                                                            'hierarchicalforecast.probabilistic_methods.Normality.cov_rec': ( 'src/probabilistic_methods.html#normality.cov_rec',
+                                                                                                                              'hierarchicalforecast/probabilistic_methods.py'),
                                                             'hierarchicalforecast.probabilistic_methods.Normality.get_prediction_levels': ( 'src/probabilistic_methods.html#normality.get_prediction_levels',
                                                                                                                                             'hierarchicalforecast/probabilistic_methods.py'),
                                                             'hierarchicalforecast.probabilistic_methods.Normality.get_prediction_quantiles': ( 'src/probabilistic_methods.html#normality.get_prediction_quantiles',
@@ -165,20 +261,24 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                    'hierarchicalforecast/probabilistic_methods.py'),
                                                             'hierarchicalforecast.probabilistic_methods.PERMBU.__init__': ( 'src/probabilistic_methods.html#permbu.__init__',
                                                                                                                             'hierarchicalforecast/probabilistic_methods.py'),
-                                                            'hierarchicalforecast.probabilistic_methods.PERMBU._nonzero_indexes_by_row': ( 'src/probabilistic_methods.html#permbu._nonzero_indexes_by_row',
-                                                                                                                                           'hierarchicalforecast/probabilistic_methods.py'),
+                                                            'hierarchicalforecast.probabilistic_methods.PERMBU._get_sample_blocks': ( 'src/probabilistic_methods.html#permbu._get_sample_blocks',
+                                                                                                                                      'hierarchicalforecast/probabilistic_methods.py'),
                                                             'hierarchicalforecast.probabilistic_methods.PERMBU._obtain_ranks': ( 'src/probabilistic_methods.html#permbu._obtain_ranks',
                                                                                                                                  'hierarchicalforecast/probabilistic_methods.py'),
-                                                            'hierarchicalforecast.probabilistic_methods.PERMBU._permutate_predictions': ( 'src/probabilistic_methods.html#permbu._permutate_predictions',
-                                                                                                                                          'hierarchicalforecast/probabilistic_methods.py'),
-                                                            'hierarchicalforecast.probabilistic_methods.PERMBU._permutate_samples': ( 'src/probabilistic_methods.html#permbu._permutate_samples',
-                                                                                                                                      'hierarchicalforecast/probabilistic_methods.py'),
                                                             'hierarchicalforecast.probabilistic_methods.PERMBU.get_prediction_levels': ( 'src/probabilistic_methods.html#permbu.get_prediction_levels',
                                                                                                                                          'hierarchicalforecast/probabilistic_methods.py'),
                                                             'hierarchicalforecast.probabilistic_methods.PERMBU.get_prediction_quantiles': ( 'src/probabilistic_methods.html#permbu.get_prediction_quantiles',
                                                                                                                                             'hierarchicalforecast/probabilistic_methods.py'),
                                                             'hierarchicalforecast.probabilistic_methods.PERMBU.get_samples': ( 'src/probabilistic_methods.html#permbu.get_samples',
-                                                                                                                               'hierarchicalforecast/probabilistic_methods.py')},
+                                                                                                                               'hierarchicalforecast/probabilistic_methods.py'),
+                                                            'hierarchicalforecast.probabilistic_methods._is_diagonal': ( 'src/probabilistic_methods.html#_is_diagonal',
+                                                                                                                         'hierarchicalforecast/probabilistic_methods.py'),
+                                                            'hierarchicalforecast.probabilistic_methods._permbu_aggregate': ( 'src/probabilistic_methods.html#_permbu_aggregate',
+                                                                                                                              'hierarchicalforecast/probabilistic_methods.py'),
+                                                            'hierarchicalforecast.probabilistic_methods._rowwise_dot': ( 'src/probabilistic_methods.html#_rowwise_dot',
+                                                                                                                         'hierarchicalforecast/probabilistic_methods.py'),
+                                                            'hierarchicalforecast.probabilistic_methods._sample_blocks_quantiles': ( 'src/probabilistic_methods.html#_sample_blocks_quantiles',
+                                                                                                                                     'hierarchicalforecast/probabilistic_methods.py')},
             'hierarchicalforecast.utils': { 'hierarchicalforecast.utils.CodeTimer': ( 'src/utils.html#codetimer',
                                                                                       'hierarchicalforecast/utils.py'),
                                             'hierarchicalforecast.utils.CodeTimer.__enter__': ( 'src/utils.html#codetimer.__enter__',
@@ -199,15 +299,113 @@ d = { 'settings': { 'branch': 'main',
                                                                                                          'hierarchicalforecast/utils.py'),
                                             'hierarchicalforecast.utils.HierarchicalPlot.plot_summing_matrix': ( 'src/utils.html#hierarchicalplot.plot_summing_matrix',
                                                                                                                  'hierarchicalforecast/utils.py'),
+                                            'hierarchicalforecast.utils.HierarchyStructure': ( 'src/utils.html#hierarchystructure',
+                                                                                               'hierarchicalforecast/utils.py'),
+                                            'hierarchicalforecast.utils.HierarchyStructure.S_dense': ( 'src/utils.html#hierarchystructure.s_dense',
+                                                                                                       'hierarchicalforecast/utils.py'),
+                                            'hierarchicalforecast.utils.HierarchyStructure.__init__': ( 'src/utils.html#hierarchystructure.__init__',
+                                                                                                        'hierarchicalforecast/utils.py'),
+                                            'hierarchicalforecast.utils.HierarchyStructure._check_arrays': ( 'src/utils.html#hierarchystructure._check_arrays',
+                                                                                                             'hierarchicalforecast/utils.py'),
+                                            'hierarchicalforecast.utils.HierarchyStructure._get_parents': ( 'src/utils.html#hierarchystructure._get_parents',
+                                                                                                            'hierarchicalforecast/utils.py'),
+                                            'hierarchicalforecast.utils.HierarchyStructure.from_frame': ( 'src/utils.html#hierarchystructure.from_frame',
+                                                                                                          'hierarchicalforecast/utils.py'),
+                                            'hierarchicalforecast.utils.HierarchyStructure.idx_bottom': ( 'src/utils.html#hierarchystructure.idx_bottom',
+                                                                                                          'hierarchicalforecast/utils.py'),
+                                            'hierarchicalforecast.utils.HierarchyStructure.load': ( 'src/utils.html#hierarchystructure.load',
+                                                                                                    'hierarchicalforecast/utils.py'),
+                                            'hierarchicalforecast.utils.HierarchyStructure.save': ( 'src/utils.html#hierarchystructure.save',
+                                                                                                    'hierarchicalforecast/utils.py'),
+                                            'hierarchicalforecast.utils.HierarchyStructure.tag_indices': ( 'src/utils.html#hierarchystructure.tag_indices',
+                                                                                                           'hierarchicalforecast/utils.py'),
+                                            'hierarchicalforecast.utils.HierarchyStructure.tags': ( 'src/utils.html#hierarchystructure.tags',
+                                                                                                    'hierarchicalforecast/utils.py'),
+                                            'hierarchicalforecast.utils.ResidualStatistics': ( 'src/utils.html#residualstatistics',
+                                                                                               'hierarchicalforecast/utils.py'),
+                                            'hierarchicalforecast.utils.ResidualStatistics.__init__': ( 'src/utils.html#residualstatistics.__init__',
+                                                                                                        'hierarchicalforecast/utils.py'),
+                                            'hierarchicalforecast.utils.ResidualStatistics._check_method': ( 'src/utils.html#residualstatistics._check_method',
+                                                                                                             'hierarchicalforecast/utils.py'),
+                                            'hierarchicalforecast.utils.ResidualStatistics._expand': ( 'src/utils.html#residualstatistics._expand',
+                                                                                                       'hierarchicalforecast/utils.py'),
+                                            'hierarchicalforecast.utils.ResidualStatistics._initialize': ( 'src/utils.html#residualstatistics._initialize',
+                                                                                                           'hierarchicalforecast/utils.py'),
+                                            'hierarchicalforecast.utils.ResidualStatistics._pair_sums': ( 'src/utils.html#residualstatistics._pair_sums',
+                                                                                                          'hierarchicalforecast/utils.py'),
+                                            'hierarchicalforecast.utils.ResidualStatistics.covariance': ( 'src/utils.html#residualstatistics.covariance',
+                                                                                                          'hierarchicalforecast/utils.py'),
+                                            'hierarchicalforecast.utils.ResidualStatistics.shrunk_covariance': ( 'src/utils.html#residualstatistics.shrunk_covariance',
+                                                                                                                 'hierarchicalforecast/utils.py'),
+                                            'hierarchicalforecast.utils.ResidualStatistics.update': ( 'src/utils.html#residualstatistics.update',
+                                                                                                      'hierarchicalforecast/utils.py'),
+                                            'hierarchicalforecast.utils.ResidualStatistics.variance': ( 'src/utils.html#residualstatistics.variance',
+                                                                                                        'hierarchicalforecast/utils.py'),
+                                            'hierarchicalforecast.utils._FactoredCovariance': ( 'src/utils.html#_factoredcovariance',
+                                                                                                'hierarchicalforecast/utils.py'),
+                                            'hierarchicalforecast.utils._FactoredCovariance.__init__': ( 'src/utils.html#_factoredcovariance.__init__',
+                                                                                                         'hierarchicalforecast/utils.py'),
+                                            'hierarchicalforecast.utils._FactoredCovariance.__matmul__': ( 'src/utils.html#_factoredcovariance.__matmul__',
+                                                                                                           'hierarchicalforecast/utils.py'),
+                                            'hierarchicalforecast.utils._FactoredCovariance.diagonal': ( 'src/utils.html#_factoredcovariance.diagonal',
+                                                                                                         'hierarchicalforecast/utils.py'),
+                                            'hierarchicalforecast.utils._FactoredCovariance.solve': ( 'src/utils.html#_factoredcovariance.solve',
+                                                                                                      'hierarchicalforecast/utils.py'),
+                                            'hierarchicalforecast.utils._FactoredCovariance.toarray': ( 'src/utils.html#_factoredcovariance.toarray',
+                                                                                                        'hierarchicalforecast/utils.py'),
+                                            'hierarchicalforecast.utils._StructureCache': ( 'src/utils.html#_structurecache',
+                                                                                            'hierarchicalforecast/utils.py'),
+                                            'hierarchicalforecast.utils._StructureCache.__init__': ( 'src/utils.html#_structurecache.__init__',
+                                                                                                     'hierarchicalforecast/utils.py'),
+                                            'hierarchicalforecast.utils._StructureCache.clear': ( 'src/utils.html#_structurecache.clear',
+                                                                                                  'hierarchicalforecast/utils.py'),
+                                            'hierarchicalforecast.utils._StructureCache.fingerprint': ( 'src/utils.html#_structurecache.fingerprint',
+                                                                                                        'hierarchicalforecast/utils.py'),
+                                            'hierarchicalforecast.utils._StructureCache.get': ( 'src/utils.html#_structurecache.get',
+                                                                                                'hierarchicalforecast/utils.py'),
+                                            'hierarchicalforecast.utils._StructureCache.info': ( 'src/utils.html#_structurecache.info',
+                                                                                                 'hierarchicalforecast/utils.py'),
+                                            'hierarchicalforecast.utils._StructureCache.put': ( 'src/utils.html#_structurecache.put',
+                                                                                                'hierarchicalforecast/utils.py'),
+                                            'hierarchicalforecast.utils._StructureCache.release': ( 'src/utils.html#_structurecache.release',
+                                                                                                    'hierarchicalforecast/utils.py'),
                                             'hierarchicalforecast.utils._construct_adjacency_matrix': ( 'src/utils.html#_construct_adjacency_matrix',
                                                                                                         'hierarchicalforecast/utils.py'),
+                                            'hierarchicalforecast.utils._csr_matmul': ( 'src/utils.html#_csr_matmul',
+                                                                                        'hierarchicalforecast/utils.py'),
+                                            'hierarchicalforecast.utils._hierarchical_covariance_pattern': ( 'src/utils.html#_hierarchical_covariance_pattern',
+                                                                                                             'hierarchicalforecast/utils.py'),
                                             'hierarchicalforecast.utils._is_strictly_hierarchical': ( 'src/utils.html#_is_strictly_hierarchical',
                                                                                                       'hierarchicalforecast/utils.py'),
+                                            'hierarchicalforecast.utils._kron_lasso': ( 'src/utils.html#_kron_lasso',
+                                                                                        'hierarchicalforecast/utils.py'),
+                                            'hierarchicalforecast.utils._kron_lasso_cd': ( 'src/utils.html#_kron_lasso_cd',
+                                                                                           'hierarchicalforecast/utils.py'),
                                             'hierarchicalforecast.utils._lasso': ('src/utils.html#_lasso', 'hierarchicalforecast/utils.py'),
+                                            'hierarchicalforecast.utils._load_npz': ( 'src/utils.html#_load_npz',
+                                                                                      'hierarchicalforecast/utils.py'),
                                             'hierarchicalforecast.utils._ma_cov': ( 'src/utils.html#_ma_cov',
                                                                                     'hierarchicalforecast/utils.py'),
+                                            'hierarchicalforecast.utils._masked_covariance_tile': ( 'src/utils.html#_masked_covariance_tile',
+                                                                                                    'hierarchicalforecast/utils.py'),
+                                            'hierarchicalforecast.utils._masked_covariance_tiles': ( 'src/utils.html#_masked_covariance_tiles',
+                                                                                                     'hierarchicalforecast/utils.py'),
+                                            'hierarchicalforecast.utils._quantiles_partition': ( 'src/utils.html#_quantiles_partition',
+                                                                                                 'hierarchicalforecast/utils.py'),
+                                            'hierarchicalforecast.utils._schaferstrimmer_shrinkage': ( 'src/utils.html#_schaferstrimmer_shrinkage',
+                                                                                                       'hierarchicalforecast/utils.py'),
+                                            'hierarchicalforecast.utils._schaferstrimmer_tile': ( 'src/utils.html#_schaferstrimmer_tile',
+                                                                                                  'hierarchicalforecast/utils.py'),
+                                            'hierarchicalforecast.utils._shrunk_covariance_schaferstrimmer_factored': ( 'src/utils.html#_shrunk_covariance_schaferstrimmer_factored',
+                                                                                                                        'hierarchicalforecast/utils.py'),
                                             'hierarchicalforecast.utils._shrunk_covariance_schaferstrimmer_no_nans': ( 'src/utils.html#_shrunk_covariance_schaferstrimmer_no_nans',
                                                                                                                        'hierarchicalforecast/utils.py'),
+                                            'hierarchicalforecast.utils._shrunk_covariance_schaferstrimmer_pairs': ( 'src/utils.html#_shrunk_covariance_schaferstrimmer_pairs',
+                                                                                                                     'hierarchicalforecast/utils.py'),
+                                            'hierarchicalforecast.utils._shrunk_covariance_schaferstrimmer_sparse': ( 'src/utils.html#_shrunk_covariance_schaferstrimmer_sparse',
+                                                                                                                      'hierarchicalforecast/utils.py'),
+                                            'hierarchicalforecast.utils._shrunk_covariance_schaferstrimmer_tiles': ( 'src/utils.html#_shrunk_covariance_schaferstrimmer_tiles',
+                                                                                                                     'hierarchicalforecast/utils.py'),
                                             'hierarchicalforecast.utils._shrunk_covariance_schaferstrimmer_with_nans': ( 'src/utils.html#_shrunk_covariance_schaferstrimmer_with_nans',
                                                                                                                          'hierarchicalforecast/utils.py'),
                                             'hierarchicalforecast.utils._to_upper_hierarchy': ( 'src/utils.html#_to_upper_hierarchy',
@@ -10,14 +10,21 @@ import reprlib
 import time
 
 from .methods import HReconciler, TopDownSparse, MiddleOutSparse
+from hierarchicalforecast.utils import (
+    CacheInfo,
+    HierarchyStructure,
+    ResidualStatistics,
+    _StructureCache,
+)
 from inspect import signature
 from narwhals.typing import Frame, FrameT
 from scipy.stats import norm
 from scipy import sparse
-from typing import Optional
+from typing import Optional, Union
 
 import narwhals as nw
 import numpy as np
+import pandas as pd
 
 # %% ../nbs/src/core.ipynb 6
 def _build_fn_name(fn) -> str:
@@ -28,8 +35,23 @@ def _build_fn_name(fn) -> str:
     args_to_remove = ["insample", "num_threads"]
     if not func_params.get("nonnegative", False):
         args_to_remove.append("nonnegative")
-
-    if fn_name == "MinTrace" and func_params["method"] == "mint_shrink":
+    if func_params.get("solver", "bicgstab") == "bicgstab":
+        args_to_remove.append("solver")
+    if func_params.get("preconditioner") == "block_jacobi":
+        args_to_remove.append("preconditioner")
+    if func_params.get("tol") == 1e-8:
+        args_to_remove.append("tol")
+    if "maxiter" in func_params and func_params["maxiter"] is None:
+        args_to_remove.append("maxiter")
+    if func_params.get("qp_formulation") == "full":
+        args_to_remove.append("qp_formulation")
+    if func_params.get("apg") is False:
+        args_to_remove.append("apg")
+
+    if (
+        fn_name in ["MinTrace", "MinTraceSparse"]
+        and func_params["method"] == "mint_shrink"
+    ):
         if func_params["mint_shr_ridge"] == 2e-8:
             args_to_remove.append("mint_shr_ridge")
 
@@ -88,6 +110,93 @@ def _reverse_engineer_sigmah(
 
     return sigmah
 
+
+def _is_sorted_like(ids: np.ndarray, times: np.ndarray, S_ids: np.ndarray) -> bool:
+    """
+    Whether the rows are grouped by `ids` in the order of `S_ids`
+    and strictly increasing in `times` within each group.
+    """
+    if len(ids) == 0:
+        return False
+    new_id = np.empty(len(ids), dtype=bool)
+    new_id[0] = True
+    new_id[1:] = ids[1:] != ids[:-1]
+    if not np.array_equal(ids[new_id], S_ids):
+        return False
+    return bool(np.all(new_id[1:] | (times[1:] > times[:-1])))
+
+
+def _sort_like_S(
+    df_nw: Frame, S_nw: Frame, id_col: str = "unique_id", time_col: str = "ds"
+) -> FrameT:
+    """
+    Sort the rows of `df_nw` by the position of their ids in `S_nw` and then by time.
+    The join and sort are skipped when the rows are already in that order.
+    """
+    if _is_sorted_like(
+        df_nw[id_col].to_numpy(), df_nw[time_col].to_numpy(), S_nw[id_col].to_numpy()
+    ):
+        return df_nw
+    df_nw_cols = df_nw.columns
+    S_ids = S_nw[[id_col]].with_columns(**{f"{id_col}_id": np.arange(len(S_nw))})
+    df_nw = df_nw.join(S_ids, on=id_col, how="left")
+    df_nw = df_nw.sort(by=[f"{id_col}_id", time_col])
+    return df_nw[df_nw_cols]
+
+
+def _is_bottom_identity(
+    S_nw: Frame, bottom_cols: list[str], max_chunk_bytes: int = 2**27
+) -> bool:
+    """
+    Whether the bottom rows of `S_nw` in `bottom_cols` are an identity matrix, from the
+    diagonal and the count of nonzeros of chunks of rows instead of a dense identity.
+    """
+    n = len(bottom_cols)
+    offset = len(S_nw) - n
+    chunk_size = max(1, max_chunk_bytes // (8 * max(n, 1)))
+    for start in range(0, n, chunk_size):
+        rows = (
+            S_nw[offset + start : offset + start + chunk_size]
+            .select(bottom_cols)
+            .to_numpy()
+        )
+        idxs = np.arange(len(rows))
+        if np.count_nonzero(rows) != len(rows) or not np.allclose(
+            rows[idxs, start + idxs], 1.0
+        ):
+            return False
+    return True
+
+
+def _missing_ids(ids: nw.Series, other_ids: nw.Series) -> set:
+    """
+    Ids of `ids` that are not in `other_ids`, found with the hashed `is_in` of the backend.
+    """
+    return set(ids.filter(~ids.is_in(other_ids)).to_list())
+
+
+def _is_csr_bottom_identity(S: sparse.csr_matrix) -> bool:
+    """
+    Whether the bottom rows of the sparse `S` are an identity matrix.
+    """
+    bottom = S[-S.shape[1] :]
+    return np.count_nonzero(bottom.data) == S.shape[1] and np.allclose(
+        bottom.diagonal(), 1.0
+    )
+
+
+def _structure_ids_frame(
+    structure: HierarchyStructure,
+    id_col: str = "unique_id",
+    like: Optional[Frame] = None,
+) -> FrameT:
+    """
+    Frame with the ids of `structure`, in the backend of `like` or pandas, that stands
+    for `S_df` where only the ids are needed.
+    """
+    backend = pd if like is None else nw.get_native_namespace(like)
+    return nw.from_dict({id_col: structure.ids}, backend=backend)
+
 # %% ../nbs/src/core.ipynb 11
 class HierarchicalReconciliation:
     """Hierarchical Reconciliation Class.
@@ -100,14 +209,25 @@ class HierarchicalReconciliation:
 
     **Parameters:**<br>
     `reconcilers`: A list of instantiated classes of the [reconciliation methods](https://nixtla.github.io/hierarchicalforecast/methods.html) module .<br>
+    `cache_size`: int=32, maximum number of summing matrix dependent `P` and `W` matrices kept between models and `reconcile` calls, set it to 0 to disable the cache.<br>
 
     **References:**<br>
     [Rob J. Hyndman and George Athanasopoulos (2018). \"Forecasting principles and practice, Hierarchical and Grouped Series\".](https://otexts.com/fpp3/hierarchical.html)
     """
 
-    def __init__(self, reconcilers: list[HReconciler]):
+    def __init__(self, reconcilers: list[HReconciler], cache_size: int = 32):
         self.reconcilers = reconcilers
         self.orig_reconcilers = copy.deepcopy(reconcilers)  # TODO: elegant solution
+        self._cache = _StructureCache(maxsize=cache_size)
+        self._fit_state = None
+
+    def cache_info(self) -> CacheInfo:
+        """Report the hits, misses, maximum and current size of the structure cache."""
+        return self._cache.info()
+
+    def cache_clear(self) -> None:
+        """Clear the structure cache and reset its counters."""
+        self._cache.clear()
 
     def _prepare_fit(
         self,
@@ -122,10 +242,18 @@ class HierarchicalReconciliation:
         target_col: str = "y",
         id_time_col: str = "temporal_id",
         temporal: bool = False,
+        fitted: bool = False,
+        validate: str = "full",
+        structure: Optional[HierarchyStructure] = None,
     ) -> tuple[FrameT, FrameT, FrameT, list[str], str]:
         """
-        Performs preliminary wrangling and protections
+        Performs preliminary wrangling and protections.
+        With `fitted`, `S_nw` was already checked and the insample statistics come from `fit`.
+        With `structure`, `S_nw` only holds its ids and the checks of `S` run on its CSR matrix.
+        The time spent on the checks of `validate` is kept in `self.validation_time`.
         """
+        if validate not in ["full", "fast", "trusted"]:
+            raise ValueError(f"Unknown validate mode: {validate}")
         Y_hat_nw_cols = Y_hat_nw.columns
         S_nw_cols = S_nw.columns
 
@@ -170,22 +298,12 @@ class HierarchicalReconciliation:
                 )
 
         # -------------------------------- Match Y_hat/Y/S index order --------------------------------#
-        # TODO: This is now a bit slow as we always sort.
-        S_nw = S_nw.with_columns(**{f"{id_col}_id": np.arange(len(S_nw))})
-
-        Y_hat_nw = Y_hat_nw.join(S_nw[[id_col, f"{id_col}_id"]], on=id_col, how="left")
-        Y_hat_nw = Y_hat_nw.sort(by=[f"{id_col}_id", time_col])
-        Y_hat_nw = Y_hat_nw[Y_hat_nw_cols]
-
+        Y_hat_nw = _sort_like_S(Y_hat_nw, S_nw, id_col=id_col, time_col=time_col)
         if Y_nw is not None:
-            Y_nw_cols = Y_nw.columns
-            Y_nw = Y_nw.join(S_nw[[id_col, f"{id_col}_id"]], on=id_col, how="left")
-            Y_nw = Y_nw.sort(by=[f"{id_col}_id", time_col])
-            Y_nw = Y_nw[Y_nw_cols]
-
-        S_nw = S_nw[S_nw_cols]
+            Y_nw = _sort_like_S(Y_nw, S_nw, id_col=id_col, time_col=time_col)
 
         # ----------------------------------- Check Input's Validity ----------------------------------#
+        start = time.time()
 
         # Check input's validity
         if intervals_method not in ["normality", "bootstrap", "permbu"]:
@@ -194,7 +312,7 @@ class HierarchicalReconciliation:
         # Check absence of Y_nw for insample reconcilers
         if Y_nw is None:
             for reconciler in self.orig_reconcilers:
-                if reconciler.insample:
+                if reconciler.insample and not fitted:
                     reconciler_name = _build_fn_name(reconciler)
                     raise ValueError(
                         f"You need to provide `Y_df` for reconciler {reconciler_name}"
@@ -215,16 +333,25 @@ class HierarchicalReconciliation:
         # Declare output names
         model_names = [col for col in Y_hat_nw.columns if col not in id_cols]
 
-        # Ensure numeric columns
-        for model in model_names:
-            if not Y_hat_nw.schema[model].is_numeric():
-                raise ValueError(
-                    f"Column `{model}` in `Y_hat_df` contains non-numeric values. Make sure no column in `Y_hat_df` contains non-numeric values."
-                )
-            if Y_hat_nw[model].is_null().any():
-                raise ValueError(
-                    f"Column `{model}` in `Y_hat_df` contains null values. Make sure no column in `Y_hat_df` contains null values."
-                )
+        # Ensure numeric columns without nulls
+        if validate in ["full", "fast"]:
+            for model in model_names:
+                if not Y_hat_nw.schema[model].is_numeric():
+                    raise ValueError(
+                        f"Column `{model}` in `Y_hat_df` contains non-numeric values. Make sure no column in `Y_hat_df` contains non-numeric values."
+                    )
+            if validate == "full":
+                has_nulls = [Y_hat_nw[model].is_null().any() for model in model_names]
+            elif model_names:
+                # Scan every model for nulls in a single pass
+                has_nulls = Y_hat_nw.select(nw.col(model_names).is_null().any()).row(0)
+            else:
+                has_nulls = []
+            for model, has_null in zip(model_names, has_nulls):
+                if has_null:
+                    raise ValueError(
+                        f"Column `{model}` in `Y_hat_df` contains null values. Make sure no column in `Y_hat_df` contains null values."
+                    )
 
         # TODO: Complete y_hat_insample protection
         model_names = [
@@ -241,15 +368,42 @@ class HierarchicalReconciliation:
 
         # Assert S is an identity matrix at the bottom
         S_nw_cols.remove(id_col)
-        if not np.allclose(S_nw[S_nw_cols][-len(S_nw_cols) :], np.eye(len(S_nw_cols))):
-            raise ValueError(
-                f"The bottom {S_nw.shape[1]}x{S_nw.shape[1]} part of S must be an identity matrix."
-            )
+        if structure is not None:
+            n_bottom = structure.S.shape[1]
+            if (
+                not fitted
+                and validate != "trusted"
+                and not _is_csr_bottom_identity(structure.S)
+            ):
+                raise ValueError(
+                    f"The bottom {n_bottom}x{n_bottom} part of S must be an identity matrix."
+                )
+        elif not fitted and validate == "full":
+            if not np.allclose(
+                S_nw[S_nw_cols][-len(S_nw_cols) :], np.eye(len(S_nw_cols))
+            ):
+                raise ValueError(
+                    f"The bottom {S_nw.shape[1]}x{S_nw.shape[1]} part of S must be an identity matrix."
+                )
+        elif not fitted and validate == "fast":
+            if not _is_bottom_identity(S_nw, S_nw_cols):
+                raise ValueError(
+                    f"The bottom {S_nw.shape[1]}x{S_nw.shape[1]} part of S must be an identity matrix."
+                )
+
+        if validate == "trusted":
+            self.validation_time = time.time() - start
+            return Y_hat_nw, S_nw, Y_nw, model_names, id_col
 
         # Check Y_hat_df\S_df series difference
         # TODO: this logic should be method specific
-        S_diff = set(S_nw[id_col]) - set(Y_hat_nw[id_col])
-        Y_hat_diff = set(Y_hat_nw[id_col]) - set(S_nw[id_col])
+        if validate == "fast":
+            Y_hat_ids = Y_hat_nw[id_col].unique()
+            S_diff = _missing_ids(S_nw[id_col], Y_hat_ids)
+            Y_hat_diff = _missing_ids(Y_hat_ids, S_nw[id_col])
+        else:
+            S_diff = set(S_nw[id_col]) - set(Y_hat_nw[id_col])
+            Y_hat_diff = set(Y_hat_nw[id_col]) - set(S_nw[id_col])
         if S_diff:
             raise ValueError(
                 f"There are unique_ids in S_df that are not in Y_hat_df: {reprlib.repr(S_diff)}"
@@ -260,8 +414,13 @@ class HierarchicalReconciliation:
             )
 
         if Y_nw is not None:
-            Y_diff = set(Y_nw[id_col]) - set(Y_hat_nw[id_col])
-            Y_hat_diff = set(Y_hat_nw[id_col]) - set(Y_nw[id_col])
+            if validate == "fast":
+                Y_ids = Y_nw[id_col].unique()
+                Y_diff = _missing_ids(Y_ids, Y_hat_ids)
+                Y_hat_diff = _missing_ids(Y_hat_ids, Y_ids)
+            else:
+                Y_diff = set(Y_nw[id_col]) - set(Y_hat_nw[id_col])
+                Y_hat_diff = set(Y_hat_nw[id_col]) - set(Y_nw[id_col])
             if Y_diff:
                 raise ValueError(
                     f"There are unique_ids in Y_df that are not in Y_hat_df: {reprlib.repr(Y_diff)}"
@@ -276,6 +435,7 @@ class HierarchicalReconciliation:
         unique_ids = Y_hat_nw[id_col].unique().to_numpy()
         S_nw = S_nw.filter(nw.col(id_col).is_in(unique_ids))
 
+        self.validation_time = time.time() - start
         return Y_hat_nw, S_nw, Y_nw, model_names, id_col
 
     def _prepare_Y(
@@ -314,8 +474,8 @@ class HierarchicalReconciliation:
     def reconcile(
         self,
         Y_hat_df: Frame,
-        S: Frame,
-        tags: dict[str, np.ndarray],
+        S: Union[Frame, HierarchyStructure],
+        tags: Optional[dict[str, np.ndarray]] = None,
         Y_df: Optional[Frame] = None,
         level: Optional[list[int]] = None,
         intervals_method: str = "normality",
@@ -327,6 +487,9 @@ class HierarchicalReconciliation:
         target_col: str = "y",
         id_time_col: str = "temporal_id",
         temporal: bool = False,
+        batched: bool = False,
+        samples_format: str = "wide",
+        validate: str = "full",
     ) -> FrameT:
         """Hierarchical Reconciliation Method.
 
@@ -347,8 +510,8 @@ class HierarchicalReconciliation:
         `Y_hat_df`: DataFrame, base forecasts with columns ['unique_id', 'ds'] and models to reconcile.<br>
         `Y_df`: DataFrame, training set of base time series with columns `['unique_id', 'ds', 'y']`.<br>
         If a class of `self.reconciles` receives `y_hat_insample`, `Y_df` must include them as columns.<br>
-        `S`: DataFrame with summing matrix of size `(base, bottom)`, see [aggregate method](https://nixtla.github.io/hierarchicalforecast/utils.html#aggregate).<br>
-        `tags`: Each key is a level and its value contains tags associated to that level.<br>
+        `S`: DataFrame with summing matrix of size `(base, bottom)`, see [aggregate method](https://nixtla.github.io/hierarchicalforecast/utils.html#aggregate), or a `HierarchyStructure`.<br>
+        `tags`: Each key is a level and its value contains tags associated to that level, only optional with a `HierarchyStructure`.<br>
         `level`: positive float list [0,100), confidence levels for prediction intervals.<br>
         `intervals_method`: str, method used to calculate prediction intervals, one of `normality`, `bootstrap`, `permbu`.<br>
         `num_samples`: int=-1, if positive return that many probabilistic coherent samples.
@@ -357,13 +520,24 @@ class HierarchicalReconciliation:
         `id_col` : str='unique_id', column that identifies each serie.<br>
         `time_col` : str='ds', column that identifies each timestep, its values can be timestamps or integers.<br>
         `target_col` : str='y', column that contains the target.<br>
+        `batched`: bool=False, pivot all the models at once and, without `level`, reconcile them with a single projection for reconcilers whose `P` only depends on `S`.<br>
+        `samples_format`: str='wide', layout of the samples, `wide` adds a `{model}-sample-{i}` column per sample, `long` stores a DataFrame with columns `[id_col, time_col, 'sample_idx']` and one column per reconciled model in `self.samples`, and `array` stores a dict with an array of size `(base, horizon, num_samples)` per reconciled model in `self.samples`.<br>
+        `validate`: str='full', checks of the inputs, `full` runs every check, `fast` checks the bottom of `S` from its diagonal and nonzeros and compares the ids with hashed lookups, and `trusted` skips the checks of the data for inputs already validated upstream. The time spent is kept in `self.validation_time`.<br>
 
         **Returns:**<br>
         `Y_tilde_df`: DataFrame, with reconciled predictions.
         """
         # To Narwhals
         Y_hat_nw = nw.from_native(Y_hat_df)
-        S_nw = nw.from_native(S)
+        structure = S if isinstance(S, HierarchyStructure) else None
+        if structure is not None:
+            S_nw = _structure_ids_frame(
+                structure, id_col=id_time_col if temporal else id_col, like=Y_hat_nw
+            )
+        elif tags is None:
+            raise ValueError("You need to provide `tags` with a summing DataFrame `S`.")
+        else:
+            S_nw = nw.from_native(S)
         if Y_df is not None:
             Y_nw = nw.from_native(Y_df)
         else:
@@ -382,31 +556,403 @@ class HierarchicalReconciliation:
             target_col=target_col,
             id_time_col=id_time_col,
             temporal=temporal,
+            validate=validate,
+            structure=structure,
         )
 
+        any_sparse = any([method.is_sparse_method for method in self.reconcilers])
+        if any_sparse:
+            if not nw.dependencies.is_pandas_dataframe(Y_hat_df) or (
+                structure is None and not nw.dependencies.is_pandas_dataframe(S)
+            ):
+                raise ValueError(
+                    "You have one or more sparse reconciliation methods. Please convert `S` and `Y_hat_df` to a pandas DataFrame."
+                )
+
         # Initialize reconciler arguments
-        reconciler_args = dict(
-            idx_bottom=np.arange(len(S_nw))[-S_nw.shape[1] :],
-            tags={
+        reconciler_args, S_for_dense, S_for_sparse = self._prepare_structure(
+            S_nw=S_nw, tags=tags, id_col=id_col, structure=structure
+        )
+
+        if Y_nw is not None:
+            if any_sparse and not nw.dependencies.is_pandas_dataframe(Y_df):
+                raise ValueError(
+                    "You have one or more sparse reconciliation methods. Please convert `Y_df` to a pandas DataFrame."
+                )
+            y_insample = self._prepare_Y(
+                Y_nw=Y_nw,
+                S_nw=S_nw,
+                is_balanced=is_balanced,
+                id_col=id_col,
+                time_col=time_col,
+                target_col=target_col,
+            )
+            reconciler_args["y_insample"] = y_insample
+
+        try:
+            return self._reconcile_models(
+                Y_hat_nw=Y_hat_nw,
+                S_nw=S_nw,
+                Y_nw=Y_nw,
+                reconciler_args=reconciler_args,
+                S_for_dense=S_for_dense,
+                S_for_sparse=S_for_sparse,
+                level=level,
+                intervals_method=intervals_method,
+                num_samples=num_samples,
+                seed=seed,
+                is_balanced=is_balanced,
+                id_col=id_col,
+                time_col=time_col,
+                target_col=target_col,
+                temporal=temporal,
+                batched=batched,
+                samples_format=samples_format,
+            )
+        finally:
+            # The fingerprint of S is only reused within a call, as
+            # S can be changed in place before the next one.
+            self._cache.release()
+
+    def fit(
+        self,
+        S: Union[Frame, HierarchyStructure],
+        tags: Optional[dict[str, np.ndarray]] = None,
+        Y_df: Optional[Frame] = None,
+        is_balanced: bool = False,
+        id_col: str = "unique_id",
+        time_col: str = "ds",
+        target_col: str = "y",
+        validate: str = "full",
+    ) -> "HierarchicalReconciliation":
+        """Incremental Fit Method.
+
+        Keeps the state of the reconciliation that does not depend on the base forecasts, so that
+        rolling runs only process their new data: the order of the series of `S`, the summing
+        matrices, the `tags` indices and, for each model with insample predictions in `Y_df`, the
+        streamed statistics of its residuals, see `ResidualStatistics`. Then `update` ingests the new
+        rows of `Y_df` and `predict` reconciles new base forecasts.
+
+        The `P` matrices of the reconcilers stay in the structure cache until the residual statistics
+        they depend on are updated, after which they are recomputed from the statistics without reading
+        the history again. Insample reconcilers need to accept `residual_stats`, like `MinTrace` with
+        `wls_var`, `mint_cov` or `mint_shrink`, and `bootstrap` and `permbu` intervals are not available.
+
+        **Parameters:**<br>
+        `S`: DataFrame with summing matrix of size `(base, bottom)`, see [aggregate method](https://nixtla.github.io/hierarchicalforecast/utils.html#aggregate), or a `HierarchyStructure`.<br>
+        `tags`: Each key is a level and its value contains tags associated to that level, only optional with a `HierarchyStructure`.<br>
+        `Y_df`: DataFrame, training set of base time series with columns `['unique_id', 'ds', 'y']` and the insample predictions of the models, only required by insample reconcilers.<br>
+        `is_balanced`: bool=False, wether `Y_df` is balanced, set it to True to speed things up if `Y_df` is balanced.<br>
+        `id_col` : str='unique_id', column that identifies each serie.<br>
+        `time_col` : str='ds', column that identifies each timestep, its values can be timestamps or integers.<br>
+        `target_col` : str='y', column that contains the target.<br>
+        `validate`: str='full', check of the bottom of `S`, `full` compares it with a dense identity, `fast` checks its diagonal and nonzeros, and `trusted` skips it. The time spent is kept in `self.validation_time`.<br>
+
+        **Returns:**<br>
+        `self`: object, fitted reconciliation.
+        """
+        if validate not in ["full", "fast", "trusted"]:
+            raise ValueError(f"Unknown validate mode: {validate}")
+        structure = S if isinstance(S, HierarchyStructure) else None
+        if structure is not None:
+            S_nw = _structure_ids_frame(
+                structure,
+                id_col=id_col,
+                like=None if Y_df is None else nw.from_native(Y_df),
+            )
+            start = time.time()
+            n_bottom = structure.S.shape[1]
+            if validate != "trusted" and not _is_csr_bottom_identity(structure.S):
+                raise ValueError(
+                    f"The bottom {n_bottom}x{n_bottom} part of S must be an identity matrix."
+                )
+            self.validation_time = time.time() - start
+        elif tags is None:
+            raise ValueError("You need to provide `tags` with a summing DataFrame `S`.")
+        else:
+            S_nw = nw.from_native(S)
+            S_nw_cols = S_nw.columns
+            if id_col not in S_nw_cols:
+                raise ValueError(
+                    f"Check `S_df` columns, {reprlib.repr(id_col)} must be in `S_df` columns."
+                )
+            start = time.time()
+            S_nw_cols.remove(id_col)
+            if validate == "full":
+                is_identity = np.allclose(
+                    S_nw[S_nw_cols][-len(S_nw_cols) :], np.eye(len(S_nw_cols))
+                )
+            else:
+                is_identity = validate == "trusted" or _is_bottom_identity(
+                    S_nw, S_nw_cols
+                )
+            if not is_identity:
+                raise ValueError(
+                    f"The bottom {S_nw.shape[1]}x{S_nw.shape[1]} part of S must be an identity matrix."
+                )
+            self.validation_time = time.time() - start
+        if (
+            any([method.is_sparse_method for method in self.reconcilers])
+            and structure is None
+            and not nw.dependencies.is_pandas_dataframe(S)
+        ):
+            raise ValueError(
+                "You have one or more sparse reconciliation methods. Please convert `S` to a pandas DataFrame."
+            )
+
+        # Statistics that serve every insample reconciler
+        stats_method = None
+        for reconciler in self.orig_reconcilers:
+            if not reconciler.insample:
+                continue
+            reconciler_name = _build_fn_name(reconciler)
+            method = getattr(reconciler, "method", None)
+            if (
+                "residual_stats" not in signature(reconciler.fit).parameters
+                or method not in ResidualStatistics.methods
+            ):
+                raise NotImplementedError(
+                    f"Reconciler `{reconciler_name}` does not support incremental fitting."
+                )
+            if Y_df is None:
+                raise ValueError(
+                    f"You need to provide `Y_df` for reconciler {reconciler_name}"
+                )
+            if stats_method is None or ResidualStatistics.methods.index(
+                method
+            ) > ResidualStatistics.methods.index(stats_method):
+                stats_method = method
+
+        reconciler_args, S_for_dense, S_for_sparse = self._prepare_structure(
+            S_nw=S_nw, tags=tags, id_col=id_col, structure=structure
+        )
+        self._fit_state = dict(
+            S_nw=S_nw,
+            tags=tags,
+            reconciler_args=reconciler_args,
+            S_for_dense=S_for_dense,
+            S_for_sparse=S_for_sparse,
+            is_balanced=is_balanced,
+            id_col=id_col,
+            time_col=time_col,
+            target_col=target_col,
+        )
+        self.residual_stats = {}
+        if stats_method is not None:
+            Y_nw, y_insample = self._prepare_fitted_Y(Y_nw=nw.from_native(Y_df))
+            model_names = [
+                col
+                for col in Y_nw.columns
+                if col not in [id_col, time_col, target_col]
+                and Y_nw.schema[col].is_numeric()
+            ]
+            for model_name in model_names:
+                y_hat_insample = self._prepare_Y(
+                    Y_nw=Y_nw[[id_col, time_col, model_name]],
+                    S_nw=S_nw,
+                    is_balanced=is_balanced,
+                    id_col=id_col,
+                    time_col=time_col,
+                    target_col=model_name,
+                )
+                self.residual_stats[model_name] = ResidualStatistics(
+                    method=stats_method
+                ).update(y_insample, y_hat_insample)
+        return self
+
+    def update(self, Y_df: Frame) -> "HierarchicalReconciliation":
+        """Incremental Update Method.
+
+        Ingests the new rows of the training set into the residual statistics kept by `fit`, the
+        `P` matrices that depend on them are recomputed at the next `predict`.
+
+        **Parameters:**<br>
+        `Y_df`: DataFrame, new rows of the training set, with the same columns as the `Y_df` of `fit`.<br>
+
+        **Returns:**<br>
+        `self`: object, updated reconciliation.
+        """
+        state = self._check_fitted()
+        if not self.residual_stats:
+            return self
+        Y_nw, y_insample = self._prepare_fitted_Y(Y_nw=nw.from_native(Y_df))
+        for model_name, stats in self.residual_stats.items():
+            if model_name not in Y_nw.columns:
+                raise ValueError(
+                    f"Check `Y_df` columns, {reprlib.repr(model_name)} must be in `Y_df` columns."
+                )
+            y_hat_insample = self._prepare_Y(
+                Y_nw=Y_nw[[state["id_col"], state["time_col"], model_name]],
+                S_nw=state["S_nw"],
+                is_balanced=state["is_balanced"],
+                id_col=state["id_col"],
+                time_col=state["time_col"],
+                target_col=model_name,
+            )
+            stats.update(y_insample, y_hat_insample)
+        return self
+
+    def predict(
+        self,
+        Y_hat_df: Frame,
+        level: Optional[list[int]] = None,
+        intervals_method: str = "normality",
+        num_samples: int = -1,
+        seed: int = 0,
+        batched: bool = False,
+        samples_format: str = "wide",
+        validate: str = "full",
+    ) -> FrameT:
+        """Incremental Predict Method.
+
+        Reconciles the base forecasts with the state kept by `fit` and `update`, as `reconcile`.
+
+        **Parameters:**<br>
+        `Y_hat_df`: DataFrame, base forecasts with columns ['unique_id', 'ds'] and models to reconcile.<br>
+        `level`: positive float list [0,100), confidence levels for prediction intervals.<br>
+        `intervals_method`: str, method used to calculate prediction intervals, only `normality`.<br>
+        `num_samples`: int=-1, if positive return that many probabilistic coherent samples.
+        `seed`: int=0, random seed for numpy generator's replicability.<br>
+        `batched`: bool=False, pivot all the models at once and, without `level`, reconcile them with a single projection for reconcilers whose `P` only depends on `S`.<br>
+        `samples_format`: str='wide', layout of the samples, `wide` adds a `{model}-sample-{i}` column per sample, `long` stores a DataFrame with columns `[id_col, time_col, 'sample_idx']` and one column per reconciled model in `self.samples`, and `array` stores a dict with an array of size `(base, horizon, num_samples)` per reconciled model in `self.samples`.<br>
+        `validate`: str='full', checks of the inputs, `full` runs every check, `fast` checks the bottom of `S` from its diagonal and nonzeros and compares the ids with hashed lookups, and `trusted` skips the checks of the data for inputs already validated upstream. The time spent is kept in `self.validation_time`.<br>
+
+        **Returns:**<br>
+        `Y_tilde_df`: DataFrame, with reconciled predictions.
+        """
+        state = self._check_fitted()
+        if any(
+            [method.is_sparse_method for method in self.reconcilers]
+        ) and not nw.dependencies.is_pandas_dataframe(Y_hat_df):
+            raise ValueError(
+                "You have one or more sparse reconciliation methods. Please convert `Y_hat_df` to a pandas DataFrame."
+            )
+
+        # Check input's validity and sort the base forecasts
+        Y_hat_nw, S_nw, _, self.model_names, id_col = self._prepare_fit(
+            Y_hat_nw=nw.from_native(Y_hat_df),
+            S_nw=state["S_nw"],
+            Y_nw=None,
+            tags=state["tags"],
+            level=level,
+            intervals_method=intervals_method,
+            id_col=state["id_col"],
+            time_col=state["time_col"],
+            target_col=state["target_col"],
+            fitted=True,
+            validate=validate,
+        )
+
+        try:
+            return self._reconcile_models(
+                Y_hat_nw=Y_hat_nw,
+                S_nw=S_nw,
+                Y_nw=None,
+                reconciler_args=dict(state["reconciler_args"]),
+                S_for_dense=state["S_for_dense"],
+                S_for_sparse=state["S_for_sparse"],
+                level=level,
+                intervals_method=intervals_method,
+                num_samples=num_samples,
+                seed=seed,
+                id_col=id_col,
+                time_col=state["time_col"],
+                target_col=state["target_col"],
+                batched=batched,
+                residual_stats=self.residual_stats,
+                samples_format=samples_format,
+            )
+        finally:
+            # The fingerprint of S is only reused within a call, as
+            # S can be changed in place before the next one.
+            self._cache.release()
+
+    def _check_fitted(self) -> dict:
+        if self._fit_state is None:
+            raise Exception(
+                "This HierarchicalReconciliation instance is not fitted yet, Call fit method."
+            )
+        return self._fit_state
+
+    def _prepare_fitted_Y(self, Y_nw: Frame) -> tuple[FrameT, np.ndarray]:
+        """
+        Sort the rows of `Y_nw` in the order of the fitted `S` and prepare its target.
+        """
+        state = self._fit_state
+        S_nw, id_col, time_col = state["S_nw"], state["id_col"], state["time_col"]
+        Y_diff = set(Y_nw[id_col]) - set(S_nw[id_col])
+        S_diff = set(S_nw[id_col]) - set(Y_nw[id_col])
+        if Y_diff:
+            raise ValueError(
+                f"There are unique_ids in Y_df that are not in S_df: {reprlib.repr(Y_diff)}"
+            )
+        if S_diff:
+            raise ValueError(
+                f"There are unique_ids in S_df that are not in Y_df: {reprlib.repr(S_diff)}"
+            )
+        Y_nw = _sort_like_S(Y_nw, S_nw, id_col=id_col, time_col=time_col)
+        y_insample = self._prepare_Y(
+            Y_nw=Y_nw,
+            S_nw=S_nw,
+            is_balanced=state["is_balanced"],
+            id_col=id_col,
+            time_col=time_col,
+            target_col=state["target_col"],
+        )
+        return Y_nw, y_insample
+
+    def _prepare_structure(
+        self,
+        S_nw: Frame,
+        tags: dict[str, np.ndarray],
+        id_col: str = "unique_id",
+        structure: Optional[HierarchyStructure] = None,
+    ) -> tuple[dict, Optional[np.ndarray], Optional[sparse.csr_matrix]]:
+        """
+        Prepare the reconciler arguments that only depend on the structure, and the dense and sparse `S`.
+        A `structure` provides them without converting `S_nw`, which then only holds the ids.
+        """
+        if structure is not None and tags is None:
+            tags_idxs = structure.tag_indices
+        else:
+            tags_idxs = {
                 key: S_nw.with_columns(nw.col(id_col).is_in(val).alias("in_cols"))[
                     "in_cols"
                 ]
                 .to_numpy()
                 .nonzero()[0]
                 for key, val in tags.items()
-            },
+            }
+        reconciler_args = dict(
+            idx_bottom=(
+                np.arange(len(S_nw))[-S_nw.shape[1] :]
+                if structure is None
+                else structure.idx_bottom
+            ),
+            tags=tags_idxs,
+            cache=self._cache,
         )
 
         any_sparse = any([method.is_sparse_method for method in self.reconcilers])
+        any_dense = not all([method.is_sparse_method for method in self.reconcilers])
+        if structure is not None:
+            return (
+                reconciler_args,
+                structure.S_dense if any_dense else None,
+                structure.S if any_sparse else None,
+            )
+
         S_nw_cols_ex_id_col = S_nw.columns
         S_nw_cols_ex_id_col.remove(id_col)
+        S_for_dense = None
+        S_for_sparse = None
+        if any_dense:
+            S_for_dense = (
+                S_nw.select(nw.col(S_nw_cols_ex_id_col))
+                .to_numpy()
+                .astype(np.float64, copy=False)
+            )
         if any_sparse:
-            if not nw.dependencies.is_pandas_dataframe(
-                Y_hat_df
-            ) or not nw.dependencies.is_pandas_dataframe(S):
-                raise ValueError(
-                    "You have one or more sparse reconciliation methods. Please convert `S` and `Y_hat_df` to a pandas DataFrame."
-                )
             try:
                 S_for_sparse = sparse.csr_matrix(
                     S_nw.select(nw.col(S_nw_cols_ex_id_col)).to_native().sparse.to_coo()
@@ -418,25 +964,49 @@ class HierarchicalReconciliation:
                     .astype(np.float64, copy=False)
                 )
 
-        if Y_nw is not None:
-            if any_sparse and not nw.dependencies.is_pandas_dataframe(Y_df):
-                raise ValueError(
-                    "You have one or more sparse reconciliation methods. Please convert `Y_df` to a pandas DataFrame."
-                )
-            y_insample = self._prepare_Y(
-                Y_nw=Y_nw,
-                S_nw=S_nw,
-                is_balanced=is_balanced,
-                id_col=id_col,
-                time_col=time_col,
-                target_col=target_col,
+        return reconciler_args, S_for_dense, S_for_sparse
+
+    def _reconcile_models(
+        self,
+        Y_hat_nw: Frame,
+        S_nw: Frame,
+        Y_nw: Optional[Frame],
+        reconciler_args: dict,
+        S_for_dense: Optional[np.ndarray],
+        S_for_sparse: Optional[sparse.csr_matrix],
+        level: Optional[list[int]] = None,
+        intervals_method: str = "normality",
+        num_samples: int = -1,
+        seed: int = 0,
+        is_balanced: bool = False,
+        id_col: str = "unique_id",
+        time_col: str = "ds",
+        target_col: str = "y",
+        temporal: bool = False,
+        batched: bool = False,
+        residual_stats: Optional[dict[str, ResidualStatistics]] = None,
+        samples_format: str = "wide",
+    ) -> FrameT:
+        """
+        Reconcile every model of the sorted `Y_hat_nw` with every reconciler.
+        """
+        if samples_format not in ["wide", "long", "array"]:
+            raise ValueError(f"Unknown samples format: {samples_format}")
+
+        if batched:
+            # Base forecasts of every model with shape (base, horizon, models)
+            y_hat_all = (
+                Y_hat_nw.select(nw.col(self.model_names))
+                .to_numpy()
+                .astype(np.float64, copy=False)
+                .reshape(len(S_nw), -1, len(self.model_names))
             )
-            reconciler_args["y_insample"] = y_insample
 
         Y_tilde_nw = nw.maybe_reset_index(Y_hat_nw.clone())
         self.execution_times = {}
         self.level_names = {}
         self.sample_names = {}
+        self.samples = {}
         for reconciler, name_copy in zip(self.reconcilers, self.orig_reconcilers):
             reconcile_fn_name = _build_fn_name(name_copy)
 
@@ -448,27 +1018,57 @@ class HierarchicalReconciliation:
             if reconciler.is_sparse_method:
                 reconciler_args["S"] = S_for_sparse
             else:
-                reconciler_args["S"] = (
-                    S_nw.select(nw.col(S_nw_cols_ex_id_col))
-                    .to_numpy()
-                    .astype(np.float64, copy=False)
+                reconciler_args["S"] = S_for_dense
+
+            if batched and level is None and reconciler._is_batchable():
+                # Stack the models along the horizon and project them at once
+                start = time.time()
+                n_series, horizon, n_models = y_hat_all.shape
+                reconciler_args["y_hat"] = y_hat_all.reshape(
+                    n_series, horizon * n_models
+                )
+                kwargs_ls = [
+                    key
+                    for key in signature(reconciler.fit_predict).parameters
+                    if key in reconciler_args.keys()
+                ]
+                kwargs = {key: reconciler_args[key] for key in kwargs_ls}
+                fcsts_all = reconciler(**kwargs, level=None)["mean"].reshape(
+                    n_series, horizon, n_models
                 )
+                Y_tilde_nw = Y_tilde_nw.with_columns(
+                    **{
+                        f"{model_name}/{reconcile_fn_name}": fcsts_all[
+                            :, :, i
+                        ].flatten()
+                        for i, model_name in enumerate(self.model_names)
+                    }
+                )
+                end = time.time()
+                for model_name in self.model_names:
+                    self.execution_times[f"{model_name}/{reconcile_fn_name}"] = (
+                        end - start
+                    ) / n_models
+                continue
 
-            for model_name in self.model_names:
+            for i, model_name in enumerate(self.model_names):
                 start = time.time()
                 recmodel_name = f"{model_name}/{reconcile_fn_name}"
 
                 model_cols = [id_col, time_col, model_name]
 
                 # TODO: the below should be method specific
-                y_hat = self._prepare_Y(
-                    Y_nw=Y_hat_nw[model_cols],
-                    S_nw=S_nw,
-                    is_balanced=True,
-                    id_col=id_col,
-                    time_col=time_col,
-                    target_col=model_name,
-                )
+                if batched:
+                    y_hat = np.ascontiguousarray(y_hat_all[:, :, i])
+                else:
+                    y_hat = self._prepare_Y(
+                        Y_nw=Y_hat_nw[model_cols],
+                        S_nw=S_nw,
+                        is_balanced=True,
+                        id_col=id_col,
+                        time_col=time_col,
+                        target_col=model_name,
+                    )
                 reconciler_args["y_hat"] = y_hat
 
                 if Y_nw is not None and model_name in Y_nw.columns:
@@ -481,6 +1081,8 @@ class HierarchicalReconciliation:
                         target_col=model_name,
                     )
                     reconciler_args["y_hat_insample"] = y_hat_insample
+                if residual_stats is not None:
+                    reconciler_args["residual_stats"] = residual_stats.get(model_name)
 
                 if level is not None:
                     reconciler_args["intervals_method"] = intervals_method
@@ -542,20 +1144,51 @@ class HierarchicalReconciliation:
 
                     if num_samples > 0:
                         samples = reconciler.sample(num_samples=num_samples)
-                        self.sample_names[recmodel_name] = [
-                            f"{recmodel_name}-sample-{i}" for i in range(num_samples)
-                        ]
-                        samples = np.reshape(samples, (len(Y_tilde_nw), -1))
-                        y_tilde = dict(zip(self.sample_names[recmodel_name], samples.T))
-                        Y_tilde_nw = Y_tilde_nw.with_columns(**y_tilde)
+                        if samples_format == "wide":
+                            self.sample_names[recmodel_name] = [
+                                f"{recmodel_name}-sample-{i}"
+                                for i in range(num_samples)
+                            ]
+                            samples = np.reshape(samples, (len(Y_tilde_nw), -1))
+                            y_tilde = dict(
+                                zip(self.sample_names[recmodel_name], samples.T)
+                            )
+                            Y_tilde_nw = Y_tilde_nw.with_columns(**y_tilde)
+                        else:
+                            self.samples[recmodel_name] = samples
 
                 end = time.time()
                 self.execution_times[f"{model_name}/{reconcile_fn_name}"] = end - start
 
+        if samples_format == "long" and self.samples:
+            self.samples = self._samples_to_long(
+                Y_tilde_nw=Y_tilde_nw, id_col=id_col, time_col=time_col
+            )
+
         Y_tilde_df = Y_tilde_nw.to_native()
 
         return Y_tilde_df
 
+    def _samples_to_long(self, Y_tilde_nw: Frame, id_col: str, time_col: str) -> FrameT:
+        """
+        Long DataFrame with a row per sample of every row of `Y_tilde_nw` and a column per reconciled model.
+        """
+        n_rows = len(Y_tilde_nw)
+        num_samples = next(iter(self.samples.values())).shape[-1]
+        rows = np.repeat(np.arange(n_rows), num_samples)
+        keys_nw = nw.maybe_reset_index(Y_tilde_nw.select([id_col, time_col])[rows])
+        samples_nw = nw.from_dict(
+            {
+                "sample_idx": np.tile(np.arange(num_samples), n_rows),
+                **{
+                    recmodel_name: samples.reshape(-1)
+                    for recmodel_name, samples in self.samples.items()
+                },
+            },
+            backend=nw.get_native_namespace(Y_tilde_nw),
+        )
+        return nw.concat([keys_nw, samples_nw], how="horizontal").to_native()
+
     def bootstrap_reconcile(
         self,
         Y_hat_df: Frame,
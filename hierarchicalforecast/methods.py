@@ -2,33 +2,68 @@
 
 # %% auto 0
 __all__ = ['BottomUp', 'BottomUpSparse', 'TopDown', 'TopDownSparse', 'MiddleOut', 'MiddleOutSparse', 'MinTrace', 'MinTraceSparse',
-           'OptimalCombination', 'ERM']
+           'OptimalCombination', 'ERM', 'ReconciliationArtifact']
 
 # %% ../nbs/src/methods.ipynb 3
+import threading
 import warnings
 from collections import OrderedDict
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from copy import deepcopy
+from functools import wraps
+from inspect import signature
 from typing import Optional, Union
 
 import clarabel
 import numpy as np
 from quadprog import solve_qp
 from scipy import sparse
+from scipy.linalg import cho_factor, cho_solve, solve_triangular
+from scipy.stats import norm
 
 # %% ../nbs/src/methods.ipynb 4
 from .probabilistic_methods import PERMBU, Bootstrap, Normality
 from hierarchicalforecast.utils import (
+    HierarchyStructure,
+    ResidualStatistics,
+    _FactoredCovariance,
+    _StructureCache,
     _construct_adjacency_matrix,
+    _csr_matmul,
+    _hierarchical_covariance_pattern,
     _is_strictly_hierarchical,
-    _lasso,
+    _kron_lasso,
+    _load_npz,
     _ma_cov,
+    _shrunk_covariance_schaferstrimmer_factored,
     _shrunk_covariance_schaferstrimmer_no_nans,
+    _shrunk_covariance_schaferstrimmer_sparse,
     _shrunk_covariance_schaferstrimmer_with_nans,
     is_strictly_hierarchical,
 )
 
 # %% ../nbs/src/methods.ipynb 6
+def _accepts_structure(fn):
+    # Wraps the `fit` or `fit_predict` method `fn` so that it takes a `HierarchyStructure`
+    # as `S`, which stands for `S` and, when they are not given, `idx_bottom` and `tags`.
+    sig = signature(fn)
+
+    @wraps(fn)
+    def wrapper(self, *args, **kwargs):
+        S = kwargs["S"] if "S" in kwargs else (args[0] if args else None)
+        if not isinstance(S, HierarchyStructure):
+            return fn(self, *args, **kwargs)
+        bound = sig.bind_partial(self, *args, **kwargs)
+        bound.arguments["S"] = S.S if self.is_sparse_method else S.S_dense
+        if "idx_bottom" in sig.parameters and bound.arguments.get("idx_bottom") is None:
+            bound.arguments["idx_bottom"] = S.idx_bottom
+        if "tags" in sig.parameters and bound.arguments.get("tags") is None:
+            bound.arguments["tags"] = S.tag_indices
+        return fn(*bound.args, **bound.kwargs)
+
+    return wrapper
+
+
 class HReconciler:
     fitted = False
     is_sparse_method = False
@@ -36,6 +71,12 @@ class HReconciler:
     P = None
     sampler = None
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for name in ["fit", "fit_predict", "__call__"]:
+            if name in cls.__dict__:
+                setattr(cls, name, _accepts_structure(cls.__dict__[name]))
+
     def _get_sampler(
         self,
         intervals_method,
@@ -103,6 +144,30 @@ class HReconciler:
 
         return res
 
+    def _structural_key(self) -> Optional[tuple]:
+        # Hashable parameters that, together with `S`, determine the P and W
+        # matrices, or None if they also depend on the forecasts or residuals.
+        return None
+
+    def _is_batchable(self) -> bool:
+        # Whether the reconciled forecasts are a linear projection that only
+        # depends on `S`, so that the forecasts of several models can be
+        # stacked along the horizon and reconciled at once.
+        return False
+
+    def _get_cached_PW_matrices(
+        self, S: np.ndarray, cache: Optional[_StructureCache] = None, **kwargs
+    ):
+        key = None if cache is None else self._structural_key()
+        if key is None:
+            return self._get_PW_matrices(S=S, **kwargs)
+        key = (cache.fingerprint(S), *key)
+        PW = cache.get(key)
+        if PW is None:
+            PW = self._get_PW_matrices(S=S, **kwargs)
+            cache.put(key, PW)
+        return PW
+
     def predict(
         self, S: np.ndarray, y_hat: np.ndarray, level: Optional[list[int]] = None
     ):
@@ -111,7 +176,7 @@ class HReconciler:
         Predict using fitted mean and probabilistic reconcilers.
 
         **Parameters:**<br>
-        `S`: Summing matrix of size (`base`, `bottom`).<br>
+        `S`: Summing matrix of size (`base`, `bottom`), or a `HierarchyStructure`.<br>
         `y_hat`: Forecast values of size (`base`, `horizon`).<br>
         `level`: float list 0-100, confidence levels for prediction intervals.<br>
 
@@ -120,6 +185,8 @@ class HReconciler:
         """
         if not self.fitted:
             raise Exception("This model instance is not fitted yet, Call fit method.")
+        if isinstance(S, HierarchyStructure):
+            S = S.S
 
         return self._reconcile(
             S=S, P=self.P, y_hat=y_hat, sampler=self.sampler, level=level
@@ -186,6 +253,12 @@ class BottomUp(HReconciler):
             W = np.eye(n_hiers, dtype=np.float64)
         return P, W
 
+    def _structural_key(self):
+        return (type(self).__name__, self.intervals_method is None)
+
+    def _is_batchable(self):
+        return True
+
     def fit(
         self,
         S: np.ndarray,
@@ -198,6 +271,7 @@ class BottomUp(HReconciler):
         num_samples: Optional[int] = None,
         seed: Optional[int] = None,
         tags: Optional[dict[str, np.ndarray]] = None,
+        cache: Optional[_StructureCache] = None,
     ):
         """Bottom Up Fit Method.
 
@@ -212,12 +286,15 @@ class BottomUp(HReconciler):
         `num_samples`: Number of samples for probabilistic coherent distribution.<br>
         `seed`: Seed for reproducibility.<br>
         `**sampler_kwargs`: Coherent sampler instantiation arguments.<br>
+        `cache`: Optional store to share `P` and `W` across calls with the same `S`.<br>
 
         **Returns:**<br>
         `self`: object, fitted reconciler.
         """
         self.intervals_method = intervals_method
-        self.P, self.W = self._get_PW_matrices(S=S, idx_bottom=idx_bottom)
+        self.P, self.W = self._get_cached_PW_matrices(
+            S=S, cache=cache, idx_bottom=idx_bottom
+        )
         self.sampler = self._get_sampler(
             S=S,
             P=self.P,
@@ -247,6 +324,7 @@ class BottomUp(HReconciler):
         num_samples: Optional[int] = None,
         seed: Optional[int] = None,
         tags: Optional[dict[str, np.ndarray]] = None,
+        cache: Optional[_StructureCache] = None,
     ):
         """BottomUp Reconciliation Method.
 
@@ -262,6 +340,7 @@ class BottomUp(HReconciler):
         `num_samples`: Number of samples for probabilistic coherent distribution.<br>
         `seed`: Seed for reproducibility.<br>
         `**sampler_kwargs`: Coherent sampler instantiation arguments.<br>
+        `cache`: Optional store to share `P` and `W` across calls with the same `S`.<br>
 
         **Returns:**<br>
         `y_tilde`: Reconciliated y_hat using the Bottom Up approach.
@@ -278,6 +357,7 @@ class BottomUp(HReconciler):
             seed=seed,
             tags=tags,
             idx_bottom=idx_bottom,
+            cache=cache,
         )
 
         return self._reconcile(
@@ -999,6 +1079,38 @@ class MinTrace(HReconciler):
         if not self.nonnegative and self.num_threads > 1:
             warnings.warn("`num_threads` is only used when `nonnegative=True`")
 
+    def _get_P_factored(self, S: np.ndarray, W: _FactoredCovariance) -> np.ndarray:
+        # Closed form P for W = D + U U', e.g., diagonal or shrunk with fewer
+        # observations than series, without forming any (n_hiers, n_hiers)
+        # array, factorizing the smaller of the (n_bottom, n_bottom) and
+        # (n_aggs, n_aggs) positive definite systems.
+        n_hiers, n_bottom = S.shape
+        n_aggs = n_hiers - n_bottom
+        is_identity = np.count_nonzero(S[n_aggs:]) == n_bottom and np.all(
+            np.diagonal(S[n_aggs:]) == 1.0
+        )
+        if (n_bottom <= n_aggs and np.all(W.d > 0.0)) or not is_identity:
+            # P = (S' W^-1 S)^-1 S' W^-1, with W^-1 from the Woodbury identity
+            StWinv = W.solve(S).T
+            G = cho_factor(StWinv @ S)
+            return cho_solve(G, StWinv)
+        # With S = [S_a; I] and C = [I | -S_a], the zero-constrained
+        # representation gives P = [0 | I] - (W C')_b M^-1 C, with
+        # M = C W C' = D_a + S_a D_b S_a' + (C U)(C U)'
+        S_a = S[:n_aggs]
+        S_aD_b = S_a * W.d[n_aggs:]
+        CU = W.U[:n_aggs] - S_a @ W.U[n_aggs:]
+        M = S_aD_b @ S_a.T + CU @ CU.T
+        M[np.diag_indices(n_aggs)] += W.d[:n_aggs]
+        M = cho_factor(M)
+        # (W C')_b = -D_b S_a' + U_b (C U)'
+        WCt_b = W.U[n_aggs:] @ CU.T - S_aD_b.T
+        P = np.empty((n_bottom, n_hiers), dtype=np.float64)
+        P[:, :n_aggs] = -cho_solve(M, WCt_b.T).T
+        P[:, n_aggs:] = -P[:, :n_aggs] @ S_a
+        P[:, n_aggs:][np.diag_indices(n_bottom)] += 1.0
+        return P
+
     def _get_PW_matrices(
         self,
         S: np.ndarray,
@@ -1006,29 +1118,40 @@ class MinTrace(HReconciler):
         y_insample: Optional[np.ndarray] = None,
         y_hat_insample: Optional[np.ndarray] = None,
         idx_bottom: Optional[list[int]] = None,
+        residual_stats: Optional[ResidualStatistics] = None,
     ):
         # shape residuals_insample (n_hiers, obs)
         res_methods = ["wls_var", "mint_cov", "mint_shrink"]
-        if self.method in res_methods and (
-            y_insample is None or y_hat_insample is None
+        if (
+            self.method in res_methods
+            and (y_insample is None or y_hat_insample is None)
+            and residual_stats is None
         ):
             raise ValueError(
                 f"Check `Y_df`. For method `{self.method}` you need to pass insample predictions and insample values."
             )
         n_hiers, n_bottom = S.shape
         n_aggs = n_hiers - n_bottom
-        # Construct J and U.T
-        J = np.concatenate(
-            (np.zeros((n_bottom, n_aggs), dtype=np.float64), S[n_aggs:]), axis=1
-        )
-        Ut = np.concatenate((np.eye(n_aggs, dtype=np.float64), -S[:n_aggs]), axis=1)
         if self.method == "ols":
-            W = np.eye(n_hiers)
-            UtW = Ut
+            Wdiag = np.ones(n_hiers, dtype=np.float64)
         elif self.method == "wls_struct":
             Wdiag = np.sum(S, axis=1, dtype=np.float64)
-            UtW = Ut * Wdiag
-            W = np.diag(Wdiag)
+        elif self.method in res_methods and residual_stats is not None:
+            residual_stats._check_method(self.method)
+            # Protection: against overfitted model
+            zero_residual_prc = np.mean(np.abs(residual_stats.residuals_sum) < 1e-4)
+            if zero_residual_prc > 0.98:
+                raise Exception(
+                    f"Insample residuals close to 0, zero_residual_prc={zero_residual_prc}. Check `Y_df`"
+                )
+
+            if self.method == "wls_var":
+                Wdiag = residual_stats.squares_sum / residual_stats.n_samples
+                Wdiag += np.full(n_hiers, 2e-8, dtype=np.float64)
+            elif self.method == "mint_cov":
+                W = residual_stats.covariance()
+            elif self.method == "mint_shrink":
+                W = residual_stats.shrunk_covariance(self.mint_shr_ridge)
         elif (
             self.method in res_methods
             and y_insample is not None
@@ -1053,17 +1176,16 @@ class MinTrace(HReconciler):
                     / residuals.shape[0]
                 )
                 Wdiag += np.full(n_hiers, 2e-8, dtype=np.float64)
-                W = np.diag(Wdiag)
-                UtW = Ut * Wdiag
             elif self.method == "mint_cov":
                 # Compute nans
                 nan_mask = np.isnan(residuals.T)
                 if np.any(nan_mask):
                     W = _ma_cov(residuals.T, ~nan_mask)
                 else:
+                    # Not factored with fewer observations than series, as the
+                    # low rank covariance has no diagonal part to keep the
+                    # aggregate level system of the factored solver definite.
                     W = np.cov(residuals.T)
-
-                UtW = Ut @ W
             elif self.method == "mint_shrink":
                 # Compute nans
                 nan_mask = np.isnan(residuals.T)
@@ -1072,24 +1194,53 @@ class MinTrace(HReconciler):
                     W = _shrunk_covariance_schaferstrimmer_with_nans(
                         residuals.T, ~nan_mask, self.mint_shr_ridge
                     )
+                elif n < n_hiers:
+                    # Diagonal plus low rank, keep the (n_hiers, obs) factor
+                    W = _shrunk_covariance_schaferstrimmer_factored(
+                        residuals.T, self.mint_shr_ridge
+                    )
+                    if not np.all(W.d > 1e-8 * W.diagonal()):
+                        # Without shrinkage, up to rounding, the diagonal part
+                        # vanishes and the aggregate level system of the
+                        # factored solver is singular, so solve with the
+                        # dense covariance instead.
+                        W = _shrunk_covariance_schaferstrimmer_no_nans(
+                            residuals.T, self.mint_shr_ridge
+                        )
                 else:
                     W = _shrunk_covariance_schaferstrimmer_no_nans(
                         residuals.T, self.mint_shr_ridge
                     )
-
-                UtW = Ut @ W
         else:
             raise ValueError(f"Unknown reconciliation method {self.method}")
 
         try:
-            P = (
-                J
-                - np.linalg.solve(
-                    UtW[:, n_aggs:] @ Ut.T[n_aggs:] + UtW[:, :n_aggs],
-                    UtW[:, n_aggs:] @ J.T[n_aggs:],
-                ).T
-                @ Ut
-            )
+            if self.method in ["ols", "wls_struct", "wls_var"]:
+                # Diagonal W, kept sparse to avoid any (n_hiers, n_hiers) array
+                P = self._get_P_factored(
+                    S=S, W=_FactoredCovariance(Wdiag, np.empty((n_hiers, 0)))
+                )
+                W = sparse.spdiags(Wdiag, 0, n_hiers, n_hiers)
+            elif isinstance(W, _FactoredCovariance):
+                P = self._get_P_factored(S=S, W=W)
+            else:
+                # Construct J and U.T
+                J = np.concatenate(
+                    (np.zeros((n_bottom, n_aggs), dtype=np.float64), S[n_aggs:]),
+                    axis=1,
+                )
+                Ut = np.concatenate(
+                    (np.eye(n_aggs, dtype=np.float64), -S[:n_aggs]), axis=1
+                )
+                UtW = Ut @ W
+                P = (
+                    J
+                    - np.linalg.solve(
+                        UtW[:, n_aggs:] @ Ut.T[n_aggs:] + UtW[:, :n_aggs],
+                        UtW[:, n_aggs:] @ J.T[n_aggs:],
+                    ).T
+                    @ Ut
+                )
         except np.linalg.LinAlgError:
             if self.method == "mint_shrink":
                 raise Exception(
@@ -1102,6 +1253,99 @@ class MinTrace(HReconciler):
 
         return P, W
 
+    def _get_qp_factors(
+        self, S: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        # The linear term S'W^-1, the quadratic term G = S'W^-1S, its lower
+        # Cholesky factor L and the inverse of R = L', which is what quadprog
+        # takes to skip its own factorization, only depend on S and W.
+        _, n_bottom = S.shape
+        if sparse.issparse(self.W):
+            a = S.T * np.reciprocal(self.W.diagonal())
+        elif isinstance(self.W, _FactoredCovariance):
+            a = self.W.solve(S).T
+        else:
+            a = S.T @ np.linalg.pinv(self.W)
+        G = a @ S
+        try:
+            L = np.linalg.cholesky(G)
+        except np.linalg.LinAlgError:
+            raise Exception(
+                f"min_trace ({self.method}) is ill-conditioned. Try setting nonnegative=False or use another reconciliation method."
+            )
+        R_inv = solve_triangular(L.T, np.eye(n_bottom), lower=False)
+        return a, G, L, R_inv
+
+    def _solve_qp(
+        self,
+        a: np.ndarray,
+        G: np.ndarray,
+        L: np.ndarray,
+        R_inv: np.ndarray,
+        y_hat: np.ndarray,
+    ) -> np.ndarray:
+        n_bottom = G.shape[0]
+        B = a @ y_hat
+        # The unconstrained solution is already optimal for the forecasts
+        # where it is nonnegative.
+        bottom_fcts = cho_solve((L, True), B)
+        pending = np.flatnonzero(np.any(bottom_fcts < 0, axis=0))
+        C = np.eye(n_bottom)
+        b = np.zeros(n_bottom)
+        if self.num_threads == 1:
+            active = None
+            free_factor = None
+            for j in pending:
+                x = None
+                if active is not None and not np.all(active):
+                    # Warm start from the active set of the previous horizon,
+                    # solving the equality constrained problem on the free
+                    # variables and keeping the solution if it satisfies the
+                    # optimality conditions.
+                    if free_factor is None:
+                        free_factor = cho_factor(G[np.ix_(~active, ~active)])
+                    x = np.zeros(n_bottom)
+                    x[~active] = cho_solve(free_factor, B[~active, j])
+                    gradient = G[active] @ x - B[active, j]
+                    eps = 1e-10 * max(1.0, np.max(np.abs(B[:, j])))
+                    if np.any(x < 0) or np.any(gradient < -eps):
+                        x = None
+                if x is None:
+                    x, _, _, _, lagrangian, _ = solve_qp(
+                        G=R_inv, a=B[:, j], C=C, b=b, factorized=True
+                    )
+                    active = lagrangian > 0
+                    free_factor = None
+                bottom_fcts[:, j] = x
+        else:
+            with ThreadPoolExecutor(self.num_threads) as executor:
+                futures = [
+                    executor.submit(
+                        solve_qp, G=R_inv, a=B[:, j], C=C, b=b, factorized=True
+                    )
+                    for j in pending
+                ]
+                for j, future in zip(pending, futures):
+                    bottom_fcts[:, j] = future.result()[0]
+        return bottom_fcts
+
+    def _structural_key(self):
+        if self.method in ["ols", "wls_struct"]:
+            return (type(self).__name__, self.method)
+        residual_stats_version = getattr(self, "_residual_stats_version", None)
+        if residual_stats_version is not None:
+            # W only changes with the updates of the streamed residual statistics
+            return (
+                type(self).__name__,
+                self.method,
+                getattr(self, "mint_shr_ridge", None),
+                residual_stats_version,
+            )
+        return None
+
+    def _is_batchable(self):
+        return self.method in ["ols", "wls_struct"] and not self.nonnegative
+
     def fit(
         self,
         S,
@@ -1114,6 +1358,8 @@ class MinTrace(HReconciler):
         seed: Optional[int] = None,
         tags: Optional[dict[str, np.ndarray]] = None,
         idx_bottom: Optional[np.ndarray] = None,
+        cache: Optional[_StructureCache] = None,
+        residual_stats: Optional[ResidualStatistics] = None,
     ):
         """MinTrace Fit Method.
 
@@ -1128,22 +1374,35 @@ class MinTrace(HReconciler):
         `seed`: Seed for reproducibility.<br>
         `tags`: Each key is a level and each value its `S` indices.<br>
         `idx_bottom`: Indices corresponding to the bottom level of `S`, size (`bottom`).<br>
+        `cache`: Optional store to share `P` and `W` across calls with the same `S`, only used with "ols", "wls_struct".<br>
+        `residual_stats`: Optional streamed residual statistics used in place of `y_insample` and `y_hat_insample` by "wls_var", "mint_cov", "mint_shrink".<br>
 
         **Returns:**<br>
         `self`: object, fitted reconciler.
         """
+        if (
+            residual_stats is not None
+            and y_insample is None
+            and intervals_method in ["bootstrap", "permbu"]
+        ):
+            raise ValueError(
+                f"`{intervals_method}` intervals need `y_insample` and `y_hat_insample`, not `residual_stats`."
+            )
+        self._residual_stats_version = (
+            None if residual_stats is None else residual_stats.version
+        )
         self.y_hat = y_hat
-        self.P, self.W = self._get_PW_matrices(
+        self.P, self.W = self._get_cached_PW_matrices(
             S=S,
+            cache=cache,
             y_hat=y_hat,
             y_insample=y_insample,
             y_hat_insample=y_hat_insample,
             idx_bottom=idx_bottom,
+            residual_stats=residual_stats,
         )
 
         if self.nonnegative:
-            _, n_bottom = S.shape
-            W_inv = np.linalg.pinv(self.W)
             negatives = y_hat < 0
             if negatives.any():
                 warnings.warn("Replacing negative forecasts with zero.")
@@ -1156,33 +1415,18 @@ class MinTrace(HReconciler):
             # The library quadprog was chosen
             # based on these benchmarks:
             # https://scaron.info/blog/quadratic-programming-in-python.html
-            a = S.T @ W_inv
-            G = a @ S
-            try:
-                _ = np.linalg.cholesky(G)
-            except np.linalg.LinAlgError:
-                raise Exception(
-                    f"min_trace ({self.method}) is ill-conditioned. Try setting nonnegative=False or use another reconciliation method."
-                )
-            C = np.eye(n_bottom)
-            b = np.zeros(n_bottom)
+            key = None if cache is None else self._structural_key()
+            if key is None:
+                qp_factors = self._get_qp_factors(S=S)
+            else:
+                key = (cache.fingerprint(S), *key, "qp")
+                qp_factors = cache.get(key)
+                if qp_factors is None:
+                    qp_factors = self._get_qp_factors(S=S)
+                    cache.put(key, qp_factors)
             # the quadratic programming problem
             # returns the forecasts of the bottom series
-            if self.num_threads == 1:
-                bottom_fcts = np.apply_along_axis(
-                    lambda y_hat: solve_qp(G=G, a=a @ y_hat, C=C, b=b)[0],
-                    axis=0,
-                    arr=y_hat,
-                )
-            else:
-                futures = []
-                with ThreadPoolExecutor(self.num_threads) as executor:
-                    for j in range(y_hat.shape[1]):
-                        future = executor.submit(
-                            solve_qp, G=G, a=a @ y_hat[:, j], C=C, b=b
-                        )
-                        futures.append(future)
-                    bottom_fcts = np.hstack([f.result()[0][:, None] for f in futures])
+            bottom_fcts = self._solve_qp(*qp_factors, y_hat=y_hat)
             if not np.all(bottom_fcts > -1e-8):
                 raise Exception("nonnegative optimization failed")
             # remove negative values close to zero
@@ -1221,6 +1465,8 @@ class MinTrace(HReconciler):
         num_samples: Optional[int] = None,
         seed: Optional[int] = None,
         tags: Optional[dict[str, np.ndarray]] = None,
+        cache: Optional[_StructureCache] = None,
+        residual_stats: Optional[ResidualStatistics] = None,
     ):
         """MinTrace Reconciliation Method.
 
@@ -1236,6 +1482,8 @@ class MinTrace(HReconciler):
         `num_samples`: Number of samples for probabilistic coherent distribution.<br>
         `seed`: Seed for reproducibility.<br>
         `tags`: Each key is a level and each value its `S` indices.<br>
+        `cache`: Optional store to share `P` and `W` across calls with the same `S`, only used by `ols`, `wls_struct`.<br>
+        `residual_stats`: Optional streamed residual statistics used in place of `y_insample` and `y_hat_insample` by `wls_var`, `mint_cov`, `mint_shrink`.<br>
 
         **Returns:**<br>
         `y_tilde`: Reconciliated y_hat using the MinTrace approach.
@@ -1262,6 +1510,8 @@ class MinTrace(HReconciler):
             seed=seed,
             tags=tags,
             idx_bottom=idx_bottom,
+            cache=cache,
+            residual_stats=residual_stats,
         )
 
         return self._reconcile(
@@ -1281,11 +1531,31 @@ class MinTraceSparse(MinTrace):
     See the parent class for more details.<br>
 
     **Parameters:**<br>
-    `method`: str, one of `ols`, `wls_struct`, or `wls_var`.<br>
+    `method`: str, one of `ols`, `wls_struct`, `wls_var`, or `mint_shrink`. With `mint_shrink`, only the covariances
+    between series that share a parent or a subtree are estimated and shrunk, which requires a strictly hierarchical structure.<br>
     `nonnegative`: bool, return non-negative reconciled forecasts.<br>
     `num_threads`: int, number of threads to execute non-negative quadratic programming calls.<br>
     `qp`: bool, implement non-negativity constraint with a quadratic programming approach. Setting
     this to True generally gives better results, but at the expense of higher cost to compute. <br>
+    `solver`: str, one of `bicgstab`, `direct`, or `cg`. With `bicgstab`, the sparse linear system is solved
+    iteratively for each forecast. With `direct`, the sparse linear system is factorized
+    once and the factorization is reused to solve for all the forecasts at once. With `cg`, the system is solved with
+    preconditioned conjugate gradient, warm starting each horizon from the solution of the previous one.<br>
+    `preconditioner`: str, one of `block_jacobi` or `jacobi`, only used with `cg`. The `block_jacobi` preconditioner
+    inverts the blocks of the system for the bottom level series that share a parent, whereas `jacobi` only uses its diagonal.
+    With `mint_shrink`, the aggregate level system is solved instead, always with the `jacobi` preconditioner.<br>
+    `tol`: float, relative tolerance of the residual norm, only used with `cg`.<br>
+    `maxiter`: int, maximum number of iterations for each forecast, only used with `cg`.<br>
+    `mint_shr_ridge`: float=2e-8, ridge numeric protection to MinTrace-shr covariance estimator.<br>
+    `qp_formulation`: str, one of `full` or `bottom`, only used with `qp`. With `full`, the problem is posed over all
+    of the series with an equality constraint for each aggregate. With `bottom`, it is posed over the bottom level series
+    with only the nonnegativity constraints, which has a smaller system that is however dense as soon as a series
+    aggregates all of the bottom level ones.<br>
+    `apg`: bool, implement non-negativity constraint with accelerated projected gradient, which takes precedence over `qp`.
+    It only needs products with the sparse matrices for all of the forecasts at once, starting from the clipped solution,
+    so it scales to very large hierarchies at a small loss of accuracy compared to the quadratic programming approach.<br>
+    `apg_tol`: float, relative tolerance of the step size, only used with `apg`.<br>
+    `apg_maxiter`: int, maximum number of iterations, only used with `apg`.<br>
     """
 
     is_sparse_method = True
@@ -1296,15 +1566,263 @@ class MinTraceSparse(MinTrace):
         nonnegative: bool = False,
         num_threads: int = 1,
         qp: bool = True,
+        solver: str = "bicgstab",
+        preconditioner: str = "block_jacobi",
+        tol: float = 1e-8,
+        maxiter: Optional[int] = None,
+        mint_shr_ridge: Optional[float] = 2e-8,
+        qp_formulation: str = "full",
+        apg: bool = False,
+        apg_tol: float = 1e-6,
+        apg_maxiter: int = 1000,
     ) -> None:
-        if method not in ["ols", "wls_struct", "wls_var"]:
+        if method not in ["ols", "wls_struct", "wls_var", "mint_shrink"]:
+            raise ValueError(
+                f"Unknown method `{method}`. Choose from `ols`, `wls_struct`, `wls_var`, or `mint_shrink`."
+            )
+        if qp_formulation not in ["full", "bottom"]:
+            raise ValueError(
+                f"Unknown QP formulation `{qp_formulation}`. Choose from `full` or `bottom`."
+            )
+        if method == "mint_shrink" and nonnegative and qp and not apg:
+            raise ValueError(
+                "The quadratic programming approach needs a diagonal covariance matrix, set `qp=False` with `mint_shrink`."
+            )
+        if solver not in ["bicgstab", "direct", "cg"]:
+            raise ValueError(
+                f"Unknown solver `{solver}`. Choose from `bicgstab`, `direct`, or `cg`."
+            )
+        if preconditioner not in ["block_jacobi", "jacobi"]:
             raise ValueError(
-                f"Unknown method `{method}`. Choose from `ols`, `wls_struct`, or `wls_var`."
+                f"Unknown preconditioner `{preconditioner}`. Choose from `block_jacobi` or `jacobi`."
             )
         # Call the parent constructor.
-        super().__init__(method, nonnegative, num_threads=num_threads)
+        super().__init__(
+            method, nonnegative, mint_shr_ridge=mint_shr_ridge, num_threads=num_threads
+        )
         # Assign the attributes specific to the sparse class.
         self.qp = qp
+        self.qp_formulation = qp_formulation
+        self.apg = apg
+        if apg:
+            self.apg_tol = apg_tol
+            self.apg_maxiter = apg_maxiter
+        self.solver = solver
+        if solver == "cg":
+            self.preconditioner = preconditioner
+            self.tol = tol
+            self.maxiter = maxiter
+
+    @property
+    def solver_info(self) -> Optional[dict[str, np.ndarray]]:
+        """Iterations and residual norms for each forecast of the last `cg` solve."""
+        return getattr(self.P, "info", None)
+
+    def _get_preconditioner(
+        self, S: sparse.csr_matrix, W_diag: np.ndarray, max_block_size: int = 256
+    ) -> sparse.linalg.LinearOperator:
+        n_hiers, n_bottom = S.shape
+        n_aggs = n_hiers - n_bottom
+        if self.preconditioner == "jacobi":
+            # Diagonal of S'W^-1S
+            A_diag = S.multiply(S).T @ np.reciprocal(W_diag)
+            return sparse.linalg.aslinearoperator(sparse.diags(np.reciprocal(A_diag)))
+        # Assign each bottom level series to its smallest aggregate, i.e., its
+        # parent in a strictly hierarchical structure. Siblings form a block,
+        # unless there are too many of them.
+        S_a = S[:n_aggs].tocoo()
+        order = np.lexsort((S_a.row, S.getnnz(axis=1)[S_a.row], S_a.col))
+        cols, first = np.unique(S_a.col[order], return_index=True)
+        parents = np.arange(n_aggs, n_aggs + n_bottom)
+        parents[cols] = S_a.row[order][first]
+        _, blocks = np.unique(parents, return_inverse=True)
+        too_large = np.bincount(blocks)[blocks] > max_block_size
+        blocks[too_large] = blocks.max() + 1 + np.arange(np.sum(too_large))
+        # Splitting every row of W^-1/2 S by block, the Gram matrix of the
+        # split rows is the block diagonal part of S'W^-1S.
+        S_w = sparse.coo_matrix(S.multiply(np.reciprocal(np.sqrt(W_diag))[:, None]))
+        _, rows = np.unique(
+            S_w.row.astype(np.int64) * (blocks.max() + 1) + blocks[S_w.col],
+            return_inverse=True,
+        )
+        Q = sparse.csr_matrix(
+            (S_w.data, (rows, S_w.col)), shape=(rows.max() + 1, n_bottom)
+        )
+        # The blocks are dense, so the factorization has no fill-in outside them.
+        lu = sparse.linalg.splu(sparse.csc_matrix(Q.T @ Q), permc_spec="NATURAL")
+        return sparse.linalg.LinearOperator(
+            (n_bottom, n_bottom), matvec=lu.solve, dtype=np.float64
+        )
+
+    def _solve_apg(
+        self, S: sparse.csr_matrix, y_hat: np.ndarray, x0: np.ndarray
+    ) -> np.ndarray:
+        # Minimize 1/2 ||S x - y_hat||^2 weighted by W^-1 subject to x >= 0 for
+        # all of the forecasts at once with FISTA and adaptive restarts. The
+        # variables are scaled by the diagonal of S'W^-1S, which keeps the
+        # projection onto the constraints a clipping.
+        w_inv = np.reciprocal(self.W.diagonal())
+        d = np.reciprocal(np.sqrt(S.multiply(S).T @ w_inv))
+        S_d = sparse.csr_matrix(S @ sparse.diags(d))
+        if sparse.issparse(self.W) and self.W.nnz > self.W.shape[0]:
+            lu = sparse.linalg.splu(sparse.csc_matrix(self.W))
+            S_dT = sparse.csr_matrix(S_d.T)
+
+            def apply_S_dTW_inv(V):
+                return S_dT @ lu.solve(V)
+
+            # Estimate the Lipschitz constant with the power method.
+            v = np.ones(S.shape[1])
+            for _ in range(30):
+                v = apply_S_dTW_inv(S_d @ v)
+                L = np.linalg.norm(v)
+                v /= L
+            L *= 1.1
+        else:
+            S_dTW_inv = sparse.csr_matrix(S_d.T @ sparse.diags(w_inv))
+
+            def apply_S_dTW_inv(V):
+                return S_dTW_inv @ V
+
+            # The largest row sum of the nonnegative scaled S'W^-1S bounds its
+            # largest eigenvalue.
+            L = np.max(S_dTW_inv @ (S_d @ np.ones(S.shape[1])))
+        b = apply_S_dTW_inv(y_hat)
+
+        def gradient(Z):
+            return apply_S_dTW_inv(S_d @ Z) - b
+
+        d = d[:, None]
+        Z = x0 / d
+        Y = Z
+        t = np.ones(Z.shape[1])
+        for _ in range(self.apg_maxiter):
+            Z_next = np.maximum(Y - gradient(Y) / L, 0.0)
+            step = Z_next - Z
+            if np.all(
+                np.linalg.norm(step, axis=0)
+                <= self.apg_tol * np.maximum(np.linalg.norm(Z_next, axis=0), 1.0)
+            ):
+                Z = Z_next
+                break
+            # Restart the momentum of the forecasts moving against the gradient.
+            restart = np.sum((Y - Z_next) * step, axis=0) > 0
+            t_next = (1.0 + np.sqrt(1.0 + 4.0 * t**2)) / 2.0
+            beta = np.where(restart, 0.0, (t - 1.0) / t_next)
+            t = np.where(restart, 1.0, t_next)
+            Y = Z_next + beta * step
+            Z = Z_next
+        else:
+            warnings.warn(
+                f"Accelerated projected gradient did not converge in {self.apg_maxiter} iterations."
+            )
+        return d * Z
+
+    def _solve_cg(
+        self,
+        A: sparse.linalg.LinearOperator,
+        B: np.ndarray,
+        M: sparse.linalg.LinearOperator,
+    ) -> tuple[np.ndarray, dict[str, np.ndarray]]:
+        X = np.empty_like(B)
+        iterations = np.zeros(B.shape[1], dtype=np.int64)
+        residuals = np.empty(B.shape[1], dtype=np.float64)
+        x0 = None
+        for j in range(B.shape[1]):
+
+            def count_iterations(xk, j=j):
+                iterations[j] += 1
+
+            # Warm start from the solution of the previous horizon.
+            X[:, j], exit_code = sparse.linalg.cg(
+                A,
+                B[:, j],
+                x0=x0,
+                rtol=self.tol,
+                atol=0.0,
+                maxiter=self.maxiter,
+                M=M,
+                callback=count_iterations,
+            )
+            residuals[j] = np.linalg.norm(B[:, j] - A @ X[:, j])
+            if exit_code > 0:
+                warnings.warn(
+                    f"Conjugate gradient did not converge in {exit_code} iterations, residual norm {residuals[j]:.3g}."
+                )
+            x0 = X[:, j]
+        return X, {"iterations": iterations, "residuals": residuals}
+
+    def _get_PW_matrices_shrink(
+        self,
+        S: sparse.csr_matrix,
+        y_hat: np.ndarray,
+        residuals: np.ndarray,
+        tags: Optional[dict[str, np.ndarray]],
+    ):
+        n_hiers, n_bottom = S.shape
+        n_aggs = n_hiers - n_bottom
+        if tags is None:
+            raise ValueError(
+                f"min_trace ({self.method}) needs `tags` to find the related series."
+            )
+        A = _construct_adjacency_matrix(S, tags)
+        if not _is_strictly_hierarchical(A):
+            raise ValueError(
+                f"min_trace ({self.method}) requires strictly hierarchical structures."
+            )
+        if n_aggs == 0 or (S[n_aggs:] != sparse.eye(n_bottom)).nnz > 0:
+            raise ValueError(
+                f"min_trace ({self.method}) requires the bottom level series to be the last rows of `S`."
+            )
+        # Only estimate the covariances of siblings and of nodes with their
+        # descendants, shrinking them towards the diagonal target.
+        W = _shrunk_covariance_schaferstrimmer_sparse(
+            residuals=residuals,
+            pattern=_hierarchical_covariance_pattern(A),
+            mint_shr_ridge=self.mint_shr_ridge,
+        )
+        if np.any(np.isnan(W.data)):
+            raise Exception(
+                f"min_trace ({self.method}) needs covariance matrix to be positive definite (not nan)."
+            )
+        # As W^-1 is dense, solve the aggregate level system M = C W C' with
+        # the constraint matrix C = [I | -S_a], which is sparse as long as the
+        # related series are, and P y = y_b - (W C')_b M^-1 C y.
+        C = sparse.hstack((sparse.eye(n_aggs), -S[:n_aggs]), "csr")
+        WCt = sparse.csr_matrix(W @ C.T)
+        WCt_b = WCt[n_aggs:]
+        M_agg = sparse.csc_matrix(C @ WCt)
+        if self.solver == "direct":
+            lu = sparse.linalg.splu(M_agg, permc_spec="MMD_AT_PLUS_A")
+            solve = lu.solve
+        else:
+            A_agg = sparse.linalg.aslinearoperator(M_agg)
+            M_diag = M_agg.diagonal()
+            if np.any(M_diag <= 0.0):
+                raise Exception(
+                    f"min_trace ({self.method}) needs covariance matrix to be positive definite."
+                )
+            M = sparse.linalg.aslinearoperator(sparse.diags(np.reciprocal(M_diag)))
+
+            def solve(B):
+                if self.solver == "cg":
+                    X, P.info = self._solve_cg(A_agg, B, M)
+                    return X
+                return np.column_stack(
+                    [sparse.linalg.bicgstab(A_agg, b, atol=1e-5)[0] for b in B.T]
+                )
+
+        def get_P_action(Y):
+            Y = np.asarray(Y).reshape(n_hiers, -1)
+            return Y[n_aggs:] - WCt_b @ solve(C @ Y)
+
+        P = sparse.linalg.LinearOperator(
+            (n_bottom, y_hat.shape[0]),
+            matvec=get_P_action,
+            matmat=get_P_action,
+            dtype=np.float64,
+        )
+        return P, W
 
     def _get_PW_matrices(
         self,
@@ -1313,14 +1831,22 @@ class MinTraceSparse(MinTrace):
         y_insample: Optional[np.ndarray] = None,
         y_hat_insample: Optional[np.ndarray] = None,
         idx_bottom: Optional[list[int]] = None,
+        tags: Optional[dict[str, np.ndarray]] = None,
+        residual_stats: Optional[ResidualStatistics] = None,
     ):
         # shape residuals_insample (n_hiers, obs)
         res_methods = ["wls_var", "mint_cov", "mint_shrink"]
 
         S = sparse.csr_matrix(S)
 
-        if self.method in res_methods and (
-            y_insample is None or y_hat_insample is None
+        if residual_stats is not None and self.method in ["mint_cov", "mint_shrink"]:
+            raise ValueError(
+                f"`residual_stats` are only supported with method `wls_var`, not `{self.method}`."
+            )
+        if (
+            self.method in res_methods
+            and (y_insample is None or y_hat_insample is None)
+            and residual_stats is None
         ):
             raise ValueError(
                 f"Check `Y_df`. For method `{self.method}` you need to pass insample predictions and insample values."
@@ -1331,8 +1857,16 @@ class MinTraceSparse(MinTrace):
             W_diag = np.ones(n_hiers)
         elif self.method == "wls_struct":
             W_diag = S @ np.ones((n_bottom,))
+        elif self.method == "wls_var" and residual_stats is not None:
+            # Protection: against overfitted model
+            zero_residual_prc = np.mean(np.abs(residual_stats.residuals_sum) < 1e-4)
+            if zero_residual_prc > 0.98:
+                raise Exception(
+                    f"Insample residuals close to 0, zero_residual_prc={zero_residual_prc}. Check `Y_df`"
+                )
+            W_diag = residual_stats.variance(ddof=1)
         elif (
-            self.method == "wls_var"
+            self.method in ["wls_var", "mint_shrink"]
             and y_insample is not None
             and y_hat_insample is not None
         ):
@@ -1356,6 +1890,11 @@ class MinTraceSparse(MinTrace):
             # masked_res = np.ma.array(residuals, mask=np.isnan(residuals))
             # covm = np.ma.cov(masked_res, rowvar=False, allow_masked=True).data
 
+            if self.method == "mint_shrink":
+                return self._get_PW_matrices_shrink(
+                    S=S, y_hat=y_hat, residuals=residuals.T, tags=tags
+                )
+
             W_diag = np.nanvar(residuals, axis=0, ddof=1)
         else:
             raise ValueError(f"Unknown reconciliation method {self.method}")
@@ -1373,25 +1912,89 @@ class MinTraceSparse(MinTrace):
         M = sparse.spdiags(np.reciprocal(W_diag), 0, W_diag.size, W_diag.size)
         R = sparse.csr_matrix(S.T @ M)
 
-        # The implementation of P acting on a vector:
-        def get_P_action(y):
-            b = R @ y
+        if self.solver == "direct":
+            n_aggs = n_hiers - n_bottom
+            S_a = S[:n_aggs]
+            if n_aggs > 0 and (S[n_aggs:] != sparse.eye(n_bottom)).nnz == 0:
+                # S'W^-1S is dense as soon as a series aggregates all of the
+                # bottom level ones, so with S = [S_a; I] factorize the
+                # aggregate level system M = W_a + S_a W_b S_a' instead, and
+                # P y = y_b + W_b S_a' M^-1 (y_a - S_a y_b).
+                S_aW_b = sparse.csr_matrix(S_a @ sparse.diags(W_diag[n_aggs:]))
+                lu = sparse.linalg.splu(
+                    sparse.csc_matrix(S_aW_b @ S_a.T + sparse.diags(W_diag[:n_aggs])),
+                    permc_spec="MMD_AT_PLUS_A",
+                )
+
+                def get_P_action(Y):
+                    Y = np.asarray(Y).reshape(n_hiers, -1)
+                    return Y[n_aggs:] + S_aW_b.T @ lu.solve(
+                        Y[:n_aggs] - S_a @ Y[n_aggs:]
+                    )
 
+            else:
+                # Factorize the symmetric positive definite S'W^-1S.
+                lu = sparse.linalg.splu(
+                    sparse.csc_matrix(R @ S), permc_spec="MMD_AT_PLUS_A"
+                )
+
+                def get_P_action(Y):
+                    return lu.solve(np.asarray(R @ Y))
+
+            # The factorization is computed once, so that P acts on all the
+            # forecasts with a multi-RHS solve.
+            P = sparse.linalg.LinearOperator(
+                (S.shape[1], y_hat.shape[0]),
+                matvec=get_P_action,
+                matmat=get_P_action,
+                dtype=np.float64,
+            )
+        elif self.solver == "cg":
             A = sparse.linalg.LinearOperator(
-                (b.size, b.size), matvec=lambda v: R @ (S @ v)
+                (n_bottom, n_bottom), matvec=lambda v: R @ (S @ v), dtype=np.float64
             )
+            M = self._get_preconditioner(S=S, W_diag=W_diag)
 
-            x_tilde, exit_code = sparse.linalg.bicgstab(A, b, atol=1e-5)
+            def get_P_action(Y):
+                X, P.info = self._solve_cg(
+                    A, np.asarray(R @ Y).reshape(n_bottom, -1), M
+                )
+                return X
 
-            return x_tilde
+            P = sparse.linalg.LinearOperator(
+                (S.shape[1], y_hat.shape[0]),
+                matvec=get_P_action,
+                matmat=get_P_action,
+                dtype=np.float64,
+            )
+        else:
+            # The implementation of P acting on a vector:
+            def get_P_action(y):
+                b = R @ y
 
-        P = sparse.linalg.LinearOperator(
-            (S.shape[1], y_hat.shape[0]), matvec=get_P_action
-        )
+                A = sparse.linalg.LinearOperator(
+                    (b.size, b.size), matvec=lambda v: R @ (S @ v)
+                )
+
+                x_tilde, exit_code = sparse.linalg.bicgstab(A, b, atol=1e-5)
+
+                return x_tilde
+
+            P = sparse.linalg.LinearOperator(
+                (S.shape[1], y_hat.shape[0]), matvec=get_P_action
+            )
         W = sparse.spdiags(W_diag, 0, W_diag.size, W_diag.size)
 
         return P, W
 
+    def _structural_key(self):
+        key = super()._structural_key()
+        if key is None:
+            return None
+        if self.solver == "cg":
+            return (*key, self.solver, self.preconditioner, self.tol, self.maxiter)
+        return (*key, self.solver)
+
     def fit(
         self,
         S: sparse.csr_matrix,
@@ -1404,24 +2007,39 @@ class MinTraceSparse(MinTrace):
         seed: Optional[int] = None,
         tags: Optional[dict[str, np.ndarray]] = None,
         idx_bottom: Optional[np.ndarray] = None,
+        cache: Optional[_StructureCache] = None,
+        residual_stats: Optional[ResidualStatistics] = None,
     ) -> "MinTraceSparse":
         """MinTraceSparse Fit Method.
 
         **Parameters:**<br>
         `S`: Summing matrix of size (`base`, `bottom`).<br>
         `y_hat`: Forecast values of size (`base`, `horizon`).<br>
-        `y_insample`: Insample values of size (`base`, `insample_size`). Only used with "wls_var".<br>
-        `y_hat_insample`: Insample forecast values of size (`base`, `insample_size`). Only used with "wls_var"<br>
+        `y_insample`: Insample values of size (`base`, `insample_size`). Only used with "wls_var", "mint_shrink".<br>
+        `y_hat_insample`: Insample forecast values of size (`base`, `insample_size`). Only used with "wls_var", "mint_shrink".<br>
         `sigmah`: Estimated standard deviation of the conditional marginal distribution.<br>
         `intervals_method`: Sampler for prediction intervals, one of `normality`, `bootstrap`, `permbu`.<br>
         `num_samples`: Number of samples for probabilistic coherent distribution.<br>
         `seed`: Seed for reproducibility.<br>
-        `tags`: Each key is a level and each value its `S` indices.<br>
+        `tags`: Each key is a level and each value its `S` indices. Required with "mint_shrink".<br>
         `idx_bottom`: Indices corresponding to the bottom level of `S`, size (`bottom`).<br>
+        `cache`: Optional store to share `P` and `W` across calls with the same `S`, only used with "ols", "wls_struct".<br>
+        `residual_stats`: Optional streamed residual statistics used in place of `y_insample` and `y_hat_insample` by "wls_var".<br>
 
         **Returns:**<br>
         `self`: object, fitted reconciler.
         """
+        if (
+            residual_stats is not None
+            and y_insample is None
+            and intervals_method in ["bootstrap", "permbu"]
+        ):
+            raise ValueError(
+                f"`{intervals_method}` intervals need `y_insample` and `y_hat_insample`, not `residual_stats`."
+            )
+        self._residual_stats_version = (
+            None if residual_stats is None else residual_stats.version
+        )
         if self.nonnegative:
             # Clip the base forecasts to align them with their use in practice.
             self.y_hat = np.clip(y_hat, 0, None)
@@ -1429,7 +2047,7 @@ class MinTraceSparse(MinTrace):
             n, n_b = S.shape
             n_a = n - n_b
             # Find the optimal non-negative forecasts.
-            if self.qp:
+            if self.qp and not self.apg:
                 # Get the diagonal weight matrix, i.e., precision matrix, for
                 # the problem.
                 if self.method == "ols":
@@ -1443,57 +2061,90 @@ class MinTraceSparse(MinTrace):
                         )
                     )
                 elif self.method == "wls_var":
+                    if residual_stats is not None:
+                        variance = residual_stats.variance(ddof=1)
                     # Check that we have the in-sample values.
-                    if y_insample is None or y_hat_insample is None:
+                    elif y_insample is None or y_hat_insample is None:
                         raise ValueError(
                             "`y_insample` and `y_hat_insample` are required to calculate residuals."
                         )
+                    else:
+                        variance = np.nanvar(y_insample - y_hat_insample, 1, ddof=1)
                     # Add a small jitter to the variance to improve the condition
                     # of the variance matrix.
                     W = sparse.csc_matrix(
                         (
-                            1.0
-                            / (
-                                np.nanvar(y_insample - y_hat_insample, 1, ddof=1) + 2e-8
-                            ),
+                            1.0 / (variance + 2e-8),
                             np.arange(n, dtype=np.min_scalar_type(n - 1)),
                             np.arange(n + 1, dtype=np.min_scalar_type(n)),
                         )
                     )
-                # Get the linear constraints matrix by vertically stacking the
-                # (n_a x n) constraint matrix in the zero-constrained
-                # represenation, which has the set of all reconciled forecasts
-                # in its null space, and a horizontally stacked (n_b x n_a)
-                # zero matrix and a negated (n_b x n_b) identity matrix.
-                A = sparse.vstack(
-                    (
-                        sparse.hstack(
-                            (sparse.eye(n_a, format="csc"), -S[:n_a, :].tocsc())
-                        ),
-                        -sparse.eye(n_b, n, n_a, format="csc"),
+                if self.qp_formulation == "bottom":
+                    # As the feasible set is x = S b with b >= 0, pose the
+                    # problem over the bottom level forecasts with only the
+                    # nonnegative cone. The quadratic term S'W^-1S is dense
+                    # as soon as a series aggregates all of the bottom level
+                    # ones, so this suits structures with smaller aggregates.
+                    S_csc = S.tocsc()
+                    P_qp = sparse.triu(S_csc.T @ W @ S_csc, format="csc")
+                    A = -sparse.eye(n_b, format="csc")
+                    b = np.zeros(n_b)
+                    cones = [clarabel.NonnegativeConeT(n_b)]
+
+                    def get_q(y: np.ndarray) -> np.ndarray:
+                        return S_csc.T @ (W @ -y)
+
+                else:
+                    P_qp = W
+                    # Get the linear constraints matrix by vertically stacking
+                    # the (n_a x n) constraint matrix in the zero-constrained
+                    # represenation, which has the set of all reconciled
+                    # forecasts in its null space, and a horizontally stacked
+                    # (n_b x n_a) zero matrix and a negated (n_b x n_b)
+                    # identity matrix.
+                    A = sparse.vstack(
+                        (
+                            sparse.hstack(
+                                (sparse.eye(n_a, format="csc"), -S[:n_a, :].tocsc())
+                            ),
+                            -sparse.eye(n_b, n, n_a, format="csc"),
+                        )
                     )
-                )
-                # Get the linear constraints vector.
-                b = np.zeros(n)
-                # Get the composition of convex cones to solve the problem.
-                cones = [clarabel.ZeroConeT(n_a), clarabel.NonnegativeConeT(n_b)]
+                    # Get the linear constraints vector.
+                    b = np.zeros(n)
+                    # Get the composition of convex cones to solve the problem.
+                    cones = [clarabel.ZeroConeT(n_a), clarabel.NonnegativeConeT(n_b)]
+
+                    def get_q(y: np.ndarray) -> np.ndarray:
+                        return W @ -y
+
                 # Set up the settings for the solver.
                 settings = clarabel.DefaultSettings()
                 settings.verbose = False
+                # Each thread keeps its own solver, so that the KKT system is
+                # only set up once and just the cost vector is updated for
+                # every forecast. Releases of Clarabel without the data
+                # updating interface set up a new solver for every forecast.
+                local = threading.local()
+                can_update = hasattr(clarabel.DefaultSolver, "update") and hasattr(
+                    clarabel.DefaultSolver, "is_data_update_allowed"
+                )
 
-                def solve_clarabel(
-                    y: np.ndarray,
-                    P: sparse.csc_matrix,
-                    A: sparse.csc_matrix,
-                    b: np.ndarray,
-                    cones: list,
-                    settings: clarabel.DefaultSettings,
-                    n_b: int,
-                ) -> tuple[bool, Optional[np.ndarray]]:
+                def solve_clarabel(y: np.ndarray) -> tuple[bool, Optional[np.ndarray]]:
                     # Get the linear coefficients, i.e., the cost vector.
-                    q = P @ -y
-                    # Set up the Clarabel solver.
-                    solver = clarabel.DefaultSolver(P, q, A, b, cones, settings)
+                    q = get_q(y)
+                    solver = getattr(local, "solver", None)
+                    if (
+                        solver is None
+                        or not can_update
+                        or not solver.is_data_update_allowed()
+                    ):
+                        # Set up the Clarabel solver.
+                        solver = local.solver = clarabel.DefaultSolver(
+                            P_qp, q, A, b, cones, settings
+                        )
+                    else:
+                        solver.update(q=q)
                     # Solve the problem.
                     solution = solver.solve()
                     # Resolve the solver exit status.
@@ -1501,7 +2152,7 @@ class MinTraceSparse(MinTrace):
                         # Return the slice of the primal solution that
                         # represents the optimal non-negative reconciled
                         # bottom level forecasts.
-                        return status, solution.x[-n_b:]
+                        return status, np.asarray(solution.x[-n_b:])
                     else:
                         # As the solver failed, discard the empty primal
                         # solution.
@@ -1510,9 +2161,7 @@ class MinTraceSparse(MinTrace):
                 with ThreadPoolExecutor(self.num_threads) as executor:
                     # Dispatch the jobs.
                     futures = [
-                        executor.submit(
-                            solve_clarabel, y, W, A, b, cones, settings, n_b
-                        )
+                        executor.submit(solve_clarabel, y)
                         for y in self.y_hat.transpose()
                     ]
                     # Yield the futures as they complete.
@@ -1539,12 +2188,15 @@ class MinTraceSparse(MinTrace):
                 self.P, self.W = BottomUpSparse()._get_PW_matrices(S=S, idx_bottom=None)
             else:
                 # Get the reconciliation matrices.
-                self.P, self.W = self._get_PW_matrices(
+                self.P, self.W = self._get_cached_PW_matrices(
                     S=S,
+                    cache=cache,
                     y_hat=self.y_hat,
                     y_insample=y_insample,
                     y_hat_insample=y_hat_insample,
                     idx_bottom=idx_bottom,
+                    tags=tags,
+                    residual_stats=residual_stats,
                 )
                 # Although it is now sufficient to ensure that all of the
                 # entries in P are positive, as it is implemented as a linear
@@ -1556,8 +2208,18 @@ class MinTraceSparse(MinTrace):
                 )["mean"][-n_b:, :]
                 # Find if any of the forecasts are negative.
                 if np.any(y_tilde < 0):
+                    negatives = np.any(y_tilde < 0, axis=0)
                     # Clip the negative forecasts.
                     y_tilde = np.clip(y_tilde, 0, None)
+                    if self.apg:
+                        # Refine the clipped forecasts towards the optimal
+                        # non-negative ones, only for the horizons with
+                        # negative forecasts.
+                        y_tilde[:, negatives] = self._solve_apg(
+                            S=S,
+                            y_hat=self.y_hat[:, negatives],
+                            x0=y_tilde[:, negatives],
+                        )
                     # Force non-negative coherence by overwriting the base
                     # forecasts with the aggregated, clipped bottom level
                     # forecasts.
@@ -1571,12 +2233,15 @@ class MinTraceSparse(MinTrace):
         else:
             # Get the reconciliation matrices.
             self.y_hat = y_hat
-            self.P, self.W = self._get_PW_matrices(
+            self.P, self.W = self._get_cached_PW_matrices(
                 S=S,
+                cache=cache,
                 y_hat=self.y_hat,
                 y_insample=y_insample,
                 y_hat_insample=y_hat_insample,
                 idx_bottom=idx_bottom,
+                tags=tags,
+                residual_stats=residual_stats,
             )
 
         # Get the sampler for probabilistic reconciliation.
@@ -1597,7 +2262,7 @@ class MinTraceSparse(MinTrace):
         self.fitted = True
         return self
 
-# %% ../nbs/src/methods.ipynb 82
+# %% ../nbs/src/methods.ipynb 86
 class OptimalCombination(MinTrace):
     """Optimal Combination Reconciliation Class.
 
@@ -1632,7 +2297,7 @@ class OptimalCombination(MinTrace):
         )
         self.insample = False
 
-# %% ../nbs/src/methods.ipynb 90
+# %% ../nbs/src/methods.ipynb 94
 class ERM(HReconciler):
     """Optimal Combination Reconciliation Class.
 
@@ -1696,28 +2361,33 @@ class ERM(HReconciler):
             P = np.linalg.pinv(y_hat_insample.T) @ B
             P = P.T
         elif self.method == "reg":
-            X = np.kron(S, y_hat_insample.T)
-            z = y_insample.reshape(-1)
+            # The lasso design matrix X = kron(S, y_hat_insample') is only
+            # used implicitly, as X beta = S B y_hat_insample and
+            # X'z = S' Z y_hat_insample' with beta and z reshaped to B and Z.
+            z = y_insample
 
             if self.lambda_reg is None:
-                lambda_reg = np.max(np.abs(X.T.dot(z)))
+                lambda_reg = np.max(np.abs(S.T @ z @ y_hat_insample.T))
             else:
                 lambda_reg = self.lambda_reg
 
-            beta = _lasso(X, z, lambda_reg, max_iters=1000, tol=1e-4)
+            beta = _kron_lasso(
+                S, y_hat_insample, z, lambda_reg, max_iters=1000, tol=1e-4
+            )
             P = beta.reshape(S.shape).T
         elif self.method == "reg_bu":
-            X = np.kron(S, y_hat_insample.T)
             Pbu = np.zeros_like(S)
             Pbu[idx_bottom] = S[idx_bottom]
-            z = y_insample.reshape(-1) - X @ Pbu.reshape(-1)
+            z = y_insample - S @ Pbu.reshape(n_bottom, n_hiers) @ y_hat_insample
 
             if self.lambda_reg is None:
-                lambda_reg = np.max(np.abs(X.T.dot(z)))
+                lambda_reg = np.max(np.abs(S.T @ z @ y_hat_insample.T))
             else:
                 lambda_reg = self.lambda_reg
 
-            beta = _lasso(X, z, lambda_reg, max_iters=1000, tol=1e-4)
+            beta = _kron_lasso(
+                S, y_hat_insample, z, lambda_reg, max_iters=1000, tol=1e-4
+            )
             P = beta + Pbu.reshape(-1)
             P = P.reshape(S.shape).T
         else:
@@ -1831,3 +2501,221 @@ class ERM(HReconciler):
         )
 
     __call__ = fit_predict
+
+# %% ../nbs/src/methods.ipynb 112
+class ReconciliationArtifact:
+    """Reconciliation Artifact
+
+    Frozen projection of a fitted reconciler, for reconciling each new forecast vector
+    without DataFrames: the summing matrix `S` in CSR format, the `P` matrix, dense or
+    sparse, the ids of the series in the order of `S` and, after `normality` intervals,
+    the reconciled standard deviations of the sampler. `transform` computes
+    `S @ (P @ y_hat)` into buffers that are allocated once per horizon and thread, and
+    `save` and `load` write and memory-map the artifact as an `.npz` file.
+
+    The `P` of `MinTraceSparse`, an operator that solves a linear system on every
+    product, is materialized as a dense matrix. Nonnegative reconcilers are not
+    supported, as their solution is not a linear projection of the forecasts.
+
+    **Parameters:**<br>
+    `S`: np.ndarray or sparse matrix, summing matrix of size (`base`, `bottom`).<br>
+    `P`: np.ndarray or sparse matrix, reconciliation matrix of size (`bottom`, `base`).<br>
+    `ids`: np.ndarray, optional ids of the `base` series in the order of the rows of `S`.<br>
+    `sigmah`: np.ndarray, optional reconciled standard deviations of size (`base`, `horizon`).<br>
+    """
+
+    def __init__(
+        self,
+        S,
+        P,
+        ids: Optional[np.ndarray] = None,
+        sigmah: Optional[np.ndarray] = None,
+    ):
+        self.S = sparse.csr_matrix(S, dtype=np.float64)
+        if sparse.issparse(P):
+            self.P = sparse.csr_matrix(P, dtype=np.float64)
+        else:
+            self.P = np.ascontiguousarray(P, dtype=np.float64)
+        n_series, n_bottom = self.S.shape
+        if self.P.shape != (n_bottom, n_series):
+            raise ValueError(
+                f"Expected `P` of size ({n_bottom}, {n_series}), got {self.P.shape}."
+            )
+        self.ids = None if ids is None else np.asarray(ids)
+        if self.ids is not None and len(self.ids) != n_series:
+            raise ValueError(
+                f"Expected {n_series} ids, one per row of `S`, got {len(self.ids)}."
+            )
+        self.sigmah = None if sigmah is None else np.asarray(sigmah, dtype=np.float64)
+        self._local = threading.local()
+
+    @classmethod
+    def from_reconciler(
+        cls, reconciler: HReconciler, S, ids: Optional[np.ndarray] = None
+    ) -> "ReconciliationArtifact":
+        """Reconciliation Artifact from a Fitted Reconciler
+
+        **Parameters:**<br>
+        `reconciler`: HReconciler, reconciler fitted with `fit`.<br>
+        `S`: Summing matrix of size (`base`, `bottom`), or a `HierarchyStructure` that also provides the `ids`.<br>
+        `ids`: np.ndarray, optional ids of the `base` series in the order of the rows of `S`.<br>
+
+        **Returns:**<br>
+        `artifact`: ReconciliationArtifact, frozen projection of the reconciler.
+        """
+        if not reconciler.fitted or reconciler.P is None:
+            raise Exception("This model instance is not fitted yet, Call fit method.")
+        if getattr(reconciler, "nonnegative", False):
+            raise ValueError(
+                "Nonnegative reconcilers are not supported, their forecasts are not a linear projection of `y_hat`."
+            )
+        if isinstance(S, HierarchyStructure):
+            ids = S.ids if ids is None else ids
+            S = S.S
+        P = reconciler.P
+        if isinstance(P, sparse.linalg.LinearOperator):
+            n_series = P.shape[1]
+            block = max(1, 2**27 // (8 * P.shape[0]))
+            P = np.hstack(
+                [
+                    P.matmat(np.eye(n_series, min(block, n_series - start), -start))
+                    for start in range(0, n_series, block)
+                ]
+            )
+        sigmah = None
+        if isinstance(reconciler.sampler, Normality):
+            sigmah = reconciler.sampler.sigmah_rec
+        return cls(S=S, P=P, ids=ids, sigmah=sigmah)
+
+    def _get_bottom_buffer(self, horizon: int) -> np.ndarray:
+        buffers = getattr(self._local, "buffers", None)
+        if buffers is None:
+            buffers = self._local.buffers = {}
+        if horizon not in buffers:
+            buffers[horizon] = np.empty((self.S.shape[1], horizon), dtype=np.float64)
+        return buffers[horizon]
+
+    def transform(
+        self, y_hat: np.ndarray, out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """Reconcile Forecasts
+
+        **Parameters:**<br>
+        `y_hat`: Forecast values of size (`base`, `horizon`) or (`base`,).<br>
+        `out`: np.ndarray, optional C-contiguous float64 array of the size of `y_hat` to write the reconciled forecasts to.<br>
+
+        **Returns:**<br>
+        `y_tilde`: Reconciled forecasts of the size of `y_hat`.
+        """
+        y_hat = np.asarray(y_hat, dtype=np.float64)
+        if y_hat.shape[0] != self.S.shape[0]:
+            raise ValueError(
+                f"Expected `y_hat` of {self.S.shape[0]} series, got {y_hat.shape[0]}."
+            )
+        y_hat_2d = np.ascontiguousarray(y_hat.reshape(y_hat.shape[0], -1))
+        if out is None:
+            out = np.empty(y_hat.shape, dtype=np.float64)
+        elif (
+            out.shape != y_hat.shape
+            or out.dtype != np.float64
+            or not out.flags.c_contiguous
+        ):
+            raise ValueError(
+                f"Expected `out` to be a C-contiguous float64 array of size {y_hat.shape}."
+            )
+        out_2d = out.reshape(y_hat_2d.shape)
+        bottom = self._get_bottom_buffer(y_hat_2d.shape[1])
+        if isinstance(self.P, np.ndarray):
+            np.matmul(self.P, y_hat_2d, out=bottom)
+        else:
+            _csr_matmul(self.P.indptr, self.P.indices, self.P.data, y_hat_2d, bottom)
+        _csr_matmul(self.S.indptr, self.S.indices, self.S.data, bottom, out_2d)
+        return out
+
+    def intervals(self, y_tilde: np.ndarray, level: list[int]) -> dict[str, np.ndarray]:
+        """Normality Prediction Intervals
+
+        Intervals around the reconciled forecasts with the standard deviations of
+        the `normality` sampler of the reconciler.
+
+        **Parameters:**<br>
+        `y_tilde`: Reconciled forecasts of size (`base`, `horizon`).<br>
+        `level`: float list 0-100, confidence levels for prediction intervals.<br>
+
+        **Returns:**<br>
+        `res`: dict, with the `lo-{level}` and `hi-{level}` intervals.
+        """
+        if self.sigmah is None:
+            raise ValueError(
+                "This artifact does not have the standard deviations of a `normality` sampler."
+            )
+        res = {}
+        z = norm.ppf(0.5 + np.asarray(level) / 200)
+        for zs, lv in zip(z, level):
+            res[f"lo-{lv}"] = y_tilde - zs * self.sigmah
+            res[f"hi-{lv}"] = y_tilde + zs * self.sigmah
+        return res
+
+    def save(self, path):
+        """Save Reconciliation Artifact
+
+        Writes the arrays of the artifact without compression to the `.npz` file `path`,
+        so that `load` can memory-map them.
+
+        **Parameters:**<br>
+        `path`: str or Path, file to write.<br>
+        """
+        arrays = dict(
+            S_data=self.S.data,
+            S_indices=self.S.indices,
+            S_indptr=self.S.indptr,
+            S_shape=np.array(self.S.shape),
+        )
+        if isinstance(self.P, np.ndarray):
+            arrays["P"] = self.P
+        else:
+            arrays.update(
+                P_data=self.P.data,
+                P_indices=self.P.indices,
+                P_indptr=self.P.indptr,
+                P_shape=np.array(self.P.shape),
+            )
+        if self.ids is not None:
+            arrays["ids"] = (
+                self.ids.astype(str) if self.ids.dtype.hasobject else self.ids
+            )
+        if self.sigmah is not None:
+            arrays["sigmah"] = self.sigmah
+        np.savez(path, **arrays)
+
+    @classmethod
+    def load(cls, path, mmap_mode: Optional[str] = "r") -> "ReconciliationArtifact":
+        """Load Reconciliation Artifact
+
+        **Parameters:**<br>
+        `path`: str or Path, `.npz` file written by `save`.<br>
+        `mmap_mode`: str='r', memory-map the arrays from the file with this mode, or read them with None.<br>
+
+        **Returns:**<br>
+        `artifact`: ReconciliationArtifact, frozen projection of the reconciler.
+        """
+        arrays = _load_npz(path, mmap_mode=mmap_mode)
+
+        def csr(name):
+            return sparse.csr_matrix(
+                (
+                    arrays[f"{name}_data"],
+                    arrays[f"{name}_indices"],
+                    arrays[f"{name}_indptr"],
+                ),
+                shape=tuple(int(size) for size in arrays[f"{name}_shape"]),
+                copy=False,
+            )
+
+        # The memory-mapped float64 arrays are not copied by the constructor
+        return cls(
+            S=csr("S"),
+            P=arrays["P"] if "P" in arrays else csr("P"),
+            ids=arrays.get("ids"),
+            sigmah=arrays.get("sigmah"),
+        )
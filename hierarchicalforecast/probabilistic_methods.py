@@ -4,16 +4,38 @@
 __all__ = ['Normality']
 
 # %% ../nbs/src/probabilistic_methods.ipynb 3
-import warnings
 from typing import Optional
 
 import numpy as np
+from numba import njit, prange
+from scipy import sparse
 from scipy.stats import norm
-from sklearn.preprocessing import OneHotEncoder
 
-from .utils import is_strictly_hierarchical
+from hierarchicalforecast.utils import (
+    NUMBA_CACHE,
+    NUMBA_FASTMATH,
+    NUMBA_NOGIL,
+    NUMBA_PARALLEL,
+    _FactoredCovariance,
+    _quantiles_partition,
+    is_strictly_hierarchical,
+)
 
 # %% ../nbs/src/probabilistic_methods.ipynb 6
+def _is_diagonal(W) -> bool:
+    """Whether the dense or sparse covariance `W` has no nonzero off-diagonal entries."""
+    if sparse.issparse(W):
+        return W.count_nonzero() == np.count_nonzero(W.diagonal())
+    return np.count_nonzero(W) == np.count_nonzero(np.diagonal(W))
+
+
+def _rowwise_dot(A, B) -> np.ndarray:
+    """Row sums of the elementwise product of a dense or sparse `A` and a dense `B`."""
+    if sparse.issparse(A):
+        return np.asarray(A.multiply(B).sum(axis=1)).ravel()
+    return np.einsum("ij,ij->i", A, B)
+
+
 class Normality:
     """Normality Probabilistic Reconciliation Class.
 
@@ -35,7 +57,7 @@ class Normality:
     `S`: np.array, summing matrix of size (`base`, `bottom`).<br>
     `P`: np.array, reconciliation matrix of size (`bottom`, `base`).<br>
     `y_hat`: Point forecasts values of size (`base`, `horizon`).<br>
-    `W`: np.array, hierarchical covariance matrix of size (`base`, `base`).<br>
+    `W`: np.array, hierarchical covariance matrix of size (`base`, `base`), dense, sparse or factored.<br>
     `sigmah`: np.array, forecast standard dev. of size (`base`, `horizon`).<br>
     `num_samples`: int, number of bootstraped samples generated.<br>
     `seed`: int, random seed for numpy generator's replicability.<br>
@@ -63,21 +85,92 @@ class Normality:
         self.seed = seed
 
         # Base Normality Errors assume independence/diagonal covariance
-        # TODO: replace bilinearity with elementwise row multiplication
+        # W_h = D_h W D_h, with D_h = diag(sigmah_h / std) the correlation rescaling
         std_ = np.sqrt(self.W.diagonal())
-        R1 = self.W / np.outer(std_, std_)
-        Wh = [np.diag(sigma) @ R1 @ np.diag(sigma).T for sigma in self.sigmah.T]
-
-        # Reconciled covariances across forecast horizon
-        self.cov_rec = [(self.SP @ W @ self.SP.T) for W in Wh]
-        self.sigmah_rec = np.hstack(
-            [np.sqrt(cov.diagonal())[:, None] for cov in self.cov_rec]
+        self._scale = self.sigmah / std_[:, None]
+
+        # Reconciled standard deviations across forecast horizon, the
+        # reconciled covariances are only built if samples are requested
+        self._cov_rec = None
+        self._factors_bottom = None
+        self.sigmah_rec = np.sqrt(self._get_variance_rec())
+
+    @property
+    def cov_rec(self):
+        """Reconciled covariances SP W_h SP' across forecast horizon, built on first access."""
+        if self._cov_rec is None:
+            W = self.W if isinstance(self.W, np.ndarray) else self.W.toarray()
+            SP = self.SP.toarray() if sparse.issparse(self.SP) else self.SP
+            self._cov_rec = [
+                SP @ (scale[:, None] * W * scale[None, :]) @ SP.T
+                for scale in self._scale.T
+            ]
+        return self._cov_rec
+
+    def _get_variance_rec(self):
+        """Diagonal of SP W_h SP' for every horizon, without any (`base`, `base`) product."""
+        n_series, n_horizon = self._scale.shape
+        if isinstance(self.W, _FactoredCovariance):
+            d, U = self.W.d, self.W.U
+        elif _is_diagonal(self.W):
+            d, U = np.asarray(self.W.diagonal()), None
+        else:
+            # Full W, rows of S (P W_h P') S' from the (`bottom`, `bottom`) covariance
+            var = np.empty((n_series, n_horizon))
+            for t in range(n_horizon):
+                var[:, t] = _rowwise_dot(
+                    self.S, self.S @ self._get_covariance_bottom(t)
+                )
+            return var
+
+        # W = diag(d) + U U', so W_h = diag(d) D_h^2 + (D_h U) (D_h U)'
+        # the diagonal part is elementwise, the low rank part is sum((SP D_h U)^2) row-wise
+        SP2 = (
+            self.SP.multiply(self.SP)
+            if sparse.issparse(self.SP)
+            else np.square(self.SP)
         )
+        var = SP2 @ (d[:, None] * np.square(self._scale))
+        if U is not None and U.shape[1] > 0:
+            for t in range(n_horizon):
+                var[:, t] += np.sum(
+                    np.square(self.SP @ (self._scale[:, t, None] * U)), axis=1
+                )
+        return var
+
+    def _get_covariance_bottom(self, t: int) -> np.ndarray:
+        """Reconciled covariance P W_h P' of size (`bottom`, `bottom`) for horizon `t`."""
+        PD = self.P @ sparse.diags(self._scale[:, t])
+        factored = isinstance(self.W, _FactoredCovariance)
+        PWP = PD @ (sparse.diags(self.W.d) if factored else self.W) @ PD.T
+        PWP = PWP.toarray() if sparse.issparse(PWP) else PWP
+        if factored:
+            PDU = PD @ self.W.U
+            PWP = PWP + PDU @ PDU.T
+        return PWP
+
+    def _get_factors_bottom(self) -> np.ndarray:
+        """Factors L_h L_h' = P W_h P' of size (`horizon`, `bottom`, `bottom`), cached across calls."""
+        if self._factors_bottom is None:
+            factors = []
+            for t in range(self._scale.shape[1]):
+                cov = self._get_covariance_bottom(t)
+                try:
+                    factors.append(np.linalg.cholesky(cov))
+                except np.linalg.LinAlgError:
+                    # Singular covariance, factor from its eigendecomposition
+                    eigvals, eigvecs = np.linalg.eigh(cov)
+                    factors.append(eigvecs * np.sqrt(np.clip(eigvals, 0, None)))
+            self._factors_bottom = np.stack(factors)
+        return self._factors_bottom
 
     def get_samples(self, num_samples: int):
         """Normality Coherent Samples.
 
         Obtains coherent samples under the Normality assumptions.
+        The samples are drawn in the space of the bottom level series,
+        where the reconciled distribution is not degenerate, and aggregated
+        with the summing matrix.
 
         **Parameters:**<br>
         `num_samples`: int, number of samples generated from coherent distribution.<br>
@@ -86,21 +179,19 @@ class Normality:
         `samples`: Coherent samples of size (`base`, `horizon`, `num_samples`).
         """
         rng = np.random.default_rng(self.seed)
-        n_series, n_horizon = self.y_hat.shape
-        samples = np.empty(shape=(num_samples, n_series, n_horizon))
-        for t in range(n_horizon):
-            with warnings.catch_warnings():
-                # Avoid 'RuntimeWarning: covariance is not positive-semidefinite.'
-                # By definition the multivariate distribution is not full-rank
-                partial_samples = rng.multivariate_normal(
-                    mean=self.SP @ self.y_hat[:, t],
-                    cov=self.cov_rec[t],
-                    size=num_samples,
-                )
-            samples[:, :, t] = partial_samples
-
-        # [samples, N, H] -> [N, H, samples]
-        samples = samples.transpose((1, 2, 0))
+        L = self._get_factors_bottom()
+        n_horizon, n_bottom, _ = L.shape
+
+        # [H,B,B] @ [H,B,samples] -> [B,H,samples]
+        z = rng.standard_normal(size=(n_horizon, n_bottom, num_samples))
+        samples_bottom = (L @ z).transpose((1, 0, 2)) + (self.P @ self.y_hat)[
+            :, :, None
+        ]
+
+        # [N,B] @ [B,H*samples] -> [N,H,samples]
+        S = self.S if sparse.issparse(self.S) else sparse.csr_matrix(self.S)
+        samples = S @ samples_bottom.reshape(n_bottom, -1)
+        samples = samples.reshape((-1, n_horizon, num_samples))
         return samples
 
     def get_prediction_levels(self, res, level):
@@ -124,6 +215,17 @@ class Normality:
         return res
 
 # %% ../nbs/src/probabilistic_methods.ipynb 10
+def _sample_blocks_quantiles(sample_blocks, quantiles) -> np.ndarray:
+    """Quantiles of size (`base`, `horizon`, `quantiles`) from the samples of consecutive blocks of series."""
+    # [Q,block,H] -> [block,H,Q]
+    return np.concatenate(
+        [
+            _quantiles_partition(block, quantiles, axis=2).transpose((1, 2, 0))
+            for block in sample_blocks
+        ]
+    )
+
+
 class Bootstrap:
     """Bootstrap Probabilistic Reconciliation Class.
 
@@ -148,6 +250,7 @@ class Bootstrap:
     `y_hat_insample`: Insample point forecasts of size (`base`, `insample_size`).<br>
     `num_samples`: int, number of bootstraped samples generated.<br>
     `seed`: int, random seed for numpy generator's replicability.<br>
+    `max_chunk_bytes`: int, memory budget of the residual paths reconciled, and of the series samples summarized, at once.<br>
 
     **References:**<br>
     - [Puwasala Gamakumara Ph. D. dissertation. Monash University, Econometrics and Business Statistics (2020).
@@ -166,6 +269,7 @@ class Bootstrap:
         num_samples: int = 100,
         seed: int = 0,
         W: np.ndarray = None,
+        max_chunk_bytes: int = 2**27,
     ):
         self.S = S
         self.P = P
@@ -175,6 +279,49 @@ class Bootstrap:
         self.y_hat_insample = y_hat_insample
         self.num_samples = num_samples
         self.seed = seed
+        self.max_chunk_bytes = max_chunk_bytes
+
+    def _get_samples_bottom(self, num_samples: int):
+        """Bootstrap sample paths reconciled with P, of size (`bottom`, `horizon`, `num_samples`)."""
+        residuals = self.y_insample - self.y_hat_insample
+        n_series, h = self.y_hat.shape
+
+        # removing nas from residuals
+        residuals = residuals[:, np.isnan(residuals).sum(axis=0) == 0]
+        sample_idx = np.arange(residuals.shape[1] - h)
+        rng = np.random.default_rng(self.seed)
+        samples_idx = rng.choice(sample_idx, size=num_samples)
+
+        # P (y_hat + e) = P y_hat + P e
+        y_rec = self.P @ self.y_hat
+        n_bottom = y_rec.shape[0]
+
+        # [B,H,samples], reconciled in chunks of sample paths within the memory budget
+        samples = np.empty((n_bottom, h, num_samples))
+        chunk_size = max(1, self.max_chunk_bytes // (8 * n_series * h))
+        for start in range(0, num_samples, chunk_size):
+            idx = samples_idx[start : start + chunk_size]
+            # [N,H,chunk] residual paths gathered at once
+            paths = residuals[:, np.arange(h)[:, None] + idx[None, :]]
+            paths_rec = self.P @ paths.reshape(n_series, -1)
+            np.add(
+                y_rec[:, :, None],
+                paths_rec.reshape((n_bottom, h, -1)),
+                out=samples[:, :, start : start + idx.size],
+            )
+        return samples
+
+    def _get_sample_blocks(self, num_samples: int):
+        """Yields the coherent samples of consecutive blocks of series within the memory budget."""
+        samples = self._get_samples_bottom(num_samples)
+        n_bottom, h, _ = samples.shape
+        samples = samples.reshape(n_bottom, -1)
+        S = self.S if sparse.issparse(self.S) else sparse.csr_matrix(self.S)
+        block_size = max(1, self.max_chunk_bytes // (8 * h * num_samples))
+        for start in range(0, S.shape[0], block_size):
+            yield (S[start : start + block_size] @ samples).reshape(
+                (-1, h, num_samples)
+            )
 
     def get_samples(self, num_samples: int):
         """Bootstrap Sample Reconciliation Method.
@@ -188,45 +335,71 @@ class Bootstrap:
         **Returns:**<br>
         `samples`: Coherent samples of size (`base`, `horizon`, `num_samples`).
         """
-        residuals = self.y_insample - self.y_hat_insample
-        h = self.y_hat.shape[1]
+        samples = self._get_samples_bottom(num_samples)
+        n_bottom, h, _ = samples.shape
 
-        # removing nas from residuals
-        residuals = residuals[:, np.isnan(residuals).sum(axis=0) == 0]
-        sample_idx = np.arange(residuals.shape[1] - h)
-        rng = np.random.default_rng(self.seed)
-        samples_idx = rng.choice(sample_idx, size=num_samples)
-        samples = [self.y_hat + residuals[:, idx : (idx + h)] for idx in samples_idx]
-        SP = self.S @ self.P
-        samples = np.apply_along_axis(
-            lambda path: np.matmul(SP, path), axis=1, arr=samples
-        )
-        samples_np = np.stack(samples)
-
-        # [samples, N, H] -> [N, H, samples]
-        samples_np = samples_np.transpose((1, 2, 0))
-        return samples_np
+        # [N,B] @ [B,H*samples] -> [N,H,samples]
+        S = self.S if sparse.issparse(self.S) else sparse.csr_matrix(self.S)
+        samples = S @ samples.reshape(n_bottom, -1)
+        return samples.reshape((-1, h, num_samples))
 
     def get_prediction_levels(self, res, level):
         """Adds reconciled forecast levels to results dictionary"""
-        samples = self.get_samples(num_samples=self.num_samples)
-        for lv in level:
-            min_q = (100 - lv) / 200
-            max_q = min_q + lv / 100
-            res[f"lo-{lv}"] = np.quantile(samples, min_q, axis=2)
-            res[f"hi-{lv}"] = np.quantile(samples, max_q, axis=2)
+        min_qs = [(100 - lv) / 200 for lv in level]
+        max_qs = [min_q + lv / 100 for min_q, lv in zip(min_qs, level)]
+        sample_quantiles = _sample_blocks_quantiles(
+            self._get_sample_blocks(self.num_samples), min_qs + max_qs
+        )
+        for i, lv in enumerate(level):
+            res[f"lo-{lv}"] = sample_quantiles[:, :, i]
+            res[f"hi-{lv}"] = sample_quantiles[:, :, len(level) + i]
         return res
 
     def get_prediction_quantiles(self, res, quantiles):
         """Adds reconciled forecast quantiles to results dictionary"""
-        samples = self.get_samples(num_samples=self.num_samples)
-
-        # [Q, N, H] -> [N, H, Q]
-        sample_quantiles = np.quantile(samples, quantiles, axis=2)
-        res["quantiles"] = sample_quantiles.transpose((1, 2, 0))
+        # Quantiles of blocks of series, without sorting the samples
+        res["quantiles"] = _sample_blocks_quantiles(
+            self._get_sample_blocks(self.num_samples), quantiles
+        )
         return res
 
 # %% ../nbs/src/probabilistic_methods.ipynb 14
+@njit(
+    "void(Array(float64, 3, 'C'), Array(int64, 1, 'C'), Array(int64, 1, 'C'), Array(int64, 1, 'C'), Array(int64, 2, 'C'), Array(int64, 2, 'C'))",
+    nogil=NUMBA_NOGIL,
+    cache=NUMBA_CACHE,
+    parallel=NUMBA_PARALLEL,
+    fastmath=NUMBA_FASTMATH,
+    error_model="numpy",
+)
+def _permbu_aggregate(samples, parents, indptr, children, ranks, permutations):
+    """PERMBU Level Aggregation
+
+    Overwrites the `parents` samples with the sum of their children samples,
+    reordered by the children `ranks`, and shuffled by the parents `permutations`.
+    Each parent is an independent subtree, aggregated in parallel.
+
+    **Parameters**<br>
+    `samples`: np.array [series,horizon,samples], modified in place.<br>
+    `parents`: np.array [parents], indexes of the parent series.<br>
+    `indptr`: np.array [parents + 1], the children of the k-th parent are `children[indptr[k]:indptr[k + 1]]`.<br>
+    `children`: np.array [children], indexes of the children series.<br>
+    `ranks`: np.array [series,samples], rank permutations of every series.<br>
+    `permutations`: np.array [parents,samples], random permutations of the parents.<br>
+    """
+    _, n_horizon, n_samples = samples.shape
+    for k in prange(parents.size):
+        aggregate = np.zeros((n_horizon, n_samples))
+        for c in children[indptr[k] : indptr[k + 1]]:
+            for t in range(n_horizon):
+                for s in range(n_samples):
+                    aggregate[t, s] += samples[c, t, ranks[c, s]]
+        p = parents[k]
+        for t in range(n_horizon):
+            for s in range(n_samples):
+                samples[p, t, s] = aggregate[t, permutations[k, s]]
+
+
 class PERMBU:
     """PERMBU Probabilistic Reconciliation Class.
 
@@ -253,6 +426,7 @@ class PERMBU:
     `sigmah`: np.array, forecast standard dev. of size (`base`, `horizon`).<br>
     `num_samples`: int, number of normal prediction samples generated.<br>
     `seed`: int, random seed for numpy generator's replicability.<br>
+    `max_chunk_bytes`: int, memory budget of the series samples summarized at once.<br>
 
     **References:**<br>
     - [Taieb, Souhaib Ben and Taylor, James W and Hyndman, Rob J. (2017).
@@ -271,6 +445,7 @@ class PERMBU:
         num_samples: Optional[int] = None,
         seed: int = 0,
         P: np.ndarray = None,
+        max_chunk_bytes: int = 2**27,
     ):
         # PERMBU only works for strictly hierarchical structures
         if not is_strictly_hierarchical(S, tags):
@@ -285,6 +460,26 @@ class PERMBU:
         self.sigmah = sigmah
         self.num_samples = num_samples
         self.seed = seed
+        self.max_chunk_bytes = max_chunk_bytes
+
+        # Parent/children links of every level from the bottom up,
+        # each bottom series has a row with its ancestors
+        hier_links = np.nonzero(np.asarray(S).T)[1].reshape(S.shape[1], -1)
+        self._levels = []
+        for level_idx in reversed(range(hier_links.shape[1] - 1)):
+            children_links = np.unique(hier_links[:, level_idx : level_idx + 2], axis=0)
+            parent_idxs, n_children = np.unique(
+                children_links[:, 0], return_counts=True
+            )
+            indptr = np.concatenate([[0], np.cumsum(n_children)])
+            # int64 indices for the kernel, whatever the default integer of the platform
+            self._levels.append(
+                (
+                    parent_idxs.astype(np.int64),
+                    indptr.astype(np.int64),
+                    np.ascontiguousarray(children_links[:, 1], dtype=np.int64),
+                )
+            )
 
     def _obtain_ranks(self, array):
         """Vector ranks
@@ -301,64 +496,10 @@ class PERMBU:
         """
         temp = array.argsort(axis=1)
         ranks = np.empty_like(temp)
-        a_range = np.arange(temp.shape[1])
-        for i_row in range(temp.shape[0]):
-            ranks[i_row, temp[i_row, :]] = a_range
+        a_range = np.broadcast_to(np.arange(temp.shape[1]), temp.shape)
+        np.put_along_axis(ranks, temp, a_range, axis=1)
         return ranks
 
-    def _permutate_samples(self, samples, permutations):
-        """Permutate Samples
-
-        Applies efficient vectorized permutation on the samples.
-
-        **Parameters**<br>
-        `samples`: np.array [series,samples], independent base samples.<br>
-        `permutations`: np.array [series,samples], permutation ranks with wich
-                  which `samples` dependence will be restored see `_obtain_ranks`.<br>
-
-        **Returns**<br>
-        `permutated_samples`: np.array.<br>
-        """
-        # Generate auxiliary and flat permutation indexes
-        n_rows, n_cols = permutations.shape
-        aux_row_idx = np.arange(n_rows)[:, None] * n_cols
-        aux_row_idx = np.repeat(aux_row_idx, repeats=n_cols, axis=1)
-        permutate_idxs = permutations.flatten() + aux_row_idx.flatten()
-
-        # Apply flat permutation indexes and recover original shape
-        permutated_samples = samples.flatten()
-        permutated_samples = permutated_samples[permutate_idxs]
-        permutated_samples = permutated_samples.reshape(n_rows, n_cols)
-        return permutated_samples
-
-    def _permutate_predictions(self, prediction_samples, permutations):
-        """Permutate Prediction Samples
-
-        Applies permutations to prediction_samples across the horizon.
-
-        **Parameters**<br>
-        `prediction_samples`: np.array [series,horizon,samples], independent
-                  base prediction samples.<br>
-        `permutations`: np.array [series, samples], permutation ranks with which
-                  `samples` dependence will be restored see `_obtain_ranks`.
-                  it can also apply a random permutation.<br>
-
-        **Returns**<br>
-        `permutated_prediction_samples`: np.array.<br>
-        """
-        # Apply permutation throughout forecast horizon
-        permutated_prediction_samples = prediction_samples.copy()
-
-        _, n_horizon, _ = prediction_samples.shape
-        for t in range(n_horizon):
-            permutated_prediction_samples[:, t, :] = self._permutate_samples(
-                prediction_samples[:, t, :], permutations
-            )
-        return permutated_prediction_samples
-
-    def _nonzero_indexes_by_row(self, M):
-        return [np.nonzero(M[row, :])[0] for row in range(len(M))]
-
     def get_samples(self, num_samples: Optional[int] = None):
         """PERMBU Sample Reconciliation Method.
 
@@ -390,74 +531,54 @@ class PERMBU:
                 residuals.shape[1], size=num_samples, replace=False
             )
         residuals = residuals[:, residuals_idxs]
-        rank_permutations = self._obtain_ranks(residuals)
-
-        n_series, n_horizon = self.y_hat.shape
-
-        base_samples = np.array(
-            [
-                rng.normal(loc=m, scale=s, size=num_samples)
-                for m, s in zip(self.y_hat.flatten(), self.sigmah.flatten())
-            ]
-        )
-        base_samples = base_samples.reshape(n_series, n_horizon, num_samples)
-
-        # Initialize PERMBU utility
-        rec_samples = base_samples.copy()
-        try:
-            encoder = OneHotEncoder(sparse_output=False, dtype=np.float64)
-        except TypeError:
-            encoder = OneHotEncoder(sparse=False, dtype=np.float64)
-        hier_links = np.vstack(self._nonzero_indexes_by_row(self.S.T))
-
-        # BottomUp hierarchy traversing
-        hier_levels = hier_links.shape[1] - 1
-        for level_idx in reversed(range(hier_levels)):
-            # Obtain aggregation matrix from parent/children links
-            children_links = np.unique(hier_links[:, level_idx : level_idx + 2], axis=0)
-            children_idxs = np.unique(children_links[:, 1])
-            parent_idxs = np.unique(children_links[:, 0])
-            Agg = encoder.fit_transform(children_links).T
-            Agg = Agg[: len(parent_idxs), :]
-
-            # Permute children_samples for each prediction step
-            children_permutations = rank_permutations[children_idxs, :]
-            children_samples = rec_samples[children_idxs, :, :]
-            children_samples = self._permutate_predictions(
-                prediction_samples=children_samples, permutations=children_permutations
+        rank_permutations = self._obtain_ranks(residuals).astype(np.int64, copy=False)
+
+        # Sample all the base marginals at once [series,horizon,samples]
+        rec_samples = rng.standard_normal(size=(*self.y_hat.shape, num_samples))
+        rec_samples *= self.sigmah[:, :, None]
+        rec_samples += self.y_hat[:, :, None]
+
+        # BottomUp hierarchy traversing, permuting the children samples
+        # with their ranks and randomly shuffling the parents after aggregation
+        for parent_idxs, indptr, children_idxs in self._levels:
+            random_permutation = rng.permuted(
+                np.tile(np.arange(num_samples, dtype=np.int64), (len(parent_idxs), 1)),
+                axis=1,
             )
-
-            # Overwrite hier_samples with BottomUp aggregation
-            # and randomly shuffle parent predictions after aggregation
-            parent_samples = np.einsum("ab,bhs->ahs", Agg, children_samples)
-            random_permutation = np.array(
-                [
-                    rng.permutation(np.arange(num_samples))
-                    for serie in range(len(parent_samples))
-                ]
+            _permbu_aggregate(
+                rec_samples,
+                parent_idxs,
+                indptr,
+                children_idxs,
+                rank_permutations,
+                random_permutation,
             )
-            parent_samples = self._permutate_predictions(
-                prediction_samples=parent_samples, permutations=random_permutation
-            )
-
-            rec_samples[parent_idxs, :, :] = parent_samples
         return rec_samples
 
+    def _get_sample_blocks(self, num_samples: Optional[int] = None):
+        """Yields the coherent samples of consecutive blocks of series within the memory budget."""
+        samples = self.get_samples(num_samples)
+        _, h, num_samples = samples.shape
+        block_size = max(1, self.max_chunk_bytes // (8 * h * num_samples))
+        for start in range(0, len(samples), block_size):
+            yield samples[start : start + block_size]
+
     def get_prediction_levels(self, res, level):
         """Adds reconciled forecast levels to results dictionary"""
-        samples = self.get_samples(num_samples=self.num_samples)
-        for lv in level:
-            min_q = (100 - lv) / 200
-            max_q = min_q + lv / 100
-            res[f"lo-{lv}"] = np.quantile(samples, min_q, axis=2)
-            res[f"hi-{lv}"] = np.quantile(samples, max_q, axis=2)
+        min_qs = [(100 - lv) / 200 for lv in level]
+        max_qs = [min_q + lv / 100 for min_q, lv in zip(min_qs, level)]
+        sample_quantiles = _sample_blocks_quantiles(
+            self._get_sample_blocks(self.num_samples), min_qs + max_qs
+        )
+        for i, lv in enumerate(level):
+            res[f"lo-{lv}"] = sample_quantiles[:, :, i]
+            res[f"hi-{lv}"] = sample_quantiles[:, :, len(level) + i]
         return res
 
     def get_prediction_quantiles(self, res, quantiles):
         """Adds reconciled forecast quantiles to results dictionary"""
-        samples = self.get_samples(num_samples=self.num_samples)
-
-        # [Q, N, H] -> [N, H, Q]
-        sample_quantiles = np.quantile(samples, quantiles, axis=2)
-        res["quantiles"] = sample_quantiles.transpose((1, 2, 0))
+        # Quantiles of blocks of series, without sorting the samples
+        res["quantiles"] = _sample_blocks_quantiles(
+            self._get_sample_blocks(self.num_samples), quantiles
+        )
         return res
@@ -1,13 +1,18 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/src/utils.ipynb.
 
 # %% auto 0
-__all__ = ['aggregate', 'aggregate_temporal', 'make_future_dataframe', 'get_cross_temporal_tags', 'HierarchicalPlot']
+__all__ = ['HierarchyStructure', 'aggregate', 'aggregate_temporal', 'make_future_dataframe', 'get_cross_temporal_tags',
+           'HierarchicalPlot', 'ResidualStatistics']
 
 # %% ../nbs/src/utils.ipynb 3
+import hashlib
 import itertools
 import reprlib
+import struct
 import sys
 import timeit
+import warnings
+import zipfile
 
 import matplotlib.pyplot as plt
 import narwhals as nw
@@ -17,11 +22,12 @@ import utilsforecast.processing as ufp
 import utilsforecast.validation as ufv
 from scipy import sparse
 
+from collections import OrderedDict, namedtuple
 from collections.abc import Sequence
 from narwhals.typing import Frame, FrameT
 from numba import njit, prange
 from sklearn.preprocessing import OneHotEncoder
-from typing import Optional, Union
+from typing import Callable, Optional, Union
 
 # %% ../nbs/src/utils.ipynb 5
 # Global variables
@@ -50,6 +56,94 @@ class CodeTimer:
             )
 
 # %% ../nbs/src/utils.ipynb 7
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+class _StructureCache:
+    """Least recently used store for quantities that only depend on `S`.
+
+    Reconcilers whose "projection" and "weight" matrices are a function of the
+    summing matrix alone (e.g., bottom-up and the structural min trace methods)
+    can share them across base models and across repeated reconciliations.
+    The entries are keyed on a fingerprint of `S` together with the
+    reconciler's parameters.
+
+    Parameters
+    ----------
+    maxsize : int (default=32)
+        Maximum number of entries to keep, the least recently used entry is
+        evicted first. If not positive, nothing is stored.
+
+    """
+
+    def __init__(self, maxsize: int = 32):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        # Memoize the fingerprint of the last summing matrix, as the same
+        # object is passed for every base model. It is only valid until
+        # `release` is called at the end of each reconciliation, since `S`
+        # can be changed in place between calls.
+        self._last_S = None
+        self._last_fingerprint = None
+
+    def fingerprint(self, S: Union[np.ndarray, sparse.spmatrix]) -> str:
+        """Hash the shape and values of a dense or sparse summing matrix."""
+        if S is self._last_S:
+            return self._last_fingerprint
+        digest = hashlib.blake2b(digest_size=16)
+        if sparse.issparse(S):
+            S_csr = sparse.csr_matrix(S)
+            S_csr.sum_duplicates()
+            digest.update(f"csr-{S_csr.shape}-{S_csr.dtype}".encode())
+            for arr in (S_csr.indptr, S_csr.indices, S_csr.data):
+                digest.update(np.ascontiguousarray(arr).view(np.uint8))
+        else:
+            S_arr = np.ascontiguousarray(S)
+            digest.update(f"dense-{S_arr.shape}-{S_arr.dtype}".encode())
+            digest.update(S_arr.view(np.uint8))
+        self._last_S = S
+        self._last_fingerprint = digest.hexdigest()
+        return self._last_fingerprint
+
+    def release(self) -> None:
+        """Forget the memoized fingerprint and the reference to the last `S`."""
+        self._last_S = None
+        self._last_fingerprint = None
+
+    def get(self, key: tuple):
+        """Return the entry for `key` and mark it as recently used, else `None`."""
+        try:
+            value = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: tuple, value) -> None:
+        """Store `value` under `key`, evicting the least recently used entries."""
+        if self.maxsize <= 0:
+            return
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all the entries and reset the counters."""
+        self._entries.clear()
+        self.release()
+        self.hits = 0
+        self.misses = 0
+
+    def info(self) -> CacheInfo:
+        """Report the hits, misses, maximum size, and current size."""
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._entries))
+
+# %% ../nbs/src/utils.ipynb 8
 def _construct_adjacency_matrix(
     S: sparse.csr_matrix, tags: dict[str, np.ndarray]
 ) -> sparse.csr_matrix:
@@ -88,7 +182,7 @@ def _construct_adjacency_matrix(
         )
     )
 
-# %% ../nbs/src/utils.ipynb 8
+# %% ../nbs/src/utils.ipynb 9
 def is_strictly_hierarchical(S: np.ndarray, tags: dict[str, np.ndarray]) -> bool:
     # main idea:
     # if S represents a strictly hierarchical structure
@@ -105,7 +199,7 @@ def is_strictly_hierarchical(S: np.ndarray, tags: dict[str, np.ndarray]) -> bool
     nodes = levels_.popitem()[1].size
     return paths == nodes
 
-# %% ../nbs/src/utils.ipynb 9
+# %% ../nbs/src/utils.ipynb 10
 def _is_strictly_hierarchical(A: sparse.csr_matrix) -> bool:
     """Check if a disaggregation structure is strictly hierarchical.
 
@@ -125,7 +219,246 @@ def _is_strictly_hierarchical(A: sparse.csr_matrix) -> bool:
     """
     return np.all(A.sum(axis=0).A1[1:] == 1)
 
-# %% ../nbs/src/utils.ipynb 11
+# %% ../nbs/src/utils.ipynb 12
+def _load_npz(path, mmap_mode: Optional[str] = "r") -> dict[str, np.ndarray]:
+    # Arrays of an `.npz` archive written by `np.savez`. With `mmap_mode`, the arrays
+    # stored without compression are memory-mapped from the archive instead of read,
+    # so that several processes share the pages of the same file.
+    arrays = {}
+    with zipfile.ZipFile(path) as archive, open(path, "rb") as file:
+        for info in archive.infolist():
+            name = info.filename[: -len(".npy")]
+            with archive.open(info) as member:
+                version = np.lib.format.read_magic(member)
+                if version == (1, 0):
+                    shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(
+                        member
+                    )
+                else:
+                    shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(
+                        member
+                    )
+                header_size = member.tell()
+                if (
+                    mmap_mode is None
+                    or info.compress_type != zipfile.ZIP_STORED
+                    or dtype.hasobject
+                    or np.prod(shape) == 0
+                ):
+                    member.seek(0)
+                    arrays[name] = np.lib.format.read_array(member, allow_pickle=False)
+                    continue
+            # The data follows the local file header, its name and its extra field
+            file.seek(info.header_offset + 26)
+            name_size, extra_size = struct.unpack("<HH", file.read(4))
+            offset = info.header_offset + 30 + name_size + extra_size + header_size
+            arrays[name] = np.memmap(
+                path,
+                dtype=dtype,
+                mode=mmap_mode,
+                offset=offset,
+                shape=shape,
+                order="F" if fortran_order else "C",
+            )
+    return arrays
+
+# %% ../nbs/src/utils.ipynb 13
+class HierarchyStructure:
+    """Hierarchy Structure
+
+    Structure of a hierarchy that does not depend on the data, to be built once and reused
+    across `reconcile` calls and processes in place of the wide `S_df` and the `tags`: the
+    summing matrix in CSR format, the ids of the series in the order of its rows, the integer
+    indices of the series of each level, the parent of each series and the offsets of the
+    levels in the concatenated indices. `aggregate` returns it with `structure=True`, and
+    `HierarchicalReconciliation` and the reconcilers accept it as `S`.
+
+    The parent of a series is the series of the closest previous level in `tags` whose
+    bottom series contain its bottom series, or -1 if there is none.
+
+    **Parameters:**<br>
+    `S`: np.ndarray or sparse matrix, summing matrix of size (`base`, `bottom`).<br>
+    `ids`: np.ndarray, ids of the `base` series in the order of the rows of `S`.<br>
+    `tags`: dict, each key is a level and its value contains the ids of the series of that level.<br>
+    """
+
+    def __init__(self, S, ids: np.ndarray, tags: dict[str, np.ndarray]):
+        self.S = sparse.csr_matrix(S, dtype=np.float64)
+        self.ids = np.asarray(ids)
+        positions = pd.Index(self.ids).get_indexer
+        level_indices = []
+        for level, level_ids in tags.items():
+            idxs = positions(np.asarray(level_ids))
+            if np.any(idxs < 0):
+                missing = set(np.asarray(level_ids)[idxs < 0])
+                raise ValueError(
+                    f"There are ids in the level `{level}` of tags that are not in ids: {reprlib.repr(missing)}"
+                )
+            level_indices.append(idxs)
+        self.level_names = np.array(list(tags.keys()), dtype=str)
+        self.level_offsets = np.cumsum([0] + [len(idxs) for idxs in level_indices])
+        self.level_indices = (
+            np.concatenate(level_indices)
+            if level_indices
+            else np.empty(0, dtype=np.intp)
+        )
+        self.parents = self._get_parents()
+        self._S_dense = None
+        self._check_arrays()
+
+    @classmethod
+    def from_frame(
+        cls, S_df: Frame, tags: dict[str, np.ndarray], id_col: str = "unique_id"
+    ) -> "HierarchyStructure":
+        """Hierarchy Structure from a Summing DataFrame
+
+        **Parameters:**<br>
+        `S_df`: DataFrame with summing matrix of size `(base, bottom)`, see [aggregate method](https://nixtla.github.io/hierarchicalforecast/utils.html#aggregate).<br>
+        `tags`: Each key is a level and its value contains tags associated to that level.<br>
+        `id_col`: str='unique_id', column that identifies each serie.<br>
+
+        **Returns:**<br>
+        `structure`: HierarchyStructure, structure of the hierarchy.
+        """
+        S_nw = nw.from_native(S_df)
+        bottom_cols = [col for col in S_nw.columns if col != id_col]
+        S_bottom = S_nw.select(nw.col(bottom_cols))
+        if nw.dependencies.is_pandas_dataframe(S_df) and any(
+            isinstance(dtype, pd.SparseDtype) for dtype in S_df[bottom_cols].dtypes
+        ):
+            S = S_bottom.to_native().sparse.to_coo()
+        else:
+            S = S_bottom.to_numpy()
+        return cls(S=S, ids=S_nw[id_col].to_numpy(), tags=tags)
+
+    def _check_arrays(self):
+        n_series = self.S.shape[0]
+        for name in ["ids", "parents"]:
+            if len(getattr(self, name)) != n_series:
+                raise ValueError(
+                    f"Expected {n_series} {name}, one per row of `S`, got {len(getattr(self, name))}."
+                )
+        if (
+            len(self.level_offsets) != len(self.level_names) + 1
+            or self.level_offsets[-1] != len(self.level_indices)
+            or np.any(np.diff(self.level_offsets) < 0)
+        ):
+            raise ValueError("The level offsets do not match the level indices.")
+        if len(self.level_indices) and (
+            self.level_indices.min() < 0 or self.level_indices.max() >= n_series
+        ):
+            raise ValueError("There are level indices out of the rows of `S`.")
+
+    def _get_parents(self) -> np.ndarray:
+        n_series, n_bottom = self.S.shape
+        parents = np.full(n_series, -1, dtype=np.intp)
+        row_sizes = np.diff(self.S.indptr)
+        levels = [
+            self.level_indices[start:end]
+            for start, end in zip(self.level_offsets[:-1], self.level_offsets[1:])
+        ]
+        for k, children in enumerate(levels):
+            children = children[row_sizes[children] > 0]
+            for upper in levels[k - 1 :: -1] if k > 0 else []:
+                children = children[parents[children] < 0]
+                if len(children) == 0:
+                    break
+                # Series of the upper level that contains each bottom series
+                upper = upper[row_sizes[upper] > 0]
+                bottom_to_upper = np.full(n_bottom, -1, dtype=np.intp)
+                bottom_to_upper[self.S[upper].indices] = np.repeat(
+                    upper, row_sizes[upper]
+                )
+                S_children = self.S[children]
+                candidates = bottom_to_upper[S_children.indices[S_children.indptr[:-1]]]
+                contained = np.minimum.reduceat(
+                    bottom_to_upper[S_children.indices]
+                    == np.repeat(candidates, row_sizes[children]),
+                    S_children.indptr[:-1],
+                )
+                found = contained & (candidates >= 0) & (candidates != children)
+                parents[children[found]] = candidates[found]
+        return parents
+
+    @property
+    def idx_bottom(self) -> np.ndarray:
+        """Indices of the bottom series, the last rows of `S`."""
+        n_series, n_bottom = self.S.shape
+        return np.arange(n_series)[-n_bottom:]
+
+    @property
+    def tag_indices(self) -> dict[str, np.ndarray]:
+        """Integer indices of the series of each level."""
+        return {
+            str(level): self.level_indices[start:end]
+            for level, start, end in zip(
+                self.level_names, self.level_offsets[:-1], self.level_offsets[1:]
+            )
+        }
+
+    @property
+    def tags(self) -> dict[str, np.ndarray]:
+        """Ids of the series of each level, as the `tags` of `aggregate`."""
+        return {level: self.ids[idxs] for level, idxs in self.tag_indices.items()}
+
+    @property
+    def S_dense(self) -> np.ndarray:
+        """Dense summing matrix, computed once."""
+        if self._S_dense is None:
+            self._S_dense = self.S.toarray()
+        return self._S_dense
+
+    def save(self, path):
+        """Save Hierarchy Structure
+
+        Writes the arrays of the structure without compression to the `.npz` file `path`,
+        so that `load` can memory-map them.
+
+        **Parameters:**<br>
+        `path`: str or Path, file to write.<br>
+        """
+        ids = self.ids.astype(str) if self.ids.dtype.hasobject else self.ids
+        np.savez(
+            path,
+            S_data=self.S.data,
+            S_indices=self.S.indices,
+            S_indptr=self.S.indptr,
+            S_shape=np.array(self.S.shape),
+            ids=ids,
+            level_names=self.level_names,
+            level_offsets=self.level_offsets,
+            level_indices=self.level_indices,
+            parents=self.parents,
+        )
+
+    @classmethod
+    def load(cls, path, mmap_mode: Optional[str] = "r") -> "HierarchyStructure":
+        """Load Hierarchy Structure
+
+        **Parameters:**<br>
+        `path`: str or Path, `.npz` file written by `save`.<br>
+        `mmap_mode`: str='r', memory-map the arrays from the file with this mode, or read them with None.<br>
+
+        **Returns:**<br>
+        `structure`: HierarchyStructure, structure of the hierarchy.
+        """
+        arrays = _load_npz(path, mmap_mode=mmap_mode)
+        structure = cls.__new__(cls)
+        structure.S = sparse.csr_matrix(
+            (arrays["S_data"], arrays["S_indices"], arrays["S_indptr"]),
+            shape=tuple(int(size) for size in arrays["S_shape"]),
+            copy=False,
+        )
+        structure.ids = arrays["ids"]
+        structure.level_names = arrays["level_names"]
+        structure.level_offsets = arrays["level_offsets"]
+        structure.level_indices = arrays["level_indices"]
+        structure.parents = arrays["parents"]
+        structure._S_dense = None
+        structure._check_arrays()
+        return structure
+
+# %% ../nbs/src/utils.ipynb 19
 def _to_upper_hierarchy(
     bottom_split: list[str], bottom_values: str, upper_key: str
 ) -> list[str]:
@@ -138,7 +471,7 @@ def _to_upper_hierarchy(
 
     return [join_upper(val) for val in bottom_values]
 
-# %% ../nbs/src/utils.ipynb 12
+# %% ../nbs/src/utils.ipynb 20
 def aggregate(
     df: Frame,
     spec: list[list[str]],
@@ -148,7 +481,8 @@ def aggregate(
     time_col: str = "ds",
     id_time_col: Optional[str] = None,
     target_cols: Sequence[str] = ("y",),
-) -> tuple[FrameT, FrameT, dict]:
+    structure: bool = False,
+) -> Union[tuple[FrameT, FrameT, dict], tuple[FrameT, "HierarchyStructure"]]:
     """Utils Aggregation Function.
     Aggregates bottom level series contained in the DataFrame `df` according
     to levels defined in the `spec` list.
@@ -171,6 +505,8 @@ def aggregate(
         Column that will identify each timestep after temporal aggregation. If provided, aggregate will operate temporally.
     target_cols : (default=['y'])
         list of columns that contains the targets to aggregate.
+    structure : bool (default=False)
+        Return a `HierarchyStructure` in place of `S_df` and `tags`.
 
     Returns
     -------
@@ -180,6 +516,8 @@ def aggregate(
         Summing dataframe.
     tags : dict
         Aggregation indices.
+    structure : HierarchyStructure
+        Summing matrix and aggregation indices, only with `structure=True` in place of `S_df` and `tags`.
     """
     # To Narwhals
     target_cols = list(target_cols)
@@ -337,6 +675,11 @@ def aggregate(
     )
     S_dum = encoder.fit_transform(S)
 
+    if structure:
+        return Y_df, HierarchyStructure(
+            S=S_dum.T, ids=np.asarray(category_list), tags=tags
+        )
+
     if not sparse_s:
         S_nw = nw.from_dict(
             {
@@ -355,7 +698,7 @@ def aggregate(
 
     return Y_df, S_df, tags
 
-# %% ../nbs/src/utils.ipynb 25
+# %% ../nbs/src/utils.ipynb 34
 def aggregate_temporal(
     df: Frame,
     spec: dict[str, int],
@@ -485,7 +828,7 @@ def aggregate_temporal(
 
     return Y_df, S_df, tags
 
-# %% ../nbs/src/utils.ipynb 30
+# %% ../nbs/src/utils.ipynb 39
 def make_future_dataframe(
     df: Frame,
     freq: Union[str, int],
@@ -525,7 +868,7 @@ def make_future_dataframe(
     )
     return future_df
 
-# %% ../nbs/src/utils.ipynb 34
+# %% ../nbs/src/utils.ipynb 43
 def get_cross_temporal_tags(
     df: Frame,
     tags_cs: dict[str, np.ndarray],
@@ -584,7 +927,7 @@ def get_cross_temporal_tags(
 
     return df, tags_ct
 
-# %% ../nbs/src/utils.ipynb 42
+# %% ../nbs/src/utils.ipynb 51
 class HierarchicalPlot:
     """Hierarchical Plot
 
@@ -869,7 +1212,7 @@ class HierarchicalPlot:
         plt.grid()
         plt.show()
 
-# %% ../nbs/src/utils.ipynb 63
+# %% ../nbs/src/utils.ipynb 72
 # convert levels to output quantile names
 def level_to_outputs(level: list[int]) -> tuple[list[float], list[str]]:
     """Converts list of levels into output names matching StatsForecast and NeuralForecast methods.
@@ -914,7 +1257,38 @@ def quantiles_to_outputs(quantiles: list[float]) -> tuple[list[float], list[str]
             output_names.append("-median")
     return quantiles, output_names
 
-# %% ../nbs/src/utils.ipynb 64
+# %% ../nbs/src/utils.ipynb 73
+# quantiles from a partial sort of the samples
+def _quantiles_partition(
+    samples: np.ndarray, quantiles: np.ndarray, axis: int = -1
+) -> np.ndarray:
+    """Quantiles of `samples` along `axis` with linear interpolation, equal to `np.quantile`.
+
+    Only selects the order statistics next to each quantile with `np.partition`
+    instead of sorting the whole axis.
+
+    **Parameters:**<br>
+    `samples`: numpy array. Samples with the sample dimension at `axis`.<br>
+    `quantiles`: float list in [0., 1.]. Quantiles to estimate.<br>
+    `axis`: int. Sample dimension of `samples`.<br>
+
+    **Returns:**<br>
+    `sample_quantiles`: numpy array. Quantiles in the first dimension followed by the other dimensions of `samples`.
+    """
+    n_samples = samples.shape[axis]
+    positions = np.asarray(quantiles, dtype=np.float64) * (n_samples - 1)
+    lo = np.floor(positions).astype(np.int64)
+    hi = np.minimum(lo + 1, n_samples - 1)
+    weights = positions - lo
+
+    samples = np.moveaxis(np.partition(samples, np.union1d(lo, hi), axis=axis), axis, 0)
+    a = samples[lo]
+    b = samples[hi]
+    weights = weights.reshape(-1, *[1] * (samples.ndim - 1))
+    # Same interpolation as numpy, which is monotonic in the weights
+    return np.where(weights >= 0.5, b - (b - a) * (1 - weights), a + (b - a) * weights)
+
+
 # given input array of sample forecasts and inptut quantiles/levels,
 # output a Pandas Dataframe with columns of quantile predictions
 def samples_to_quantiles_df(
@@ -976,17 +1350,20 @@ def samples_to_quantiles_df(
     elif quantiles is not None:
         _quantiles, quantile_names = quantiles_to_outputs(quantiles)
 
-    percentiles = [quantile * 100 for quantile in _quantiles]
     col_names = np.array(
         [model_name + quantile_name for quantile_name in quantile_names]
     )
 
-    # add quantiles to dataframe
-    forecasts_quantiles = np.percentile(samples, percentiles, axis=1)
-
-    forecasts_quantiles = np.transpose(
-        forecasts_quantiles, (1, 2, 0)
-    )  # [Q,H,N] -> [N,H,Q]
+    # add quantiles to dataframe, in blocks of series of up to 128 MiB of samples
+    forecasts_quantiles = np.empty((n_series, horizon, len(_quantiles)))
+    block_size = max(1, 2**27 // (8 * n_samples * horizon))
+    for start in range(0, n_series, block_size):
+        block_quantiles = _quantiles_partition(
+            samples[start : start + block_size], _quantiles, axis=1
+        )
+        forecasts_quantiles[start : start + block_size] = np.transpose(
+            block_quantiles, (1, 2, 0)
+        )  # [Q,B,H] -> [B,H,Q]
     forecasts_quantiles = forecasts_quantiles.reshape(-1, len(_quantiles))
 
     df_nw = nw.from_dict(
@@ -999,59 +1376,129 @@ def samples_to_quantiles_df(
 
     return _quantiles, df_nw.to_native()
 
-# %% ../nbs/src/utils.ipynb 71
+# %% ../nbs/src/utils.ipynb 81
 # Masked empirical covariance matrix
-@njit(
-    "Array(float64, 2, 'F')(Array(float64, 2, 'C'), Array(bool_, 2, 'C'))",
-    nogil=NUMBA_NOGIL,
-    cache=NUMBA_CACHE,
-    parallel=NUMBA_PARALLEL,
-    fastmath=NUMBA_FASTMATH,
-    error_model="numpy",
-)
-def _ma_cov(residuals: np.ndarray, not_nan_mask: np.ndarray):
-    """Masked empirical covariance matrix.
+def _masked_covariance_tile(
+    counts: np.ndarray, sums_i: np.ndarray, sums_j: np.ndarray, cross: np.ndarray
+) -> np.ndarray:
+    """Empirical covariances of a tile of pairs of series from their masked sums.
+
+    `counts` is the number of samples where both series of a pair are not nan, `sums_i`
+    and `sums_j` the sums of the first and second series over those samples and
+    `cross` the sums of their products.
 
     :meta private:
     """
-    n_timeseries = residuals.shape[0]
-    W = np.zeros((n_timeseries, n_timeseries), dtype=np.float64).T
-    for i in prange(n_timeseries):
-        not_nan_mask_i = not_nan_mask[i]
-        for j in range(i + 1):
-            not_nan_mask_j = not_nan_mask[j]
-            not_nan_mask_ij = not_nan_mask_i & not_nan_mask_j
-            n_samples = np.sum(not_nan_mask_ij)
-            # Only compute if we have enough non-nan samples in the time series pair
-            if n_samples > 1:
-                # Masked residuals
-                residuals_i = residuals[i][not_nan_mask_ij]
-                residuals_j = residuals[j][not_nan_mask_ij]
-                residuals_i_mean = np.mean(residuals_i)
-                residuals_j_mean = np.mean(residuals_j)
-                X_i = residuals_i - residuals_i_mean
-                X_j = residuals_j - residuals_j_mean
-                # Empirical covariance
-                factor_emp_cov = np.float64(1 / (n_samples - 1))
-                W[i, j] = W[j, i] = factor_emp_cov * np.sum(X_i * X_j)
+    # Only compute if we have enough non-nan samples in the time series pair
+    enough = counts > 1
+    n_samples = np.where(enough, counts, 2.0)
+    W = (cross - sums_i * sums_j / n_samples) / (n_samples - 1)
+    W[~enough] = 0.0
+    return W
+
+
+def _masked_covariance_tiles(
+    n_timeseries: int, products: Callable, max_tile_bytes: int = 2**27
+) -> np.ndarray:
+    """Empirical covariance matrix assembled from tiles of pairs of series.
 
+    `products(rows, cols)` returns the arguments of `_masked_covariance_tile` for
+    the pairs of the `rows` and `cols` slices, with the size of the tiles capped by
+    `max_tile_bytes`.
+
+    :meta private:
+    """
+    W = np.zeros((n_timeseries, n_timeseries), dtype=np.float64).T
+    # There are about five (tile, tile) temporary arrays.
+    tile = max(1, int(np.sqrt(max_tile_bytes / (5 * 8))))
+    for i0 in range(0, n_timeseries, tile):
+        rows = slice(i0, min(i0 + tile, n_timeseries))
+        for j0 in range(0, i0 + 1, tile):
+            cols = slice(j0, min(j0 + tile, n_timeseries))
+            W_tile = _masked_covariance_tile(*products(rows, cols))
+            W[rows, cols] = W_tile
+            W[cols, rows] = W_tile.T
     return W
 
-# %% ../nbs/src/utils.ipynb 72
+
+def _ma_cov(
+    residuals: np.ndarray, not_nan_mask: np.ndarray, max_tile_bytes: int = 2**27
+) -> np.ndarray:
+    """Masked empirical covariance matrix.
+
+    The covariance of each pair of series only uses the samples where both of
+    them are not nan. With the zero-filled residuals `X` and the mask
+    indicators `M`, the counts `M M'`, the partial sums `X M'` and the cross
+    products `X X'` of every pair come from matrix products, so that
+    `W_ij = ((X X')_ij - (X M')_ij (X M')_ji / (M M')_ij) / ((M M')_ij - 1)`.
+    The products are computed in tiles of pairs, with the size of the tiles
+    capped by `max_tile_bytes`.
+
+    :meta private:
+    """
+    M = not_nan_mask.astype(np.float64)
+    X = np.where(not_nan_mask, residuals, 0.0)
+    # Centering every series on its own mean leaves the covariances unchanged,
+    # but avoids cancellation in the difference of the products.
+    X -= (X.sum(axis=1) / np.maximum(M.sum(axis=1), 1.0))[:, None] * M
+
+    def products(rows, cols):
+        return (
+            M[rows] @ M[cols].T,
+            X[rows] @ M[cols].T,
+            M[rows] @ X[cols].T,
+            X[rows] @ X[cols].T,
+        )
+
+    return _masked_covariance_tiles(residuals.shape[0], products, max_tile_bytes)
+
+# %% ../nbs/src/utils.ipynb 82
 # Shrunk covariance matrix using the Schafer-Strimmer method
 
 
-@njit(
-    "Array(float64, 2, 'F')(Array(float64, 2, 'C'), float64)",
-    nogil=NUMBA_NOGIL,
-    cache=NUMBA_CACHE,
-    parallel=NUMBA_PARALLEL,
-    fastmath=NUMBA_FASTMATH,
-    error_model="numpy",
-)
+def _schaferstrimmer_shrinkage(residuals: np.ndarray) -> tuple[np.ndarray, float]:
+    """Centered `residuals` (n_timeseries, n_samples) without nans and the Schafer-Strimmer shrinkage intensity.
+
+    The residuals are centered and standardized once. The off-diagonal sum of the
+    squared empirical correlations comes from the Gram matrix of the standardized
+    residuals, and the off-diagonal sum of the variances of the empirical correlations
+    from a second pass over the squared standardized residuals.
+
+    :meta private:
+    """
+    n_timeseries, n_samples = residuals.shape
+    epsilon = 2e-8
+    X = residuals - residuals.mean(axis=1, keepdims=True)
+    # Centered standardized residuals
+    Z = X / (residuals.std(axis=1, keepdims=True) + epsilon)
+    Z -= Z.mean(axis=1, keepdims=True)
+    Z2 = np.square(Z)
+    # Sums over all the pairs, including i == j, of the squared empirical
+    # correlation and of the sum of squared products w_ijt = Z_it Z_jt.
+    # The Frobenius norm of Z' Z equals the one of Z Z', so take the smaller.
+    gram = Z.T @ Z if n_samples <= n_timeseries else Z @ Z.T
+    sum_sq_gram = np.sum(np.square(gram))
+    sum_sq_w = np.sum(np.square(np.sum(Z2, axis=0)))
+    # Diagonal terms
+    q = np.sum(Z2, axis=1)
+    sum_sq_gram_diag = np.sum(np.square(q))
+    sum_sq_w_diag = np.sum(np.square(Z2))
+    # Off-diagonal sums over i > j
+    sum_sq_emp_corr = 0.5 * (sum_sq_gram - sum_sq_gram_diag) / n_samples**2
+    sum_var_emp_corr = 0.5 * (
+        (sum_sq_w - sum_sq_w_diag) - (sum_sq_gram - sum_sq_gram_diag) / n_samples
+    )
+    factor_shrinkage = 1 / (n_samples * (n_samples - 1))
+    shrinkage = 1.0 - max(
+        min((factor_shrinkage * sum_var_emp_corr) / (sum_sq_emp_corr + epsilon), 1.0),
+        0.0,
+    )
+    return X, shrinkage
+
+
 def _shrunk_covariance_schaferstrimmer_no_nans(
     residuals: np.ndarray, mint_shr_ridge: float
-):
+) -> np.ndarray:
     """Shrink empirical covariance according to the following method:
         Schäfer, Juliane, and Korbinian Strimmer.
         ‘A Shrinkage Approach to Large-Scale Covariance Matrix Estimation and
@@ -1061,64 +1508,143 @@ def _shrunk_covariance_schaferstrimmer_no_nans(
 
     :meta private:
     """
-    n_timeseries = residuals.shape[0]
     n_samples = residuals.shape[1]
+    X, shrinkage = _schaferstrimmer_shrinkage(residuals)
+    # Shrink the empirical covariance
+    W = (shrinkage / (n_samples - 1)) * (X @ X.T)
+    W[np.diag_indices_from(W)] = np.maximum(
+        np.sum(np.square(X), axis=1) / (n_samples - 1), mint_shr_ridge
+    )
+    # W is symmetric, so its transpose is the Fortran ordered copy
+    return W.T
+
+
+def _schaferstrimmer_tile(
+    counts: np.ndarray,
+    sums_i: np.ndarray,
+    sums_j: np.ndarray,
+    squares_i: np.ndarray,
+    squares_j: np.ndarray,
+    cross: np.ndarray,
+    cubes_i: np.ndarray,
+    cubes_j: np.ndarray,
+    fourth: np.ndarray,
+    offdiag: np.ndarray,
+    nans: bool = True,
+) -> tuple[np.ndarray, float, float]:
+    """Empirical covariances of a tile of pairs of series and their Schafer-Strimmer sums.
+
+    `counts` is the number of samples where both series of a pair are not nan. Over
+    those samples, `sums_i`, `squares_i`, `cubes_i` are the sums of `x_i`, `x_i^2`
+    and `x_i^2 x_j`, `sums_j`, `squares_j`, `cubes_j` the ones of `x_j`, `x_j^2`
+    and `x_i x_j^2`, `cross` the sums of `x_i x_j` and `fourth` the sums of
+    `x_i^2 x_j^2`. The variance and squared empirical correlation sums only run over
+    the `offdiag` pairs, normalized as `_shrunk_covariance_schaferstrimmer_with_nans`
+    if `nans`, else as `_shrunk_covariance_schaferstrimmer_no_nans`.
+
+    :meta private:
+    """
+    epsilon = 2e-8
+    # Only compute if we have enough non-nan samples in the time series pair
+    enough = counts > 1
+    n_samples = np.where(enough, counts, 2.0)
+    mean_i = sums_i / n_samples
+    mean_j = sums_j / n_samples
+    cov = cross - n_samples * mean_i * mean_j
+    # Empirical covariance
+    W = cov / (n_samples - 1)
+    W[~enough] = 0.0
+    # Standard deviations as in the pairwise estimators
+    n_epsilon = 2 if nans else 1
+    std_i = (
+        np.sqrt(np.maximum(squares_i / n_samples - mean_i**2, 0.0))
+        + n_epsilon * epsilon
+    )
+    std_j = (
+        np.sqrt(np.maximum(squares_j / n_samples - mean_j**2, 0.0))
+        + n_epsilon * epsilon
+    )
+    std_ij = std_i * std_j
+    # Sum of the squared products of the centered residuals of the pairs
+    sum_sq_prod = (
+        fourth
+        - 2 * mean_j * cubes_i
+        - 2 * mean_i * cubes_j
+        + mean_j**2 * squares_i
+        + mean_i**2 * squares_j
+        + 4 * mean_i * mean_j * cross
+        - 3 * n_samples * mean_i**2 * mean_j**2
+    )
+    # Off-diagonal variance and square of the empirical correlation
+    var_emp_corr = (sum_sq_prod - cov**2 / n_samples) / std_ij**2
+    if nans:
+        var_emp_corr *= n_samples / (n_samples - 1) ** 3
+        sq_emp_corr = np.square(cov / ((n_samples - 1) * std_ij))
+    else:
+        var_emp_corr /= n_samples * (n_samples - 1)
+        sq_emp_corr = np.square(cov / (n_samples * std_ij))
+    offdiag = offdiag & enough
+    return W, np.sum(var_emp_corr[offdiag]), np.sum(sq_emp_corr[offdiag])
+
+
+def _shrunk_covariance_schaferstrimmer_tiles(
+    n_timeseries: int,
+    products: Callable,
+    mint_shr_ridge: float,
+    max_tile_bytes: int = 2**27,
+    nans: bool = True,
+) -> np.ndarray:
+    """Schafer-Strimmer shrunk covariance matrix assembled from tiles of pairs of series.
+
+    `products(rows, cols)` returns the sums of `_schaferstrimmer_tile` for the pairs
+    of the `rows` and `cols` slices, with the size of the tiles capped by `max_tile_bytes`.
 
+    :meta private:
+    """
+    epsilon = 2e-8
     # We need the empirical covariance, the off-diagonal sum of the variance of
     # the empirical correlation matrix and the off-diagonal sum of the squared
     # empirical correlation matrix.
     W = np.zeros((n_timeseries, n_timeseries), dtype=np.float64).T
     sum_var_emp_corr = np.float64(0.0)
     sum_sq_emp_corr = np.float64(0.0)
-    factor_emp_cov = np.float64(1 / (n_samples - 1))
-    factor_shrinkage = np.float64(1 / (n_samples * (n_samples - 1)))
-    epsilon = np.float64(2e-8)
-    for i in prange(n_timeseries):
-        # Mean of the standardized residuals
-        X_i = residuals[i] - np.mean(residuals[i])
-        Xs_i = X_i / (np.std(residuals[i]) + epsilon)
-        Xs_i_mean = np.mean(Xs_i)
-        for j in range(i + 1):
-            # Empirical covariance
-            X_j = residuals[j] - np.mean(residuals[j])
-            W[i, j] = factor_emp_cov * np.sum(X_i * X_j)
-            # Off-diagonal sums
-            if i != j:
-                Xs_j = X_j / (np.std(residuals[j]) + epsilon)
-                Xs_j_mean = np.mean(Xs_j)
-                # Sum off-diagonal variance of empirical correlation
-                w = (Xs_i - Xs_i_mean) * (Xs_j - Xs_j_mean)
-                w_mean = np.mean(w)
-                sum_var_emp_corr += np.sum(np.square(w - w_mean))
-                # Sum squared empirical correlation
-                sum_sq_emp_corr += w_mean**2
+    # There are about sixteen (tile, tile) temporary arrays.
+    tile = max(1, int(np.sqrt(max_tile_bytes / (16 * 8))))
+    for i0 in range(0, n_timeseries, tile):
+        rows = slice(i0, min(i0 + tile, n_timeseries))
+        for j0 in range(0, i0 + 1, tile):
+            cols = slice(j0, min(j0 + tile, n_timeseries))
+            shape = (rows.stop - rows.start, cols.stop - cols.start)
+            offdiag = (
+                np.ones(shape, dtype=bool)
+                if j0 < i0
+                else np.tri(*shape, k=-1, dtype=bool)
+            )
+            W_tile, var_emp_corr, sq_emp_corr = _schaferstrimmer_tile(
+                *products(rows, cols), offdiag=offdiag, nans=nans
+            )
+            W[rows, cols] = W_tile
+            W[cols, rows] = W_tile.T
+            sum_var_emp_corr += var_emp_corr
+            sum_sq_emp_corr += sq_emp_corr
 
     # Calculate shrinkage intensity
-    shrinkage = 1.0 - max(
-        min((factor_shrinkage * sum_var_emp_corr) / (sum_sq_emp_corr + epsilon), 1.0),
-        0.0,
-    )
+    shrinkage = 1.0 - max(min(sum_var_emp_corr / (sum_sq_emp_corr + epsilon), 1.0), 0.0)
+
     # Shrink the empirical covariance
-    for i in prange(n_timeseries):
-        for j in range(i + 1):
-            if i != j:
-                W[i, j] = W[j, i] = shrinkage * W[i, j]
-            else:
-                W[i, j] = W[j, i] = max(W[i, j], mint_shr_ridge)
+    var = np.diag(W).copy()
+    W *= shrinkage
+    W[np.diag_indices_from(W)] = np.maximum(var, mint_shr_ridge)
+
     return W
 
 
-@njit(
-    "Array(float64, 2, 'F')(Array(float64, 2, 'C'), Array(bool_, 2, 'C'), float64)",
-    nogil=NUMBA_NOGIL,
-    cache=NUMBA_CACHE,
-    parallel=NUMBA_PARALLEL,
-    fastmath=NUMBA_FASTMATH,
-    error_model="numpy",
-)
 def _shrunk_covariance_schaferstrimmer_with_nans(
-    residuals: np.ndarray, not_nan_mask: np.ndarray, mint_shr_ridge: float
-):
+    residuals: np.ndarray,
+    not_nan_mask: np.ndarray,
+    mint_shr_ridge: float,
+    max_tile_bytes: int = 2**27,
+) -> np.ndarray:
     """Shrink empirical covariance according to the following method:
         Schäfer, Juliane, and Korbinian Strimmer.
         ‘A Shrinkage Approach to Large-Scale Covariance Matrix Estimation and
@@ -1126,69 +1652,470 @@ def _shrunk_covariance_schaferstrimmer_with_nans(
         Genetics and Molecular Biology 4, no. 1 (14 January 2005).
         https://doi.org/10.2202/1544-6115.1175.
 
+    Each pair of series only uses the samples where both of them are not nan. The
+    pairwise means, variances, covariances and sums of squared products of the
+    standardized residuals are expanded into matrix products of the powers of the
+    zero-filled residuals with the mask indicators, computed in tiles of pairs with
+    the size of the tiles capped by `max_tile_bytes`.
+
     :meta private:
     """
-    n_timeseries = residuals.shape[0]
+    M = not_nan_mask.astype(np.float64)
+    X = np.where(not_nan_mask, residuals, 0.0)
+    # Centering every series on its own mean leaves the estimator unchanged,
+    # but avoids cancellation in the expanded sums.
+    X -= (X.sum(axis=1) / np.maximum(M.sum(axis=1), 1.0))[:, None] * M
+    X2 = np.square(X)
+
+    def products(rows, cols):
+        return (
+            M[rows] @ M[cols].T,
+            X[rows] @ M[cols].T,
+            M[rows] @ X[cols].T,
+            X2[rows] @ M[cols].T,
+            M[rows] @ X2[cols].T,
+            X[rows] @ X[cols].T,
+            X2[rows] @ X[cols].T,
+            X[rows] @ X2[cols].T,
+            X2[rows] @ X2[cols].T,
+        )
 
-    # We need the empirical covariance, the off-diagonal sum of the variance of
-    # the empirical correlation matrix and the off-diagonal sum of the squared
-    # empirical correlation matrix.
-    W = np.zeros((n_timeseries, n_timeseries), dtype=np.float64).T
-    sum_var_emp_corr = np.float64(0.0)
-    sum_sq_emp_corr = np.float64(0.0)
+    return _shrunk_covariance_schaferstrimmer_tiles(
+        residuals.shape[0], products, mint_shr_ridge, max_tile_bytes
+    )
+
+# %% ../nbs/src/utils.ipynb 87
+# Versions of the residual statistics, unique across instances
+_residual_statistics_versions = itertools.count()
+
+
+class ResidualStatistics:
+    """Streaming Residual Statistics
+
+    Online accumulator of the insample residual statistics behind the `MinTrace` weights
+    `wls_var`, `mint_cov` and `mint_shrink`, to be passed to `MinTrace.fit` in place of the
+    insample arrays. Each `update` ingests a new batch of residuals, so memory does not
+    depend on the length of the history and the history is never read again.
+
+    Like Welford's algorithm, the residuals of each series are shifted by the mean of
+    their first batch, and the sums of the shifted residuals, their powers and their
+    pairwise products are accumulated. The pairwise counts of samples are only kept
+    after a batch contains nans, which makes every pair use the samples where both of
+    its series are not nan, as with the insample arrays.
+
+    **Parameters:**<br>
+    `method`: str='mint_shrink', the `MinTrace` method to keep statistics for, one of `wls_var`, `mint_cov`, `mint_shrink`.
+        The statistics also serve the methods listed before it.<br>
+    `max_tile_bytes`: int=2**27, cap on the size of the temporary arrays of the pairwise products.<br>
+
+    The `version` attribute changes with every `update`, so that the matrices computed from the
+    statistics can be cached until their next update.
+    """
+
+    methods = ["wls_var", "mint_cov", "mint_shrink"]
+
+    def __init__(self, method: str = "mint_shrink", max_tile_bytes: int = 2**27):
+        if method not in self.methods:
+            raise ValueError(
+                f"Unknown method `{method}`. Choose from `wls_var`, `mint_cov`, `mint_shrink`."
+            )
+        self.method = method
+        self.max_tile_bytes = max_tile_bytes
+        self.n_samples = 0
+        self.has_nans = False
+        self.version = None
+
+    def _initialize(self, residuals: np.ndarray):
+        n_timeseries = residuals.shape[0]
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", category=RuntimeWarning)
+            self.shift = np.nan_to_num(np.nanmean(residuals, axis=1))
+        self.residuals_sum = np.zeros(n_timeseries, dtype=np.float64)
+        self.squares_sum = np.zeros(n_timeseries, dtype=np.float64)
+        # Sums of each series over its own not nan samples
+        self.series_counts = np.zeros(n_timeseries, dtype=np.float64)
+        self.series_sums = np.zeros(n_timeseries, dtype=np.float64)
+        self.series_squares = np.zeros(n_timeseries, dtype=np.float64)
+        if self.method == "wls_var":
+            return
+        # Without nans, the pairwise counts and sums reduce to the ones of each series
+        self.counts = 0
+        self.sums = np.zeros(n_timeseries, dtype=np.float64)
+        self.cross = np.zeros((n_timeseries, n_timeseries), dtype=np.float64)
+        if self.method == "mint_shrink":
+            self.squares = np.zeros(n_timeseries, dtype=np.float64)
+            self.cubes = np.zeros((n_timeseries, n_timeseries), dtype=np.float64)
+            self.fourth = np.zeros((n_timeseries, n_timeseries), dtype=np.float64)
+
+    def _expand(self):
+        # The samples so far are not nan, so the sums over the samples where
+        # both series of a pair are not nan are the sums of each series.
+        n_timeseries = self.shift.size
+        self.counts = np.full(
+            (n_timeseries, n_timeseries), self.counts, dtype=np.float64
+        )
+        self.sums = np.repeat(self.sums[:, None], n_timeseries, axis=1)
+        if self.method == "mint_shrink":
+            self.squares = np.repeat(self.squares[:, None], n_timeseries, axis=1)
+        self.has_nans = True
+
+    def update(self, y_insample: np.ndarray, y_hat_insample: np.ndarray):
+        """Residual Statistics Update
+
+        **Parameters:**<br>
+        `y_insample`: Insample values of size (`base`, `batch_size`).<br>
+        `y_hat_insample`: Insample forecast values of size (`base`, `batch_size`).<br>
+
+        **Returns:**<br>
+        `self`: object, updated statistics.
+        """
+        residuals = np.asarray(y_insample, dtype=np.float64) - np.asarray(
+            y_hat_insample, dtype=np.float64
+        )
+        if self.n_samples == 0:
+            self._initialize(residuals)
+        elif residuals.shape[0] != self.shift.size:
+            raise ValueError(
+                f"Expected residuals of {self.shift.size} series, got {residuals.shape[0]}."
+            )
+        n_timeseries, batch_size = residuals.shape
+        self.version = next(_residual_statistics_versions)
+        self.n_samples += batch_size
+        self.residuals_sum += np.sum(residuals, axis=1)
+        self.squares_sum += np.nansum(residuals**2, axis=1)
+        not_nan_mask = ~np.isnan(residuals)
+        X = np.where(not_nan_mask, residuals - self.shift[:, None], 0.0)
+        X2 = np.square(X)
+        self.series_counts += np.sum(not_nan_mask, axis=1)
+        self.series_sums += np.sum(X, axis=1)
+        self.series_squares += np.sum(X2, axis=1)
+        if self.method == "wls_var":
+            return self
+
+        if not self.has_nans and not np.all(not_nan_mask):
+            self._expand()
+        M = not_nan_mask.astype(np.float64)
+        shrink = self.method == "mint_shrink"
+        if not self.has_nans:
+            self.counts += batch_size
+            self.sums += np.sum(X, axis=1)
+            if shrink:
+                self.squares += np.sum(X2, axis=1)
+        # Blocks of rows of the pairwise products within the size cap
+        block = max(1, self.max_tile_bytes // (8 * n_timeseries))
+        for i0 in range(0, n_timeseries, block):
+            rows = slice(i0, min(i0 + block, n_timeseries))
+            self.cross[rows] += X[rows] @ X.T
+            if self.has_nans:
+                self.counts[rows] += M[rows] @ M.T
+                self.sums[rows] += X[rows] @ M.T
+            if shrink:
+                self.cubes[rows] += X2[rows] @ X.T
+                self.fourth[rows] += X2[rows] @ X2.T
+                if self.has_nans:
+                    self.squares[rows] += X2[rows] @ M.T
+        return self
+
+    def _check_method(self, method: str):
+        if self.methods.index(method) > self.methods.index(self.method):
+            raise ValueError(
+                f"Residual statistics for `{self.method}` cannot be used with method `{method}`."
+            )
+        if self.n_samples == 0:
+            raise ValueError("Residual statistics are empty, call `update` first.")
+
+    def _pair_sums(self, rows: slice, cols: slice, squares: bool = False) -> tuple:
+        # Sums over the samples where both series of the (rows, cols) pairs are not nan
+        if self.has_nans:
+            sums = (
+                self.counts[rows, cols],
+                self.sums[rows, cols],
+                self.sums[cols, rows].T,
+            )
+            if squares:
+                sums += (self.squares[rows, cols], self.squares[cols, rows].T)
+        else:
+            shape = (rows.stop - rows.start, cols.stop - cols.start)
+            sums = (
+                np.full(shape, self.counts, dtype=np.float64),
+                self.sums[rows, None],
+                self.sums[None, cols],
+            )
+            if squares:
+                sums += (self.squares[rows, None], self.squares[None, cols])
+        return sums
+
+    def variance(self, ddof: int = 1) -> np.ndarray:
+        """Residual Variance
+
+        **Parameters:**<br>
+        `ddof`: int=1, delta degrees of freedom of the variance of each series over its not nan samples.<br>
+
+        **Returns:**<br>
+        `var`: np.ndarray, variance of the residuals of each series, as `np.nanvar`.
+        """
+        self._check_method("wls_var")
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return (
+                self.series_squares - self.series_sums**2 / self.series_counts
+            ) / (self.series_counts - ddof)
+
+    def covariance(self) -> np.ndarray:
+        """Empirical Covariance
+
+        **Returns:**<br>
+        `W`: np.ndarray, empirical covariance matrix of the residuals, as `MinTrace(method='mint_cov')`.
+        """
+        self._check_method("mint_cov")
+
+        def products(rows, cols):
+            return (*self._pair_sums(rows, cols), self.cross[rows, cols])
+
+        return _masked_covariance_tiles(self.shift.size, products, self.max_tile_bytes)
+
+    def shrunk_covariance(self, mint_shr_ridge: float = 2e-8) -> np.ndarray:
+        """Schafer-Strimmer Shrunk Covariance
+
+        **Parameters:**<br>
+        `mint_shr_ridge`: float=2e-8, ridge numeric protection of the diagonal.<br>
+
+        **Returns:**<br>
+        `W`: np.ndarray, shrunk covariance matrix of the residuals, as `MinTrace(method='mint_shrink')`.
+        """
+        self._check_method("mint_shrink")
+
+        def products(rows, cols):
+            return (
+                *self._pair_sums(rows, cols, squares=True),
+                self.cross[rows, cols],
+                self.cubes[rows, cols],
+                self.cubes[cols, rows].T,
+                self.fourth[rows, cols],
+            )
+
+        return _shrunk_covariance_schaferstrimmer_tiles(
+            self.shift.size,
+            products,
+            mint_shr_ridge,
+            self.max_tile_bytes,
+            nans=self.has_nans,
+        )
+
+# %% ../nbs/src/utils.ipynb 92
+# Factored covariance matrices for few observations relative to the number of series
+
+
+class _FactoredCovariance:
+    """Covariance matrix of the form diag(`d`) + `U` `U`', with `U` of size (n, k).
+
+    Stores O(nk) values instead of the O(n^2) of the full matrix, and solves
+    linear systems with the Woodbury identity.
+
+    :meta private:
+    """
+
+    def __init__(self, d: np.ndarray, U: np.ndarray):
+        self.d = d
+        self.U = U
+        self.shape = (d.size, d.size)
+
+    def diagonal(self) -> np.ndarray:
+        return self.d + np.einsum("ij,ij->i", self.U, self.U)
+
+    def toarray(self) -> np.ndarray:
+        W = self.U @ self.U.T
+        W[np.diag_indices_from(W)] += self.d
+        return W
+
+    def __matmul__(self, other: np.ndarray) -> np.ndarray:
+        return self.d.reshape(-1, *[1] * (other.ndim - 1)) * other + self.U @ (
+            self.U.T @ other
+        )
+
+    def solve(self, B: np.ndarray) -> np.ndarray:
+        """Solve W X = B with the Woodbury identity if `d` is positive, else with the pseudoinverse."""
+        if np.any(self.d <= 0.0):
+            return np.linalg.pinv(self.toarray(), hermitian=True) @ B
+        d = self.d.reshape(-1, *[1] * (B.ndim - 1))
+        Dinv_U = self.U / self.d[:, None]
+        K = self.U.T @ Dinv_U
+        K[np.diag_indices_from(K)] += 1.0
+        return B / d - Dinv_U @ np.linalg.solve(K, Dinv_U.T @ B)
+
+
+def _shrunk_covariance_schaferstrimmer_factored(
+    residuals: np.ndarray, mint_shr_ridge: float
+) -> _FactoredCovariance:
+    """Schafer-Strimmer shrunk covariance matrix of `residuals` (n_timeseries, n_samples) without nans, in factored form.
+
+    Equal to `_shrunk_covariance_schaferstrimmer_no_nans`, as the shrunk covariance is the
+    diagonal plus the scaled low rank empirical covariance.
+
+    :meta private:
+    """
+    n_samples = residuals.shape[1]
+    X, shrinkage = _schaferstrimmer_shrinkage(residuals)
+    # Shrunk covariance diag(max(var, ridge) - shrinkage * var) + shrinkage * X X' / (n_samples - 1)
+    var = np.sum(np.square(X), axis=1) / (n_samples - 1)
+    d = np.maximum(var, mint_shr_ridge) - shrinkage * var
+    return _FactoredCovariance(d, np.sqrt(shrinkage / (n_samples - 1)) * X)
+
+# %% ../nbs/src/utils.ipynb 94
+# Shrunk covariance restricted to the pairs of series that are related in a strictly hierarchical structure
+
+
+def _hierarchical_covariance_pattern(A: sparse.csr_matrix) -> sparse.csr_matrix:
+    """Construct the sparsity pattern of a hierarchical covariance matrix.
+
+    Two series are related if they share a parent, i.e., they are siblings, or
+    if one of them is in the subtree of the other, i.e., it is a descendant.
+
+    Parameters
+    ----------
+    A : sparse.csr_matrix
+        A disaggregation adjacency matrix for a strictly hierarchical structure.
+
+    Returns
+    -------
+    sparse.csr_matrix
+        The boolean upper triangular pattern of the covariance matrix,
+        including its diagonal.
+
+    """
+    n_a, n = A.shape
+    # Pad the adjacency matrix with the rows of the leaf nodes to make it square.
+    A = sparse.vstack((A, sparse.csr_matrix((n - n_a, n), dtype=bool)), "csr").astype(
+        np.int64
+    )
+    # Accumulate the descendants of every node, one level at a time.
+    D = A.copy()
+    A_k = A
+    while (A_k := A_k @ A).nnz > 0:
+        D = D + A_k
+    pattern = sparse.eye(n, dtype=np.int64, format="csr") + D + D.T + A.T @ A
+    return sparse.triu(pattern, format="csr").astype(bool)
+
+
+@njit(
+    "Array(float64, 1, 'C')(Array(float64, 2, 'C'), Array(bool_, 2, 'C'), Array(int64, 1, 'C'), Array(int64, 1, 'C'), float64)",
+    nogil=NUMBA_NOGIL,
+    cache=NUMBA_CACHE,
+    parallel=NUMBA_PARALLEL,
+    fastmath=NUMBA_FASTMATH,
+    error_model="numpy",
+)
+def _shrunk_covariance_schaferstrimmer_pairs(
+    residuals: np.ndarray,
+    not_nan_mask: np.ndarray,
+    rows: np.ndarray,
+    cols: np.ndarray,
+    mint_shr_ridge: float,
+):
+    """Shrink empirical covariance according to the Schäfer-Strimmer method,
+    only for the pairs of time series in `rows` and `cols`.
+
+    The shrinkage intensity is calculated from the off-diagonal pairs, so that
+    the entries outside of the pairs are shrunk to zero.
+
+    :meta private:
+    """
+    n_pairs = rows.size
+
+    # We need the empirical covariance, the off-diagonal variance of the
+    # empirical correlation and the off-diagonal squared empirical correlation
+    # of every pair.
+    W = np.zeros(n_pairs, dtype=np.float64)
+    var_emp_corr = np.zeros(n_pairs, dtype=np.float64)
+    sq_emp_corr = np.zeros(n_pairs, dtype=np.float64)
     epsilon = np.float64(2e-8)
-    for i in prange(n_timeseries):
-        not_nan_mask_i = not_nan_mask[i]
-        for j in range(i + 1):
-            not_nan_mask_j = not_nan_mask[j]
-            not_nan_mask_ij = not_nan_mask_i & not_nan_mask_j
-            n_samples = np.sum(not_nan_mask_ij)
-            # Only compute if we have enough non-nan samples in the time series pair
-            if n_samples > 1:
-                # Masked residuals
-                residuals_i = residuals[i][not_nan_mask_ij]
-                residuals_j = residuals[j][not_nan_mask_ij]
-                residuals_i_mean = np.mean(residuals_i)
-                residuals_j_mean = np.mean(residuals_j)
-                X_i = residuals_i - residuals_i_mean
-                X_j = residuals_j - residuals_j_mean
-                # Empirical covariance
-                factor_emp_cov = np.float64(1 / (n_samples - 1))
-                W[i, j] = factor_emp_cov * np.sum(X_i * X_j)
-                # Off-diagonal sums
-                if i != j:
-                    factor_var_emp_cor = np.float64(n_samples / (n_samples - 1) ** 3)
-                    residuals_i_std = np.std(residuals_i) + epsilon
-                    residuals_j_std = np.std(residuals_j) + epsilon
-                    Xs_i = X_i / (residuals_i_std + epsilon)
-                    Xs_j = X_j / (residuals_j_std + epsilon)
-                    Xs_im_mean = np.mean(Xs_i)
-                    Xs_jm_mean = np.mean(Xs_j)
-                    # Sum off-diagonal variance of empirical correlation
-                    w = (Xs_i - Xs_im_mean) * (Xs_j - Xs_jm_mean)
-                    w_mean = np.mean(w)
-                    sum_var_emp_corr += factor_var_emp_cor * np.sum(
-                        np.square(w - w_mean)
-                    )
-                    # Sum squared empirical correlation
-                    sum_sq_emp_corr += np.square(factor_emp_cov * n_samples * w_mean)
+    for k in prange(n_pairs):
+        i = rows[k]
+        j = cols[k]
+        not_nan_mask_ij = not_nan_mask[i] & not_nan_mask[j]
+        n_samples = np.sum(not_nan_mask_ij)
+        # Only compute if we have enough non-nan samples in the time series pair
+        if n_samples > 1:
+            # Masked residuals
+            residuals_i = residuals[i][not_nan_mask_ij]
+            residuals_j = residuals[j][not_nan_mask_ij]
+            X_i = residuals_i - np.mean(residuals_i)
+            X_j = residuals_j - np.mean(residuals_j)
+            # Empirical covariance
+            factor_emp_cov = np.float64(1 / (n_samples - 1))
+            W[k] = factor_emp_cov * np.sum(X_i * X_j)
+            # Off-diagonal terms
+            if i != j:
+                factor_var_emp_cor = np.float64(n_samples / (n_samples - 1) ** 3)
+                Xs_i = X_i / (np.std(residuals_i) + 2 * epsilon)
+                Xs_j = X_j / (np.std(residuals_j) + 2 * epsilon)
+                # Variance of empirical correlation
+                w = (Xs_i - np.mean(Xs_i)) * (Xs_j - np.mean(Xs_j))
+                w_mean = np.mean(w)
+                var_emp_corr[k] = factor_var_emp_cor * np.sum(np.square(w - w_mean))
+                # Squared empirical correlation
+                sq_emp_corr[k] = np.square(factor_emp_cov * n_samples * w_mean)
 
     # Calculate shrinkage intensity
     shrinkage = 1.0 - max(
-        min((sum_var_emp_corr) / (sum_sq_emp_corr + epsilon), 1.0), 0.0
+        min(np.sum(var_emp_corr) / (np.sum(sq_emp_corr) + epsilon), 1.0), 0.0
     )
 
     # Shrink the empirical covariance
-    for i in prange(n_timeseries):
-        for j in range(i + 1):
-            if i != j:
-                W[i, j] = W[j, i] = shrinkage * W[i, j]
-            else:
-                W[i, j] = W[j, i] = max(W[i, j], mint_shr_ridge)
+    for k in prange(n_pairs):
+        if rows[k] != cols[k]:
+            W[k] = shrinkage * W[k]
+        else:
+            W[k] = max(W[k], mint_shr_ridge)
 
     return W
 
-# %% ../nbs/src/utils.ipynb 74
+
+def _shrunk_covariance_schaferstrimmer_sparse(
+    residuals: np.ndarray, pattern: sparse.csr_matrix, mint_shr_ridge: float
+) -> sparse.csr_matrix:
+    """Shrink the empirical covariance of the pairs in an upper triangular
+    pattern, returning a symmetric sparse covariance matrix.
+
+    Parameters
+    ----------
+    residuals : np.ndarray
+        The residuals of size (`base`, `obs`), which may contain nans.
+    pattern : sparse.csr_matrix
+        The upper triangular pattern of the pairs to estimate.
+    mint_shr_ridge : float
+        The minimum variance on the diagonal.
+
+    Returns
+    -------
+    sparse.csr_matrix
+        The shrunk covariance matrix of size (`base`, `base`).
+
+    """
+    n = residuals.shape[0]
+    pattern = sparse.coo_matrix(pattern)
+    rows = pattern.row.astype(np.int64)
+    cols = pattern.col.astype(np.int64)
+    not_nan_mask = ~np.isnan(residuals)
+    data = _shrunk_covariance_schaferstrimmer_pairs(
+        np.ascontiguousarray(residuals, dtype=np.float64),
+        np.ascontiguousarray(not_nan_mask),
+        rows,
+        cols,
+        mint_shr_ridge,
+    )
+    off_diag = rows != cols
+    return sparse.csr_matrix(
+        (
+            np.concatenate((data, data[off_diag])),
+            (
+                np.concatenate((rows, cols[off_diag])),
+                np.concatenate((cols, rows[off_diag])),
+            ),
+        ),
+        shape=(n, n),
+    )
+
+# %% ../nbs/src/utils.ipynb 96
 # Lasso cyclic coordinate descent
 @njit(
     "Array(float64, 1, 'C')(Array(float64, 2, 'C'), Array(float64, 1, 'C'), float64, int64, float64)",
@@ -1242,3 +2169,200 @@ def _lasso(
             break
 
     return beta
+
+# %% ../nbs/src/utils.ipynb 97
+# Lasso cyclic coordinate descent for a Kronecker product design matrix
+@njit(
+    "int64(int32[:], int32[:], float64[:], Array(float64, 2, 'C'), Array(float64, 2, 'C'), Array(float64, 2, 'C'), Array(float64, 2, 'C'), int64[:], int64[:], float64, int64, float64)",
+    nogil=NUMBA_NOGIL,
+    cache=NUMBA_CACHE,
+    fastmath=NUMBA_FASTMATH,
+    error_model="numpy",
+)
+def _kron_lasso_cd(
+    indptr: np.ndarray,
+    indices: np.ndarray,
+    data: np.ndarray,
+    A: np.ndarray,
+    residuals: np.ndarray,
+    beta: np.ndarray,
+    norms: np.ndarray,
+    features_k: np.ndarray,
+    features_m: np.ndarray,
+    lambda_reg: float,
+    max_iters: int = 1_000,
+    tol: float = 1e-4,
+):
+    # The column of X = kron(S, A') for the feature (k, m) is the outer
+    # product of the k-th column of S and the m-th row of A, so the
+    # correlations and residual updates only touch the rows of the residuals
+    # where the k-th column of S is non-zero.
+    n_rows = residuals.shape[0] * residuals.shape[1]
+    h = A.shape[1]
+    for it in range(max_iters):
+        max_change = 0.0
+        for f in range(features_k.size):
+            k = features_k[f]
+            m = features_m[f]
+            norms_i = norms[k, m]
+            # is feature is close to zero, we
+            # continue to the next.
+            # in this case is optimal betai= 0
+            if abs(norms_i) < 1e-8:
+                continue
+            beta_i = beta[k, m]
+
+            # we calculate the normalized derivative
+            rho = 0.0
+            for p in range(indptr[k], indptr[k + 1]):
+                i = indices[p]
+                for t in range(h):
+                    rho += data[p] * A[m, t] * residuals[i, t]
+            rho = beta_i + rho / norms_i
+
+            # soft threshold
+            beta_i_next = np.sign(rho) * max(
+                np.abs(rho) - lambda_reg * n_rows / norms_i, 0.0
+            )
+            beta_delta = beta_i - beta_i_next
+            max_change = max(max_change, np.abs(beta_delta))
+            if beta_delta != 0.0:
+                for p in range(indptr[k], indptr[k + 1]):
+                    i = indices[p]
+                    for t in range(h):
+                        residuals[i, t] += beta_delta * data[p] * A[m, t]
+
+                beta[k, m] = beta_i_next
+
+        if max_change < tol:
+            break
+
+    return it
+
+
+def _kron_lasso(
+    S: Union[np.ndarray, sparse.spmatrix],
+    A: np.ndarray,
+    Y: np.ndarray,
+    lambda_reg: float,
+    max_iters: int = 1_000,
+    tol: float = 1e-4,
+    path_ratio: float = 0.8,
+) -> np.ndarray:
+    """Solve the lasso problem for the design matrix `X = np.kron(S, A.T)` and
+    the targets `Y.reshape(-1)` without forming `X`.
+
+    The problem is solved along a geometric path of regularization strengths,
+    warm starting each one from the previous solution and only updating the
+    features that pass the sequential strong rule, until the optimality
+    conditions hold for all of them.
+
+    Parameters
+    ----------
+    S : Union[np.ndarray, sparse.spmatrix]
+        The summing matrix of size (`base`, `bottom`).
+    A : np.ndarray
+        The features of size (`base`, `obs`).
+    Y : np.ndarray
+        The targets of size (`base`, `obs`).
+    lambda_reg : float
+        The l1 regularization strength.
+    max_iters : int (default=1_000)
+        The maximum number of coordinate descent sweeps.
+    tol : float (default=1e-4)
+        The tolerance of the largest coefficient change in a sweep.
+    path_ratio : float (default=0.8)
+        The ratio between successive regularization strengths in the path,
+        the strong rule only discards features when it is above 0.5.
+
+    Returns
+    -------
+    np.ndarray
+        The coefficients, i.e., `beta`, of size (`bottom` * `base`).
+
+    """
+    S = sparse.csc_matrix(S, dtype=np.float64)
+    S.sort_indices()
+    A = np.ascontiguousarray(A, dtype=np.float64)
+    residuals = np.array(Y, dtype=np.float64, order="C")
+    n_rows = residuals.size
+    norms = np.outer(np.asarray(S.power(2).sum(axis=0)).ravel(), np.sum(A**2, axis=1))
+    beta = np.zeros((S.shape[1], A.shape[0]), dtype=np.float64)
+
+    def correlations():
+        # X'r reshaped to the shape of the coefficients.
+        return np.abs((S.T @ residuals) @ A.T) / n_rows
+
+    corr = correlations()
+    lambda_max = np.max(corr)
+    if lambda_reg >= lambda_max:
+        return beta.reshape(-1)
+    if lambda_reg > 0:
+        n_lambdas = int(np.ceil(np.log(lambda_reg / lambda_max) / np.log(path_ratio)))
+        lambdas = np.geomspace(lambda_max, lambda_reg, n_lambdas + 1)[1:]
+    else:
+        lambdas = np.array([lambda_reg])
+    lambda_prev = lambda_max
+    for lambda_ in lambdas:
+        strong = (corr >= 2 * lambda_ - lambda_prev) | (beta != 0.0)
+        while True:
+            features_k, features_m = np.nonzero(strong)
+            _kron_lasso_cd(
+                S.indptr.astype(np.int32),
+                S.indices.astype(np.int32),
+                S.data,
+                A,
+                residuals,
+                beta,
+                norms,
+                features_k.astype(np.int64),
+                features_m.astype(np.int64),
+                lambda_,
+                max_iters,
+                tol,
+            )
+            corr = correlations()
+            # Add the features that were wrongly discarded by the strong rule.
+            violations = ~strong & (corr > lambda_) & (norms >= 1e-8)
+            if not np.any(violations):
+                break
+            strong |= violations
+        lambda_prev = lambda_
+    return beta.reshape(-1)
+
+# %% ../nbs/src/utils.ipynb 98
+# Product of a CSR matrix and a dense matrix written to a preallocated output,
+# the read-only inputs also take the arrays memory-mapped by `_load_npz`
+@njit(
+    [
+        "void(Array(int32, 1, 'C', readonly=True), Array(int32, 1, 'C', readonly=True), Array(float64, 1, 'C', readonly=True), Array(float64, 2, 'C', readonly=True), Array(float64, 2, 'C'))",
+        "void(Array(int64, 1, 'C', readonly=True), Array(int64, 1, 'C', readonly=True), Array(float64, 1, 'C', readonly=True), Array(float64, 2, 'C', readonly=True), Array(float64, 2, 'C'))",
+    ],
+    nogil=NUMBA_NOGIL,
+    cache=NUMBA_CACHE,
+    parallel=NUMBA_PARALLEL,
+)
+def _csr_matmul(
+    indptr: np.ndarray,
+    indices: np.ndarray,
+    data: np.ndarray,
+    x: np.ndarray,
+    out: np.ndarray,
+):
+    # The nonzeros of each row are added in the order of the CSR format, as
+    # the product of scipy, so that both give the same floating point results.
+    h = out.shape[1]
+    for i in prange(out.shape[0]):
+        if h == 1:
+            total = 0.0
+            for k in range(indptr[i], indptr[i + 1]):
+                total += data[k] * x[indices[k], 0]
+            out[i, 0] = total
+            continue
+        for j in range(h):
+            out[i, j] = 0.0
+        for k in range(indptr[i], indptr[i + 1]):
+            value = data[k]
+            row = indices[k]
+            for j in range(h):
+                out[i, j] += value * x[row, j]